@@ -5,15 +5,22 @@ A complete text-based adventure game with 30 creatures, evolution, and turn-base
 Now with save/load functionality!
 """
 
+import argparse
+import asyncio
 import random
-import time
+from typing import Optional, List
 from creatures import Creature
 from player import Player
+from events import Moved, ItemsSet
 from world import GameWorld
+from display import echo, prompt, pause, set_backend, HeadlessBackend
 from battle import battle
-from visuals import clear_screen, print_slow, colored_text
-from data.creature_data import CREATURE_SPECIES
-from save_system import save_game, load_game, auto_save, get_auto_save_name
+from scheduler import FrameScheduler, InputEvents
+from visuals import clear_screen, print_slow, colored_text, ScreenBuffer
+from data.pack import CREATURE_SPECIES
+from data.creature_art import get_ascii_art
+from save_system import (save_game, load_game, auto_save, flush_saves, get_auto_save_name,
+                         record_action, make_storage, set_storage)
 from menu import (show_main_menu, show_load_menu, show_pause_menu,
                   show_save_confirmation, show_game_over_screen, confirm_new_game)
 
@@ -28,223 +35,354 @@ def create_creature(species_name: str, level: int = 5) -> Creature:
 def start_new_game():
     """Create a new game with starter selection"""
     clear_screen()
-    print("="*50)
-    print("  WELCOME TO ASCII CREATURES ADVENTURE!")
-    print("="*50)
-    print()
-
-    player_name = input("What's your name, trainer? ")
+    screen = ScreenBuffer()
+    screen.add("="*50)
+    screen.add("  WELCOME TO ASCII CREATURES ADVENTURE!")
+    screen.add("="*50)
+    screen.add()
+    screen.flush()
+
+    player_name = prompt("What's your name, trainer? ")
     if not player_name.strip():
         player_name = "Trainer"
 
     player = Player(player_name)
 
-    print()
+    echo()
     print_slow(f"Hello {player_name}! Welcome to the world of ASCII creatures!")
     print_slow("Choose your starter creature:")
-    print()
+    echo()
 
     # Let player choose starter
     starters = ["Flameo", "Aquabit", "Leaflet"]
+    screen = ScreenBuffer()
     for i, starter in enumerate(starters, 1):
         creature_data = CREATURE_SPECIES[starter]
-        print(f"{i}. {colored_text(starter, creature_data['type'])} ({creature_data['type']} type)")
-        print(colored_text(creature_data['ascii_art'], creature_data['type']))
-        print()
+        screen.add(f"{i}. {colored_text(starter, creature_data['type'])} ({creature_data['type']} type)")
+        screen.add(colored_text(get_ascii_art(starter), creature_data['type']))
+        screen.add()
+    screen.flush()
 
     while True:
-        choice = input("Choose 1, 2, or 3: ")
+        choice = prompt("Choose 1, 2, or 3: ")
         if choice in ['1', '2', '3']:
             starter_name = starters[int(choice) - 1]
             starter_creature = create_creature(starter_name, level=5)
             player.add_creature(starter_creature)
             break
-        print("Invalid choice. Try again.")
+        echo("Invalid choice. Try again.")
 
-    print()
+    echo()
     print_slow(f"Great choice! {colored_text(starter_creature.species_name, starter_creature.get_type())} is ready to battle!")
-    input("\nPress Enter to begin your adventure...")
+    prompt("\nPress Enter to begin your adventure...")
 
     # Initialize the game world
     world = GameWorld()
-    player.x = 2
-    player.y = 2
+    player.apply(Moved(*START_POSITION))
 
     # Auto-save initial game
     auto_save(player, world)
-    print(f"\n{colored_text('Game auto-saved!', 'Green')}")
-    time.sleep(1)
+    echo(f"\n{colored_text('Game auto-saved!', 'Green')}")
+    pause(1)
 
     return player, world
 
 
+# Movement keys and the step each one takes
+DIRECTIONS = {'w': (0, -1), 's': (0, 1), 'a': (-1, 0), 'd': (1, 0)}
+
+# Moves between automatic saves
+AUTO_SAVE_MOVES = 20
+
+# Tiles that trigger an event when stepped on (grass may start a battle)
+EVENT_TILES = ('"', 'H', 'B')
+
+# Where the player starts (and is sent back to after losing)
+START_POSITION = (2, 2)
+
+# Items handed out at the healing house
+STARTING_ITEMS = {'pokeballs': 5, 'potions': 3}
+
+
+def status_lines(player: Player) -> List[str]:
+    """Player status shown below the map, drawn as part of the same frame"""
+    status = []
+    party_title = f"{player.name}'s Party:"
+    status.append(f"\n{colored_text(party_title, 'Normal')}")
+    for creature in player.party:
+        if creature.is_alive():
+            type_color = creature.get_type()
+            status.append(f"  • {colored_text(creature.species_name, type_color)} Lv.{creature.level} (HP: {creature.hp}/{creature.max_hp})")
+
+    status.append(f"\nItems: {player.pokeballs} Pokeballs, {player.potions} Potions")
+    status.append("\nMove: W(up) A(left) S(down) D(right)  |  P(pause) Q(quit)")
+    return status
+
+
+def handle_pause_menu(player: Player, world: GameWorld) -> Optional[str]:
+    """
+    Show the pause menu and act on the choice
+    Returns: 'menu' to return to menu, 'saved' after saving, None to resume
+    """
+    menu_choice = show_pause_menu(player, world)
+
+    if menu_choice == 'save':
+        success = auto_save(player, world) and flush_saves()
+        show_save_confirmation(player.name, success)
+        return 'saved'
+    elif menu_choice == 'save_quit':
+        success = auto_save(player, world) and flush_saves()
+        show_save_confirmation(player.name, success)
+        return 'menu'
+    elif menu_choice == 'quit':
+        return 'menu'
+    return None
+
+
+def confirm_quit(player: Player, world: GameWorld) -> str:
+    """Quick quit (prompts to save). Returns 'menu'"""
+    echo(f"\n{colored_text('Save before quitting?', 'Yellow')} (y/n): ", end='')
+    if prompt().lower() == 'y':
+        auto_save(player, world)
+        if flush_saves():
+            echo(colored_text('Game saved!', 'Green'))
+        pause(1)
+    return 'menu'
+
+
+def enter_tile(player: Player, world: GameWorld) -> Optional[str]:
+    """
+    Handle the tile the player just stepped onto
+    Returns: 'complete' if the game is won, 'saved' if it auto-saved, else None
+    """
+    tile = world.get_tile(player.x, player.y)
+
+    if tile == '"':  # Grass - chance of encounter
+        if world.check_encounter(player.x, player.y):
+            # Spawn a wild creature based on zone
+            wild_species, wild_level = world.get_wild_creature(player.x, player.y)
+            wild_creature = create_creature(wild_species, wild_level)
+
+            # Start battle
+            battle_result = battle(player, wild_creature)
+
+            # Auto-save after battles
+            auto_save(player, world)
+
+            if not battle_result and not player.has_creatures():
+                # Player lost - teleport to healing house
+                player.apply(Moved(*START_POSITION))
+                player.heal_all()
+                player.apply(ItemsSet(**STARTING_ITEMS))
+                auto_save(player, world)
+            return 'saved'
+
+    elif tile == 'H':  # Healing house
+        clear_screen()
+        print_slow("\nYou entered the healing house!")
+        print_slow("Your creatures have been healed!")
+        player.heal_all()
+        player.apply(ItemsSet(**STARTING_ITEMS))
+        auto_save(player, world)
+        echo(colored_text('\nGame auto-saved!', 'Green'))
+        prompt("\nPress Enter to continue...")
+        return 'saved'
+
+    elif tile == 'B':  # Boss area
+        clear_screen()
+        print_slow("\n!!! BOSS AREA !!!")
+        print_slow("You sense a powerful presence...")
+        prompt("\nPress Enter to continue...")
+
+        # Create a powerful boss creature (Level 35 Pyrodragon)
+        boss = create_creature("Pyrodragon", level=35)
+        boss.species_name = "MEGA DRAGON"
+
+        clear_screen()
+        echo("="*50)
+        echo("           FINAL BOSS BATTLE!")
+        echo("="*50)
+        echo(colored_text(boss.get_ascii_art(), "Fire"))
+        echo(f"\n{colored_text('MEGA DRAGON', 'Fire')} blocks your path!")
+        prompt("\nPress Enter to battle...")
+
+        boss_result = battle(player, boss)
+
+        if boss_result:
+            # Victory! The boss area becomes a path
+            world.set_flag('boss_defeated')
+            world.set_tile(player.x, player.y, '.')
+            auto_save(player, world)
+            show_game_over_screen(player)
+            return 'complete'
+        else:
+            # Lost to boss, teleport back
+            player.apply(Moved(*START_POSITION))
+            player.heal_all()
+            auto_save(player, world)
+            clear_screen()
+            print_slow("\nYou weren't ready for the boss yet...")
+            print_slow("Train more and try again!")
+            prompt("\nPress Enter to continue...")
+            return 'saved'
+
+    return None
+
+
+def step_player(player: Player, world: GameWorld, action: str) -> bool:
+    """Move the player one step for a movement key. Returns False if blocked"""
+    dx, dy = DIRECTIONS[action]
+    new_x, new_y = player.x + dx, player.y + dy
+    if not world.is_walkable(new_x, new_y):
+        return False
+    player.apply(Moved(new_x, new_y))
+    return True
+
+
 def run_game_loop(player: Player, world: GameWorld) -> str:
     """
     Main game loop
     Returns: 'menu' to return to menu, 'complete' if game is won
     """
-    game_running = True
     moves_since_save = 0
 
-    while game_running:
-        clear_screen()
-        world.render(player.x, player.y, use_color=True)
-
-        # Show player status
-        party_title = f"{player.name}'s Party:"
-        print(f"\n{colored_text(party_title, 'Normal')}")
-        for creature in player.party:
-            if creature.is_alive():
-                type_color = creature.get_type()
-                print(f"  • {colored_text(creature.species_name, type_color)} Lv.{creature.level} (HP: {creature.hp}/{creature.max_hp})")
+    while True:
+        # Journal the last action's changes in case the game dies before the next save
+        record_action(player, world)
 
-        print(f"\nItems: {player.pokeballs} Pokeballs, {player.potions} Potions")
+        world.render(player.x, player.y, use_color=True, footer=status_lines(player))
 
         # Get input
-        print("\nMove: W(up) A(left) S(down) D(right)  |  P(pause) Q(quit)")
-        action = input("Action: ").lower()
+        action = prompt("Action: ").lower()
 
         # Handle pause menu
         if action == 'p':
-            menu_choice = show_pause_menu(player, world)
-
-            if menu_choice == 'resume':
-                continue
-            elif menu_choice == 'save':
-                success = auto_save(player, world)
-                show_save_confirmation(player.name, success)
-                moves_since_save = 0
-                continue
-            elif menu_choice == 'save_quit':
-                success = auto_save(player, world)
-                show_save_confirmation(player.name, success)
-                return 'menu'
-            elif menu_choice == 'quit':
+            result = handle_pause_menu(player, world)
+            if result == 'menu':
                 return 'menu'
+            if result == 'saved':
+                moves_since_save = 0
+            continue
 
         if action == 'q':
-            # Quick quit (prompts to save)
-            print(f"\n{colored_text('Save before quitting?', 'Yellow')} (y/n): ", end='')
-            if input().lower() == 'y':
-                auto_save(player, world)
-                print(colored_text('Game saved!', 'Green'))
-                time.sleep(1)
-            return 'menu'
+            return confirm_quit(player, world)
 
         # Handle movement
-        new_x, new_y = player.x, player.y
-        if action == 'w':
-            new_y -= 1
-        elif action == 's':
-            new_y += 1
-        elif action == 'a':
-            new_x -= 1
-        elif action == 'd':
-            new_x += 1
-        else:
-            print("Invalid action!")
-            time.sleep(1)
+        if action not in DIRECTIONS:
+            echo("Invalid action!")
+            pause(1)
             continue
 
         # Check if move is valid
-        if world.is_walkable(new_x, new_y):
-            player.x = new_x
-            player.y = new_y
-            moves_since_save += 1
+        if not step_player(player, world, action):
+            echo("Can't walk there!")
+            pause(1)
+            continue
 
-            # Auto-save every 20 moves
-            if moves_since_save >= 20:
-                auto_save(player, world)
-                moves_since_save = 0
+        moves_since_save += 1
+        record_action(player, world)
+
+        # Auto-save every 20 moves
+        if moves_since_save >= AUTO_SAVE_MOVES:
+            auto_save(player, world)
+            moves_since_save = 0
 
-            # Check for special tiles
-            tile = world.get_tile(player.x, player.y)
+        # Check for special tiles
+        result = enter_tile(player, world)
+        if result == 'complete':
+            return 'complete'
+        if result == 'saved':
+            moves_since_save = 0
 
-            if tile == '"':  # Grass - chance of encounter
-                if world.check_encounter(player.x, player.y):
-                    # Spawn a wild creature based on zone
-                    wild_species, wild_level = world.get_wild_creature(player.x, player.y)
-                    wild_creature = create_creature(wild_species, wild_level)
 
-                    # Start battle
-                    battle_result = battle(player, wild_creature)
+async def run_game_loop_async(player: Player, world: GameWorld) -> str:
+    """
+    Main game loop on asyncio: input arrives as events while short
+    messages play as animations on the frame scheduler, so a key pressed
+    mid-message is handled on the next frame. Battles, menus and tile
+    events prompt for themselves on a worker thread, with their prompts
+    read from the same input events and their animations (battle scenes,
+    attacks, HP drains, typewriter text) held on the frame clock.
+    Returns: 'menu' to return to menu, 'complete' if game is won
+    """
+    scheduler = FrameScheduler()
+    events = InputEvents(scheduler)
+    moves_since_save = 0
 
-                    # Auto-save after battles
-                    auto_save(player, world)
+    def draw(message: Optional[str] = None):
+        footer = status_lines(player)
+        if message:
+            footer.append(message)
+        world.render(player.x, player.y, use_color=True, footer=footer)
+
+    async def flash(message: str, seconds: float = 1):
+        draw(message)
+        await scheduler.hold(seconds)
+        draw()
+
+    try:
+        while True:
+            record_action(player, world)
+            if not scheduler.busy:
+                draw()
+
+            action = (await events.next_line("Action: ")).lower()
+            scheduler.cancel()
+
+            if action == 'p':
+                result = await events.run_blocking(handle_pause_menu, player, world)
+                if result == 'menu':
+                    return 'menu'
+                if result == 'saved':
                     moves_since_save = 0
+                continue
 
-                    if not battle_result and not player.has_creatures():
-                        # Player lost - teleport to healing house
-                        player.x = 2
-                        player.y = 2
-                        player.heal_all()
-                        player.potions = 3
-                        player.pokeballs = 5
-                        auto_save(player, world)
-
-            elif tile == 'H':  # Healing house
-                clear_screen()
-                print_slow("\nYou entered the healing house!")
-                print_slow("Your creatures have been healed!")
-                player.heal_all()
-                player.potions = 3
-                player.pokeballs = 5
+            if action == 'q':
+                return await events.run_blocking(confirm_quit, player, world)
+
+            if action not in DIRECTIONS:
+                await scheduler.play(flash("Invalid action!"))
+                continue
+
+            if not step_player(player, world, action):
+                await scheduler.play(flash("Can't walk there!"))
+                continue
+
+            moves_since_save += 1
+            record_action(player, world)
+            if moves_since_save >= AUTO_SAVE_MOVES:
                 auto_save(player, world)
-                print(colored_text('\nGame auto-saved!', 'Green'))
-                input("\nPress Enter to continue...")
-
-            elif tile == 'B':  # Boss area
-                clear_screen()
-                print_slow("\n!!! BOSS AREA !!!")
-                print_slow("You sense a powerful presence...")
-                input("\nPress Enter to continue...")
-
-                # Create a powerful boss creature (Level 35 Pyrodragon)
-                boss = create_creature("Pyrodragon", level=35)
-                boss.species_name = "MEGA DRAGON"
-
-                clear_screen()
-                print("="*50)
-                print("           FINAL BOSS BATTLE!")
-                print("="*50)
-                print(colored_text(boss.get_ascii_art(), "Fire"))
-                print(f"\n{colored_text('MEGA DRAGON', 'Fire')} blocks your path!")
-                input("\nPress Enter to battle...")
-
-                boss_result = battle(player, boss)
-
-                if boss_result:
-                    # Victory!
-                    auto_save(player, world)
-                    show_game_over_screen(player)
+                moves_since_save = 0
+
+            if world.get_tile(player.x, player.y) in EVENT_TILES:
+                result = await events.run_blocking(enter_tile, player, world)
+                if result == 'complete':
                     return 'complete'
-                else:
-                    # Lost to boss, teleport back
-                    player.x = 2
-                    player.y = 2
-                    player.heal_all()
-                    auto_save(player, world)
-                    clear_screen()
-                    print_slow("\nYou weren't ready for the boss yet...")
-                    print_slow("Train more and try again!")
-                    input("\nPress Enter to continue...")
-        else:
-            print("Can't walk there!")
-            time.sleep(1)
+                if result == 'saved':
+                    moves_since_save = 0
+    finally:
+        scheduler.cancel()
+        events.close()
 
-    return 'menu'
 
+def play(player: Player, world: GameWorld, use_asyncio: bool = False) -> str:
+    """Run the game loop, on asyncio if asked"""
+    if use_asyncio:
+        return asyncio.run(run_game_loop_async(player, world))
+    return run_game_loop(player, world)
 
-def main():
+
+def main(use_asyncio: bool = False):
     """Main application entry point with menu system"""
     while True:
         # Show main menu
         choice = show_main_menu()
 
         if choice == 'quit':
+            flush_saves()
             clear_screen()
-            print("\n    Thanks for playing ASCII Creatures Adventure!")
-            print("    See you next time, trainer! 👋\n")
+            echo("\n    Thanks for playing ASCII Creatures Adventure!")
+            echo("    See you next time, trainer! 👋\n")
             break
 
         elif choice == 'new':
@@ -253,7 +391,7 @@ def main():
 
             # Start new game
             player, world = start_new_game()
-            result = run_game_loop(player, world)
+            result = play(player, world, use_asyncio)
 
             # Handle game end
             if result == 'complete':
@@ -272,17 +410,53 @@ def main():
             player, world = load_game(save_name)
 
             if player is None:
-                print(f"\n    {colored_text('Failed to load game!', 'Red')}")
-                time.sleep(2)
+                echo(f"\n    {colored_text('Failed to load game!', 'Red')}")
+                pause(2)
                 continue
 
-            print(f"\n    {colored_text('Game loaded successfully!', 'Green')}")
-            print(f"    Welcome back, {player.name}!")
-            time.sleep(2)
+            echo(f"\n    {colored_text('Game loaded successfully!', 'Green')}")
+            echo(f"    Welcome back, {player.name}!")
+            pause(2)
 
             # Run game loop
-            result = run_game_loop(player, world)
+            result = play(player, world, use_asyncio)
+
+
+def run_script(script_path: str, max_frames: Optional[int] = 50,
+               use_asyncio: bool = False) -> HeadlessBackend:
+    """
+    Run the game headless at full speed, answering prompts from a script
+    file (one input per line). Returns the backend holding captured frames.
+    """
+    with open(script_path) as f:
+        inputs = f.read().splitlines()
+
+    backend = HeadlessBackend(inputs, max_frames=max_frames)
+    previous = set_backend(backend)
+    try:
+        main(use_asyncio)
+    except EOFError:
+        pass  # Script ran out of input
+    finally:
+        set_backend(previous)
+    return backend
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="ASCII Creatures Adventure")
+    parser.add_argument("--script", help="run headless, reading inputs from this file")
+    parser.add_argument("--frames", type=int, default=50, help="frames to keep when headless")
+    parser.add_argument("--asyncio", action="store_true", help="run the overworld on the asyncio loop")
+    parser.add_argument("--saves", choices=["files", "sqlite"], default="files",
+                        help="where saves are kept")
+    args = parser.parse_args()
+
+    set_storage(make_storage(args.saves))
+
+    if args.script:
+        backend = run_script(args.script, args.frames, args.asyncio)
+        print(backend.last_frame)
+        print(f"[{backend.frame_count} frames, {len(backend.prompts)} inputs, "
+              f"{backend.slept:.1f}s of pauses skipped]")
+    else:
+        main(args.asyncio)
@@ -1,18 +1,15 @@
 """
 Battle animations - ASCII art battle scenes with perspective views
 """
-import time
 import random
-from typing import Tuple
-from visuals import colored_text, clear_screen
-
-try:
-    from colorama import Fore, Style
-except ImportError:
-    class Fore:
-        RED = BLUE = GREEN = YELLOW = CYAN = MAGENTA = WHITE = ""
-    class Style:
-        BRIGHT = RESET_ALL = ""
+from typing import Tuple, Dict, Optional
+from functools import lru_cache
+from display import pause
+from visuals import (
+    colored_text, render_frame, emit, ScreenBuffer, draw_health_bar, draw_exp_bar,
+    animate_health_bar, type_color, TYPE_COLORS
+)
+from terminal import Fore, Style, get_context
 
 
 # Back-view ASCII art for player's creatures (view from behind)
@@ -226,86 +223,117 @@ def get_back_view(species_name: str) -> str:
     return CREATURE_BACK_VIEWS.get(species_name, CREATURE_BACK_VIEWS["_default"])
 
 
-def draw_battle_scene(player_creature, wild_creature, message: str = ""):
-    """Draw the full battle scene with both creatures"""
-    clear_screen()
+class Sprite:
+    """Pre-split, pre-colored and pre-padded art lines for one creature view"""
+
+    def __init__(self, art: str, color_type: str, name: str):
+        raw_lines = art.strip().split('\n')
+        self.width = max(len(line) for line in raw_lines)
+        self.color = type_color(color_type)
+        self.reset = Style.RESET_ALL
+
+        # Pad every line to the sprite width so it can be placed as a block
+        self.lines = tuple(
+            colored_text(line, color_type) + " " * (self.width - len(line))
+            for line in raw_lines
+        )
+        self.name = colored_text(name.upper(), color_type)
+
+
+# Sprites per (species, view, display context), built on first use and shared across battles
+_sprites: Dict[Tuple[str, str, object], Sprite] = {}
+
+
+def get_sprite(creature, view: str = "front") -> Sprite:
+    """Get the cached sprite of a creature, 'front' (opponent) or 'back' (player)"""
+    key = (creature.species_name, view, get_context())
+    sprite = _sprites.get(key)
+    if sprite is None:
+        if view == "back":
+            art = get_back_view(creature.species_name)
+        else:
+            art = creature.get_ascii_art()
+        sprite = Sprite(art, creature.get_type(), creature.species_name)
+        _sprites[key] = sprite
+    return sprite
+
+
+@lru_cache(maxsize=256)
+def _colored_label(text: str, color_type: str, context) -> str:
+    return colored_text(text, color_type)
+
+
+def colored_label(text: str, color_type: str) -> str:
+    """Memoized colored_text for labels redrawn every turn"""
+    return _colored_label(text, color_type, get_context())
+
+
+@lru_cache(maxsize=None)
+def _message_codes(context) -> Tuple[str, str]:
+    """Color prefix and reset around the battle message, per display context"""
+    if not context.colors:
+        return "", ""
+    return getattr(context.fore, TYPE_COLORS.get("Yellow", "WHITE")), context.style.RESET_ALL
+
+
+def draw_battle_scene(player_creature, wild_creature, message: str = "", footer=None):
+    """Draw the full battle scene with both creatures (footer lines go below it)"""
+    lines = []
 
     width = 70
-    print("\n" + Fore.YELLOW + "╔" + "═" * (width - 2) + "╗")
-    print("║" + " " * ((width - 2 - len("BATTLE!")) // 2) +
-          Fore.WHITE + Style.BRIGHT + "BATTLE!" +
-          " " * ((width - 2 - len("BATTLE!")) // 2) + Fore.YELLOW + "║")
-    print("╚" + "═" * (width - 2) + "╝" + Style.RESET_ALL)
+    lines.append("\n" + Fore.YELLOW + "╔" + "═" * (width - 2) + "╗")
+    lines.append("║" + " " * ((width - 2 - len("BATTLE!")) // 2) +
+                 Fore.WHITE + Style.BRIGHT + "BATTLE!" +
+                 " " * ((width - 2 - len("BATTLE!")) // 2) + Fore.YELLOW + "║")
+    lines.append("╚" + "═" * (width - 2) + "╝" + Style.RESET_ALL)
 
     # Wild creature (opponent) - top, front view
-    wild_type = wild_creature.get_type()
-    wild_art = wild_creature.get_ascii_art()
+    wild_sprite = get_sprite(wild_creature, "front")
 
-    print("\n" + Fore.WHITE + "  WILD " + colored_text(wild_creature.species_name.upper(), wild_type) +
-          f" Lv.{wild_creature.level}")
+    lines.append("\n" + Fore.WHITE + "  WILD " + wild_sprite.name + f" Lv.{wild_creature.level}")
 
     # Wild creature HP bar
-    hp_percent = wild_creature.hp / wild_creature.max_hp if wild_creature.max_hp > 0 else 0
-    hp_blocks = int(20 * hp_percent)
-    hp_bar = "█" * hp_blocks + "░" * (20 - hp_blocks)
-
-    if hp_percent > 0.5:
-        hp_color = Fore.GREEN
-    elif hp_percent > 0.2:
-        hp_color = Fore.YELLOW
-    else:
-        hp_color = Fore.RED
-
-    print(f"  HP: {hp_color}{hp_bar}{Style.RESET_ALL} {wild_creature.hp}/{wild_creature.max_hp}")
+    hp_bar = draw_health_bar(wild_creature.hp, wild_creature.max_hp, 20)
+    lines.append(f"  HP: {hp_bar} {wild_creature.hp}/{wild_creature.max_hp}")
 
     # Display wild creature art (right side)
-    wild_lines = wild_art.strip().split('\n')
-    for line in wild_lines:
-        print(" " * 40 + colored_text(line, wild_type))
+    for line in wild_sprite.lines:
+        lines.append(" " * 40 + line)
 
     # Battle space / attack effects area
-    print("\n" + " " * 10 + Fore.WHITE + "~" * 50 + Style.RESET_ALL)
+    lines.append("\n" + " " * 10 + Fore.WHITE + "~" * 50 + Style.RESET_ALL)
 
     if message:
         # Center the message
-        print(" " * 10 + colored_text(message, "Yellow"))
+        prefix, reset = _message_codes(get_context())
+        lines.append(" " * 10 + prefix + message + reset)
 
-    print(" " * 10 + Fore.WHITE + "~" * 50 + Style.RESET_ALL + "\n")
+    lines.append(" " * 10 + Fore.WHITE + "~" * 50 + Style.RESET_ALL + "\n")
 
     # Player's creature (bottom, back view)
-    player_type = player_creature.get_type()
-    player_back_art = get_back_view(player_creature.species_name)
+    player_sprite = get_sprite(player_creature, "back")
 
     # Display player creature art (left side)
-    player_lines = player_back_art.strip().split('\n')
-    for line in player_lines:
-        print("  " + colored_text(line, player_type))
+    for line in player_sprite.lines:
+        lines.append("  " + line)
 
-    print("\n  YOUR " + colored_text(player_creature.species_name.upper(), player_type) +
-          f" Lv.{player_creature.level}")
+    lines.append("\n  YOUR " + player_sprite.name + f" Lv.{player_creature.level}")
 
     # Player creature HP bar
-    hp_percent = player_creature.hp / player_creature.max_hp if player_creature.max_hp > 0 else 0
-    hp_blocks = int(20 * hp_percent)
-    hp_bar = "█" * hp_blocks + "░" * (20 - hp_blocks)
-
-    if hp_percent > 0.5:
-        hp_color = Fore.GREEN
-    elif hp_percent > 0.2:
-        hp_color = Fore.YELLOW
-    else:
-        hp_color = Fore.RED
-
-    print(f"  HP: {hp_color}{hp_bar}{Style.RESET_ALL} {player_creature.hp}/{player_creature.max_hp}")
+    hp_bar = draw_health_bar(player_creature.hp, player_creature.max_hp, 20)
+    lines.append(f"  HP: {hp_bar} {player_creature.hp}/{player_creature.max_hp}")
 
     # EXP bar
     exp_needed = player_creature.exp_to_next_level()
-    exp_percent = player_creature.exp / exp_needed if exp_needed > 0 else 0
-    exp_blocks = int(20 * exp_percent)
-    exp_bar = "█" * exp_blocks + "░" * (20 - exp_blocks)
-    print(f"  XP: {Fore.CYAN}{exp_bar}{Style.RESET_ALL} {player_creature.exp}/{exp_needed}")
+    exp_bar = draw_exp_bar(player_creature.exp, exp_needed, 20)
+    lines.append(f"  XP: {exp_bar} {player_creature.exp}/{exp_needed}")
+
+    lines.append("\n" + "═" * 70)
 
-    print("\n" + "═" * 70)
+    if footer:
+        lines.extend(footer)
+
+    render_frame(lines)
 
 
 def attack_effect_animation(attacker_name: str, move_name: str, move_type: str,
@@ -357,16 +385,16 @@ def attack_effect_animation(attacker_name: str, move_name: str, move_type: str,
 
     # Animate the attack
     for frame in frames:
-        print("\n" + " " * 10 + colored_text(frame, move_type), end='\r', flush=True)
-        time.sleep(0.12)
+        emit("\n" + " " * 10 + colored_label(frame, move_type) + "\r")
+        pause(0.12)
 
     # Show damage
     damage_text = f"-{damage} HP"
     if is_critical:
         damage_text = f"CRITICAL! -{damage} HP"
 
-    print("\n" + " " * 25 + colored_text(damage_text, "Red") + " " * 20)
-    time.sleep(0.8)
+    emit("\n" + " " * 25 + colored_label(damage_text, "Red") + " " * 20 + "\n")
+    pause(0.8)
 
 
 def physical_attack_animation(attacker_name: str, move_name: str, move_type: str,
@@ -393,30 +421,32 @@ def physical_attack_animation(attacker_name: str, move_name: str, move_type: str
         ]
 
     for frame in frames:
-        print("\n" + " " * 10 + colored_text(frame, move_type), end='\r', flush=True)
-        time.sleep(0.1)
+        emit("\n" + " " * 10 + colored_label(frame, move_type) + "\r")
+        pause(0.1)
 
     # Show impact
     impact_frames = ["💥", "✨💥✨", "✨✨✨", "💫", " "]
     for impact in impact_frames:
         position = 25 if is_player_attacking else 15
-        print("\n" + " " * position + impact + " " * 30, end='\r', flush=True)
-        time.sleep(0.1)
+        emit("\n" + " " * position + impact + " " * 30 + "\r")
+        pause(0.1)
 
     # Show damage
     damage_text = f"-{damage} HP"
     if is_critical:
         damage_text = f"CRITICAL! -{damage} HP"
 
-    print("\n" + " " * 25 + colored_text(damage_text, "Red") + " " * 20)
-    time.sleep(0.8)
+    emit("\n" + " " * 25 + colored_label(damage_text, "Red") + " " * 20 + "\n")
+    pause(0.8)
 
 
 def show_attack_animation(attacker_name: str, move_name: str, move_type: str,
                           move_power: int, is_player_attacking: bool,
-                          damage: int, is_critical: bool = False):
+                          damage: int, is_critical: bool = False,
+                          defender_hp: Optional[int] = None, defender_max_hp: int = 0):
     """
     Main attack animation dispatcher
+    If the defender's HP (before the hit) is given, its bar drains afterwards
     """
     # Determine animation type based on move
     physical_moves = ["Tackle", "Scratch", "Bite", "Body Slam", "Take Down",
@@ -429,17 +459,20 @@ def show_attack_animation(attacker_name: str, move_name: str, move_type: str,
         attack_effect_animation(attacker_name, move_name, move_type,
                                is_player_attacking, damage, is_critical)
 
+    if defender_hp is not None:
+        animate_health_bar(defender_hp, max(0, defender_hp - damage), defender_max_hp)
+
 
 def shake_animation(creature_name: str, hit_count: int = 3):
     """
     Shake animation when creature takes damage
     """
     for _ in range(hit_count):
-        print(f"\r  {creature_name} ⚡", end='', flush=True)
-        time.sleep(0.1)
-        print(f"\r  {creature_name}  ", end='', flush=True)
-        time.sleep(0.1)
-    print()
+        emit(f"\r  {creature_name} ⚡")
+        pause(0.1)
+        emit(f"\r  {creature_name}  ")
+        pause(0.1)
+    emit("\n")
 
 
 def faint_animation(creature_name: str):
@@ -454,9 +487,9 @@ def faint_animation(creature_name: str):
     ]
 
     for frame in frames:
-        print(f"\r{frame}", end='', flush=True)
-        time.sleep(0.4)
-    print()
+        emit(f"\r{frame}")
+        pause(0.4)
+    emit("\n")
 
 
 def level_up_animation(creature_name: str, new_level: int):
@@ -470,11 +503,11 @@ def level_up_animation(creature_name: str, new_level: int):
         f"🌟 {creature_name} grew to Level {new_level}! 🌟",
     ]
 
-    print("\n")
+    emit("\n\n")
     for frame in frames:
-        print(f"\r" + " " * 25 + colored_text(frame, "Yellow"), end='', flush=True)
-        time.sleep(0.3)
-    print("\n")
+        emit("\r" + " " * 25 + colored_label(frame, "Yellow"))
+        pause(0.3)
+    emit("\n\n")
 
 
 def catch_attempt_animation(creature_name: str):
@@ -489,32 +522,34 @@ def catch_attempt_animation(creature_name: str):
         "   \\______/  ",
     ]
 
-    print("\n" + " " * 20 + "🎯 Pokeball thrown!")
-    time.sleep(0.5)
+    emit("\n" + " " * 20 + "🎯 Pokeball thrown!\n")
+    pause(0.5)
 
     # Show pokeball approaching
     for i in range(5):
-        print(f"\r{' ' * (10 + i*3)}(●)", end='', flush=True)
-        time.sleep(0.1)
+        emit(f"\r{' ' * (10 + i*3)}(●)")
+        pause(0.1)
 
-    print(f"\r{' ' * 28}💥")
-    time.sleep(0.3)
+    emit(f"\r{' ' * 28}💥\n")
+    pause(0.3)
 
     # Wobble animation
     wobbles = ["(●)", "(●>", "(●)", "<●)", "(●)"]
     for _ in range(3):
         for wobble in wobbles:
-            print(f"\r{' ' * 25}{wobble} {creature_name}...", end='', flush=True)
-            time.sleep(0.2)
+            emit(f"\r{' ' * 25}{wobble} {creature_name}...")
+            pause(0.2)
 
-    print()
+    emit("\n")
 
 
 def draw_attack_choice_scene(player_creature, wild_creature):
     """
     Draw simplified battle scene for move selection
     """
-    print("\n" + "─" * 70)
-    print(f"  YOUR {colored_text(player_creature.species_name, player_creature.get_type())} " +
-          f"vs WILD {colored_text(wild_creature.species_name, wild_creature.get_type())}")
-    print("─" * 70)
+    screen = ScreenBuffer()
+    screen.add("\n" + "─" * 70)
+    screen.add(f"  YOUR {colored_label(player_creature.species_name, player_creature.get_type())} " +
+               f"vs WILD {colored_label(wild_creature.species_name, wild_creature.get_type())}")
+    screen.add("─" * 70)
+    screen.flush()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark - restoring creatures when loading a save
+
+Loads a save with a full party and a large storage box. Creatures are
+rebuilt two ways: the old way (Creature.__init__, which learns default
+moves, then replacing the moves from the save) and Creature.from_saved_state.
+
+Run: python3 benchmarks/bench_load.py [storage size]
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import save_system
+from creatures import Creature
+from moves import Move
+from world import GameWorld
+from bench_save_format import make_player, best_of
+
+
+def restore_via_init(creature_data):
+    """The previous restore path"""
+    creature = Creature(
+        species_name=creature_data['species_name'],
+        level=creature_data['level'],
+        current_hp=creature_data['current_hp'],
+        current_exp=creature_data['exp']
+    )
+    creature.moves = []
+    for move_data in creature_data['moves']:
+        move = Move.from_database(move_data['name'])
+        move.current_pp = move_data['current_pp']
+        creature.moves.append(move)
+    return creature
+
+
+def main():
+    storage_size = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    player, world = make_player(storage_size), GameWorld()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        save_system.SAVES_DIR = Path(scratch)
+        save_system.write_save_data("bench", save_system.snapshot_game(player, world))
+        save_data = save_system.read_save_file("bench")
+        creatures = save_data['party'] + save_data['storage']
+
+        print(f"Loading a party of {len(save_data['party'])} and {len(save_data['storage'])} in storage")
+        restorers = [("__init__ + moves", restore_via_init),
+                     ("from_saved_state", save_system.restore_creature)]
+        for name, restore in restorers:
+            restore_ms = best_of(lambda: [restore(data) for data in creatures])
+            save_system.restore_creature = restore
+            load_ms = best_of(lambda: save_system.load_game("bench"))
+            print(f"  {name:17}: restore {restore_ms:7.2f} ms   load_game {load_ms:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
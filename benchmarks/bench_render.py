@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Benchmark - bytes and write syscalls per frame for the map and battle screens
+
+Compares the old output path (clear, then one print() per line) with the
+frame renderer (one buffered write per frame, only changed rows redrawn).
+Output goes through a line-buffered text stream over a counting raw file,
+so every raw write corresponds to one write(2) call on a real terminal.
+Each frame is followed by a prompt answered with Enter, as in the game.
+
+Screens are measured at 80x24, at the size of the terminal running the
+benchmark and on a tall 120x100 one.
+
+Run: python3 benchmarks/bench_render.py
+"""
+import io
+import os
+import sys
+
+import shutil
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import visuals
+import battle_animations
+from creatures import Creature
+from world import GameWorld
+from display import FrameRenderer, CURSOR_HOME, CLEAR_SCREEN
+
+
+# What the player types after each frame, echoed by the terminal
+PROMPT = "Action: w\n"
+
+# Screen sizes measured (columns, lines), with the benchmark's own terminal added in main()
+SCREEN_SIZES = [(80, 24), (120, 100)]
+
+
+class CountingRaw(io.RawIOBase):
+    """Raw sink counting write calls and bytes"""
+
+    def __init__(self):
+        self.writes = 0
+        self.bytes = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.writes += 1
+        self.bytes += len(data)
+        return len(data)
+
+
+def make_terminal():
+    """Line-buffered text stream like an interactive stdout"""
+    raw = CountingRaw()
+    stream = io.TextIOWrapper(io.BufferedWriter(raw), encoding="utf-8", line_buffering=True)
+    return raw, stream
+
+
+def capture_frames(draw_calls):
+    """Collect the lines each draw call hands to the renderer"""
+    frames = []
+    original_map, original_battle = visuals.render_frame, battle_animations.render_frame
+    visuals.render_frame = battle_animations.render_frame = frames.append
+    try:
+        for draw in draw_calls:
+            draw()
+    finally:
+        visuals.render_frame, battle_animations.render_frame = original_map, original_battle
+    return frames
+
+
+def measure_print_per_line(frames):
+    """Old path: clear the screen, then print() every line"""
+    raw, stream = make_terminal()
+    for lines in frames:
+        stream.write(CURSOR_HOME + CLEAR_SCREEN)
+        stream.flush()
+        for line in lines:
+            print(line, file=stream)
+        stream.write(PROMPT)
+        stream.flush()
+    stream.flush()
+    return raw
+
+
+def measure_frame_renderer(frames):
+    """New path: one buffered write per frame through the diffing renderer"""
+    raw, stream = make_terminal()
+    renderer = FrameRenderer(stream)
+    for lines in frames:
+        renderer.render(lines)
+        stream.write(PROMPT)
+        stream.flush()
+        renderer.note_output(PROMPT)
+    stream.flush()
+    return raw
+
+
+def map_walk_frames():
+    """A short walk across the map"""
+    world = GameWorld()
+    path = [(2, 2), (3, 2), (4, 2), (5, 2), (5, 3), (5, 4), (6, 4), (7, 4), (8, 4), (8, 5)]
+    return capture_frames([lambda p=p: visuals.render_map(world, p[0], p[1]) for p in path])
+
+
+def battle_frames():
+    """A few battle turns with HP going down on both sides"""
+    player_creature = Creature("Infernix", level=20)
+    wild_creature = Creature("Rockhead", level=18)
+    draws = []
+    for turn in range(10):
+        def draw(turn=turn):
+            wild_creature.hp = max(0, wild_creature.max_hp - 6 * turn)
+            player_creature.hp = max(0, player_creature.max_hp - 4 * turn)
+            battle_animations.draw_battle_scene(player_creature, wild_creature,
+                                                f"Turn {turn + 1}: Infernix used Ember!")
+        draws.append(draw)
+    return capture_frames(draws)
+
+
+def report(name, frames):
+    before = measure_print_per_line(frames)
+    after = measure_frame_renderer(frames)
+    count = len(frames)
+    print(f"  {name} ({count} frames)")
+    print(f"    print per line : {before.writes / count:7.1f} writes/frame  {before.bytes / count:9.1f} bytes/frame")
+    print(f"    frame renderer : {after.writes / count:7.1f} writes/frame  {after.bytes / count:9.1f} bytes/frame")
+
+
+def main():
+    own = tuple(shutil.get_terminal_size())
+    sizes = SCREEN_SIZES[:1] + ([own] if own not in SCREEN_SIZES else []) + SCREEN_SIZES[1:]
+    for columns, lines in sizes:
+        # The renderer and the map camera both read the size from the environment first
+        os.environ["COLUMNS"], os.environ["LINES"] = str(columns), str(lines)
+        label = " (this terminal)" if (columns, lines) == own else ""
+        print(f"{columns}x{lines}{label}")
+        report("Map walk", map_walk_frames())
+        report("Battle turns", battle_frames())
+
+
+if __name__ == "__main__":
+    main()
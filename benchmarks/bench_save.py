@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark - latency of one save for a full party
+
+Compares the old in-place write (open with 'w') with the atomic
+save (temp file, fsync, backup rotation, rename, directory fsync), so the
+cost of durability on this disk is visible. Saves go to a scratch
+directory (or SAVES_DIR=<path> to measure a particular disk).
+
+Run: python3 benchmarks/bench_save.py [rounds]
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import save_system
+from creatures import Creature
+from events import Moved
+from player import Player
+from world import GameWorld
+
+
+def make_player() -> Player:
+    """A trainer with a full party of six"""
+    player = Player("Bench")
+    for species in ["Infernix", "Rockhead", "Aquabit", "Leaflet", "Flameo", "Pyrodragon"]:
+        player.add_creature(Creature(species, level=30))
+    return player
+
+
+def in_place_write(save_name, payload, save_format=None):
+    """The previous write path: overwrite the save file in place"""
+    with open(save_system.get_save_path(save_name, save_format), 'wb') as f:
+        f.write(payload)
+
+
+def measure(write_save_file, player, world, rounds):
+    """Median and worst latency of save_game with a given writer, in milliseconds"""
+    save_system.write_save_file = write_save_file
+    times = []
+    for _ in range(rounds):
+        player.apply(Moved(player.x + 1, player.y))  # A change to save, so the save is not skipped
+        start = time.perf_counter()
+        save_system.save_game(player, world, "bench")
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    return times[len(times) // 2], times[-1]
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    player, world = make_player(), GameWorld()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        save_system.SAVES_DIR = Path(os.environ.get("SAVES_DIR", scratch))
+        save_system.ensure_saves_directory()
+
+        print(f"Save latency over {rounds} saves ({save_system.SAVES_DIR})")
+        writers = [("in-place write", in_place_write), ("atomic save", save_system.write_save_file)]
+        for name, writer in writers:
+            median, worst = measure(writer, player, world, rounds)
+            print(f"  {name:15}: median {median:7.3f} ms   worst {worst:7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark - size and load time of JSON and binary saves
+
+Saves a full party plus a large storage box in both formats and compares
+the file size, the time to decode it, and the time for a full load_game.
+
+Run: python3 benchmarks/bench_save_format.py [storage size]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import save_system
+from save_format import encode_save, decode_save
+from creatures import Creature
+from player import Player
+from world import GameWorld
+from data.pack import CREATURE_SPECIES
+
+
+def make_player(storage_size: int) -> Player:
+    """A trainer with a full party and storage_size creatures in storage"""
+    rng = random.Random(1)
+    species = sorted(CREATURE_SPECIES)
+    player = Player("Bench")
+    for _ in range(6 + storage_size):
+        player.add_creature(Creature(rng.choice(species), level=rng.randint(5, 60)))
+    return player
+
+
+def best_of(func, rounds: int = 5) -> float:
+    """Fastest of a few runs, in milliseconds"""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    storage_size = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    player, world = make_player(storage_size), GameWorld()
+    save_data = save_system.snapshot_game(player, world)
+
+    with tempfile.TemporaryDirectory() as scratch:
+        save_system.SAVES_DIR = Path(scratch)
+        print(f"Party of {len(player.party)} and {len(player.storage)} creatures in storage")
+        for save_format in ("json", "binary"):
+            payload = encode_save(save_data, save_format)
+            name = f"bench_{save_format}"
+            save_system.write_save_data(name, save_data, save_format)
+
+            decode_ms = best_of(lambda: decode_save(payload))
+            load_ms = best_of(lambda: save_system.load_game(name))
+            print(f"  {save_format:6}: {len(payload):8} bytes   decode {decode_ms:7.2f} ms   "
+                  f"load_game {load_ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark - startup cost of the species and move databases
+
+Imports the game in fresh interpreters and reports the time and memory
+taken by the game data (species, moves and learnsets from data.pack), and
+by the whole game. The data is either compiled from the source literals
+or loaded from the compiled pack cache. "eager art" also reads every
+creature's art up front, as importing the species database used to.
+
+Run: python3 benchmarks/bench_startup.py [runs]
+"""
+import compileall
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# Run in a child interpreter: import the database, then the game. Modules
+# the game imports anyway are imported first so they are not counted.
+# Memory is traced in separate runs (tracing slows imports down).
+PROBE = """
+import json, sys, time, tracemalloc, pathlib, typing, hashlib, marshal
+try:
+    import resource
+except ImportError:
+    resource = None
+sys.path.insert(0, {root!r})
+eager = {eager!r}
+
+if {traced!r}:
+    tracemalloc.start()
+start = time.perf_counter()
+from data.pack import CREATURE_SPECIES, MOVE_DATABASE, LEARNSETS
+if eager:
+    from data.creature_art import load_art
+    load_art()
+data_time = time.perf_counter() - start
+data_memory = tracemalloc.get_traced_memory()[0]
+
+import ascii_rpg
+game_time = time.perf_counter() - start
+game_memory = tracemalloc.get_traced_memory()[0]
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else 0
+print(json.dumps([data_time, data_memory, game_time, game_memory, rss]))
+"""
+
+
+def probe(eager: bool, cached: bool, traced: bool):
+    """[data time, data memory, game time, game memory, max RSS] of one start"""
+    env = dict(os.environ, ASCII_RPG_DATA_CACHE="1" if cached else "0")
+    result = subprocess.run([sys.executable, "-c", PROBE.format(root=ROOT, eager=eager, traced=traced)],
+                            capture_output=True, text=True, check=True, env=env)
+    return json.loads(result.stdout)
+
+
+def best_probe(eager: bool, cached: bool, traced: bool, runs: int):
+    """The lowest of each measurement over a number of starts"""
+    return [min(column) for column in zip(*(probe(eager, cached, traced) for _ in range(runs)))]
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    # Compile bytecode (also under PYTHONDONTWRITEBYTECODE) and the pack first, so no run pays for it
+    compileall.compile_dir(ROOT, quiet=1)
+    probe(False, True, False)
+
+    print(f"Startup, best of {runs} fresh interpreters")
+    modes = (("sources, eager art", True, False), ("sources", False, False), ("pack cache", False, True))
+    for label, eager, cached in modes:
+        data_ms, _, game_ms, _, rss = best_probe(eager, cached, False, runs)
+        _, data_kb, _, game_kb, _ = best_probe(eager, cached, True, runs)
+        print(f"  {label:18}: data {data_ms * 1000:6.2f} ms {data_kb / 1024:7.1f} KB   "
+              f"game {game_ms * 1000:6.1f} ms {game_kb / 1024:8.1f} KB   max RSS {rss / 1024:5.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
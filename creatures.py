@@ -1,13 +1,21 @@
 """
 Creature module - Enhanced creature class with level, exp, and moves
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 import random
+from tracking import Tracked, mark_changed
 
 
-class Creature:
+def calculate_stat(base_stat: int, level: int) -> int:
+    """Stat formula: floor(((base_stat × 2) × level) / 100) + level + 10"""
+    return int(((base_stat * 2) * level) / 100) + level + 10
+
+
+class Creature(Tracked):
     """Represents a creature that can battle with leveling and evolution"""
 
+    TRACKED = frozenset({'species_name', 'level', 'hp', 'exp', 'moves'})
+
     def __init__(
         self,
         species_name: str,
@@ -21,7 +29,7 @@ class Creature:
         self.moves: List[Any] = []  # Will be Move objects from moves.py
 
         # Load species data
-        from data.creature_data import CREATURE_SPECIES
+        from data.pack import CREATURE_SPECIES
         self.species_data = CREATURE_SPECIES.get(species_name, {})
 
         # Calculate stats based on level
@@ -36,6 +44,53 @@ class Creature:
         # Load moves for this level
         self.initialize_moves()
 
+    @classmethod
+    def from_saved_state(
+        cls,
+        species_name: str,
+        level: int,
+        current_hp: int,
+        current_exp: int,
+        moves: Iterable[Tuple[str, int]]
+    ) -> 'Creature':
+        """
+        Restore a saved creature: stats are recalculated for its level, and
+        moves come from the save (name, current PP) instead of being learned
+        """
+        from data.pack import CREATURE_SPECIES
+        from moves import Move
+
+        # Fields are set directly rather than through change tracking, with a
+        # single mark_changed() for the whole creature
+        creature = cls.__new__(cls)
+        vars(creature).update(
+            species_name=species_name,
+            level=level,
+            exp=current_exp,
+            species_data=CREATURE_SPECIES.get(species_name, {})
+        )
+        creature.calculate_stats()
+
+        restored_moves = []
+        for move_name, current_pp in moves:
+            move = Move.from_database(move_name)
+            vars(move)['current_pp'] = current_pp
+            restored_moves.append(move)
+        vars(creature).update(hp=current_hp, moves=restored_moves)
+
+        mark_changed()
+        return creature
+
+    def saved_state(self) -> Dict[str, Any]:
+        """The creature as plain data, as stored in saves"""
+        return {
+            'species_name': self.species_name,
+            'level': self.level,
+            'current_hp': self.hp,
+            'exp': self.exp,
+            'moves': [{'name': move.name, 'current_pp': move.current_pp} for move in self.moves]
+        }
+
     def calculate_stats(self):
         """Calculate stats based on base stats and level"""
         base_hp = self.species_data.get('base_hp', 45)
@@ -43,31 +98,27 @@ class Creature:
         base_defense = self.species_data.get('base_defense', 50)
         base_speed = self.species_data.get('base_speed', 50)
 
-        # Stat formula: floor(((base_stat × 2) × level) / 100) + level + 10
-        self.max_hp = int(((base_hp * 2) * self.level) / 100) + self.level + 10
-        self.attack = int(((base_attack * 2) * self.level) / 100) + self.level + 10
-        self.defense = int(((base_defense * 2) * self.level) / 100) + self.level + 10
-        self.speed = int(((base_speed * 2) * self.level) / 100) + self.level + 10
+        self.max_hp = calculate_stat(base_hp, self.level)
+        self.attack = calculate_stat(base_attack, self.level)
+        self.defense = calculate_stat(base_defense, self.level)
+        self.speed = calculate_stat(base_speed, self.level)
 
     def initialize_moves(self):
         """Initialize moves based on current level"""
         from moves import MOVE_DATABASE
-
-        move_pool = self.species_data.get('move_pool', {})
+        from data.pack import LEARNSETS
 
         # Get all moves learnable up to current level
-        learnable_moves = []
-        for learn_level, move_names in sorted(move_pool.items()):
-            if learn_level <= self.level:
-                for move_name in move_names:
-                    if move_name not in [m.name for m in self.moves]:
-                        learnable_moves.append(move_name)
+        known = [m.name for m in self.moves]
+        learnable_moves = [move_name for learn_level, move_name in LEARNSETS.get(self.species_name, [])
+                           if learn_level <= self.level and move_name not in known]
 
         # Add last 4 moves (or all if less than 4)
         for move_name in learnable_moves[-4:]:
             if move_name in MOVE_DATABASE and len(self.moves) < 4:
                 from moves import Move
                 self.moves.append(Move.from_database(move_name))
+                mark_changed()
 
     def learn_move(self, move_name: str) -> bool:
         """Learn a new move (prompt if party is full)"""
@@ -80,6 +131,7 @@ class Creature:
 
         if len(self.moves) < 4:
             self.moves.append(new_move)
+            mark_changed()
             return True
 
         return False  # Need to forget a move (handled in battle.py)
@@ -152,7 +204,7 @@ class Creature:
 
     def evolve(self, new_species: str):
         """Evolve into a new species"""
-        from data.creature_data import CREATURE_SPECIES
+        from data.pack import CREATURE_SPECIES
 
         # Update species
         self.species_name = new_species
@@ -194,7 +246,8 @@ class Creature:
 
     def get_ascii_art(self) -> str:
         """Get creature's ASCII art"""
-        return self.species_data.get('ascii_art', '  ???\n (o_o)')
+        from data.creature_art import get_ascii_art
+        return get_ascii_art(self.species_data.get('name', self.species_name))
 
     def get_exp_yield(self) -> int:
         """Get exp yielded when defeated"""
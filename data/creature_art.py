@@ -0,0 +1,50 @@
+"""
+Creature art - ASCII art for each species, read from creature_art.txt on first use
+"""
+from pathlib import Path
+from typing import Dict, Optional
+
+ART_FILE = Path(__file__).with_name("creature_art.txt")
+
+# Shown for species without art
+UNKNOWN_ART = '  ???\n (o_o)'
+
+_art: Optional[Dict[str, str]] = None
+
+
+def load_art(path: Path = ART_FILE) -> Dict[str, str]:
+    """
+    Parse an art file: comment lines (#) at the top, then for each species
+    a [Name] line followed by its art, up to a blank line
+    """
+    art: Dict[str, str] = {}
+    name = None
+    lines = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f.read().split("\n"):
+            if line.startswith("[") and line.endswith("]"):
+                name, lines = line[1:-1], []
+            elif name is None:
+                continue  # Header comments
+            elif line:
+                lines.append(line)
+            elif lines:
+                # Art strings start on a new line, as they are printed under a heading
+                art[name] = "\n" + "\n".join(lines)
+                name = None
+    if name is not None and lines:
+        art[name] = "\n" + "\n".join(lines)
+    return art
+
+
+def get_ascii_art(species_name: str) -> str:
+    """Get the art of a species (the art file is read on the first call)"""
+    global _art
+    if _art is None:
+        _art = load_art()
+    return _art.get(species_name, UNKNOWN_ART)
+
+
+def art_loaded() -> bool:
+    """Whether the art file has been read yet"""
+    return _art is not None
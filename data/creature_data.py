@@ -1,5 +1,8 @@
 """
 Creature database - All 30 creatures with stats, moves, and evolution data
+
+Art is kept out of this table, in creature_art.txt (see data.creature_art),
+and only read the first time a creature is drawn.
 """
 
 CREATURE_SPECIES = {
@@ -25,11 +28,6 @@ CREATURE_SPECIES = {
             22: ["Take Down"],
             28: ["Fire Blast"],
         },
-        "ascii_art": """
-    /\\_/\\
-   ( o.o )
-    > ^ <  ~
-   /|   |\\ ~""",
         "exp_yield": 62,
         "catch_rate": 45
     },
@@ -53,12 +51,6 @@ CREATURE_SPECIES = {
             36: ["Inferno"],
             42: ["Hyper Beam"],
         },
-        "ascii_art": """
-     /\\_/\\
-    ( O.O )
-   < >===< > ~~
-   /||   ||\\ ~~
-    ||   ||""",
         "exp_yield": 142,
         "catch_rate": 45
     },
@@ -78,13 +70,6 @@ CREATURE_SPECIES = {
             42: ["Hyper Beam"],
             48: ["Fire Blast"],
         },
-        "ascii_art": """
-      /\\___/\\
-     ( O _ O )
-    < >=====< > ~~~
-   /|||     |||\\ ~~~
-   ||||     ||||
-    /\\|     |/\\""",
         "exp_yield": 240,
         "catch_rate": 45
     },
@@ -109,12 +94,6 @@ CREATURE_SPECIES = {
             22: ["Body Slam"],
             28: ["Hydro Pump"],
         },
-        "ascii_art": """
-     .---.
-    /     \\
-    | O O |
-    |  ~  | ~~~
-     \\___/""",
         "exp_yield": 63,
         "catch_rate": 45
     },
@@ -138,13 +117,6 @@ CREATURE_SPECIES = {
             36: ["Tidal Wave"],
             42: ["Hyper Beam"],
         },
-        "ascii_art": """
-      .-----.
-     /       \\
-    |  O   O  |
-    |    ~    | ~~~
-    |_________|
-     \\_______/""",
         "exp_yield": 144,
         "catch_rate": 45
     },
@@ -164,14 +136,6 @@ CREATURE_SPECIES = {
             42: ["Hyper Beam"],
             48: ["Hydro Pump"],
         },
-        "ascii_art": """
-       .------.
-      /  ^^^^  \\
-     |   O  O   |
-     |     ~     | ~~~
-    /|___________|\\
-   / \\___________/ \\
-   |___|       |___|""",
         "exp_yield": 242,
         "catch_rate": 45
     },
@@ -196,12 +160,6 @@ CREATURE_SPECIES = {
             22: ["Body Slam"],
             28: ["Solar Beam"],
         },
-        "ascii_art": """
-      ___
-     / Y \\
-    | ^_^ |
-    |_____|
-     |   |""",
         "exp_yield": 64,
         "catch_rate": 45
     },
@@ -225,13 +183,6 @@ CREATURE_SPECIES = {
             36: ["Leaf Storm"],
             42: ["Hyper Beam"],
         },
-        "ascii_art": """
-      .---.
-     /  Y  \\
-    |  ^_^  |
-    |_______|
-   ~~/     \\~~
-   ~ |     | ~""",
         "exp_yield": 141,
         "catch_rate": 45
     },
@@ -251,15 +202,6 @@ CREATURE_SPECIES = {
             42: ["Hyper Beam"],
             48: ["Solar Beam"],
         },
-        "ascii_art": """
-       .---.
-      /  Y  \\
-     |  ^_^  |
-     |_______|
-    ~~~     ~~~
-   ~~~/     \\~~~
-   ~~ |     | ~~
-      |     |""",
         "exp_yield": 239,
         "catch_rate": 45
     },
@@ -284,12 +226,6 @@ CREATURE_SPECIES = {
             22: ["Take Down"],
             28: ["Thunder"],
         },
-        "ascii_art": """
-     .--.
-    ( oo )
-     |><| ⚡
-     |  |
-     |__|""",
         "exp_yield": 60,
         "catch_rate": 45
     },
@@ -313,13 +249,6 @@ CREATURE_SPECIES = {
             36: ["Volt Storm"],
             42: ["Hyper Beam"],
         },
-        "ascii_art": """
-      .---.
-     ( o o )
-    < |><| > ⚡
-     /|  |\\
-    | |__| |
-     \\____/""",
         "exp_yield": 145,
         "catch_rate": 45
     },
@@ -339,14 +268,6 @@ CREATURE_SPECIES = {
             42: ["Hyper Beam"],
             48: ["Thunder"],
         },
-        "ascii_art": """
-       .---.
-      ( O O )
-     <||><||> ⚡⚡
-    < /|  |\\ >
-    | ||__|| |
-    | \\____/ |
-     \\______/""",
         "exp_yield": 243,
         "catch_rate": 45
     },
@@ -371,12 +292,6 @@ CREATURE_SPECIES = {
             22: ["Body Slam"],
             28: ["Stone Edge"],
         },
-        "ascii_art": """
-     ____
-    /    \\
-   | -  - |
-   |  __  |
-    \\____/""",
         "exp_yield": 70,
         "catch_rate": 45
     },
@@ -400,13 +315,6 @@ CREATURE_SPECIES = {
             36: ["Meteor Strike"],
             42: ["Hyper Beam"],
         },
-        "ascii_art": """
-     ______
-    /      \\
-   | -    - |
-   |   __   |
-   |________|
-    \\______/""",
         "exp_yield": 148,
         "catch_rate": 45
     },
@@ -426,14 +334,6 @@ CREATURE_SPECIES = {
             42: ["Hyper Beam"],
             48: ["Stone Edge"],
         },
-        "ascii_art": """
-      ______
-     /      \\
-    /  -  -  \\
-   |    __    |
-   |__________|
-   /|________|\\
-  / \\________/ \\""",
         "exp_yield": 248,
         "catch_rate": 45
     },
@@ -458,12 +358,6 @@ CREATURE_SPECIES = {
             22: ["Take Down"],
             28: ["Hurricane"],
         },
-        "ascii_art": """
-      .-.
-     (o o)
-    < \\_/ >
-     /   \\
-    ^     ^""",
         "exp_yield": 58,
         "catch_rate": 45
     },
@@ -487,13 +381,6 @@ CREATURE_SPECIES = {
             36: ["Sky Attack"],
             42: ["Hyper Beam"],
         },
-        "ascii_art": """
-       .---.
-      ( o o )
-     < \\_|_/ >
-      /| |\\
-     ^ |_| ^
-      ^   ^""",
         "exp_yield": 143,
         "catch_rate": 45
     },
@@ -513,14 +400,6 @@ CREATURE_SPECIES = {
             42: ["Hyper Beam"],
             48: ["Hurricane"],
         },
-        "ascii_art": """
-        .---.
-       ( O O )
-      < \\_|_/ >
-      /||||||\\
-     ^ ||||| ^
-      ^|___|^
-       ^   ^""",
         "exp_yield": 244,
         "catch_rate": 45
     },
@@ -548,12 +427,6 @@ CREATURE_SPECIES = {
             28: ["Body Slam"],
             35: ["Toxic Blast"],
         },
-        "ascii_art": """
-     .---.
-    ( o_o )
-    |  ~  |
-    |_____|
-   /|     |\\""",
         "exp_yield": 142,
         "catch_rate": 90
     },
@@ -574,13 +447,6 @@ CREATURE_SPECIES = {
             35: ["Toxic Blast"],
             42: ["Hyper Beam"],
         },
-        "ascii_art": """
-      .-----.
-     ( O _ O )
-    <   ~~~   >
-    |_________|
-   /||       ||\\
-   |||       |||""",
         "exp_yield": 205,
         "catch_rate": 90
     },
@@ -606,12 +472,6 @@ CREATURE_SPECIES = {
             28: ["Take Down"],
             35: ["Blizzard"],
         },
-        "ascii_art": """
-     .---.
-    /  *  \\
-   | (o o) |
-   |   ^   |
-    \\_____/""",
         "exp_yield": 138,
         "catch_rate": 90
     },
@@ -632,14 +492,6 @@ CREATURE_SPECIES = {
             35: ["Blizzard"],
             42: ["Glacial Surge"],
         },
-        "ascii_art": """
-      .-----.
-     /  ***  \\
-    / (O   O) \\
-   |     ^     |
-   |___________|
-    \\  _____  /
-     \\_______/""",
         "exp_yield": 208,
         "catch_rate": 90
     },
@@ -664,12 +516,6 @@ CREATURE_SPECIES = {
             22: ["Air Slash"],
             28: ["Poison Fang"],
         },
-        "ascii_art": """
-      .-.
-     ( @ )
-      \\|/
-      _|_
-     /   \\""",
         "exp_yield": 135,
         "catch_rate": 90
     },
@@ -690,13 +536,6 @@ CREATURE_SPECIES = {
             35: ["Sky Attack"],
             42: ["Hyper Beam"],
         },
-        "ascii_art": """
-       .---.
-      ( @ @ )
-       \\|||/
-       _|||_
-      /|||||\\
-     / \\___/ \\""",
         "exp_yield": 210,
         "catch_rate": 90
     },
@@ -721,12 +560,6 @@ CREATURE_SPECIES = {
             22: ["Ice Beam"],
             28: ["Hurricane"],
         },
-        "ascii_art": """
-      * *
-     ( ^ )
-    <  |  >
-      / \\
-     ^   ^""",
         "exp_yield": 130,
         "catch_rate": 90
     },
@@ -747,14 +580,6 @@ CREATURE_SPECIES = {
             35: ["Sky Attack"],
             42: ["Blizzard"],
         },
-        "ascii_art": """
-       * * *
-      ( ^_^ )
-     <  |||  >
-      //|\\\\
-     ^^ | ^^
-       / \\
-      ^   ^""",
         "exp_yield": 215,
         "catch_rate": 90
     },
@@ -777,13 +602,6 @@ CREATURE_SPECIES = {
             38: ["Stone Edge"],
             45: ["Meteor Strike"],
         },
-        "ascii_art": """
-     ______
-    [======]
-    | -  - |
-    |  ==  |
-    [======]
-     |    |""",
         "exp_yield": 180,
         "catch_rate": 75
     },
@@ -804,13 +622,6 @@ CREATURE_SPECIES = {
             38: ["Thunder"],
             45: ["Volt Storm"],
         },
-        "ascii_art": """
-      .--.
-     ( ?? )
-    <  ||  >
-     \\ || /
-      \\||/
-       ><""",
         "exp_yield": 175,
         "catch_rate": 75
     },
@@ -831,13 +642,6 @@ CREATURE_SPECIES = {
             38: ["Air Slash"],
             45: ["Fire Blast"],
         },
-        "ascii_art": """
-       /\\
-      /  \\
-     ( o> )
-    <  /\\  >
-     >-||->
-      /  \\""",
         "exp_yield": 185,
         "catch_rate": 75
     },
@@ -858,13 +662,12 @@ CREATURE_SPECIES = {
             38: ["Hurricane"],
             45: ["Sky Attack"],
         },
-        "ascii_art": """
-     ^-----^
-    ( -v v- )
-     \\_____/
-     /|   |\\
-    ^ |   | ^""",
         "exp_yield": 170,
         "catch_rate": 75
     },
 }
+
+# Each species records its own name, so creatures renamed in play (like the
+# boss) still find their art
+for _name, _species in CREATURE_SPECIES.items():
+    _species['name'] = _name
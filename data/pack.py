@@ -0,0 +1,228 @@
+"""
+Data pack - The species and move databases, validated and precompiled
+
+The databases are written as literals in creature_data.py and
+move_data.py. Compiling them checks every entry (fields and their types,
+known types, move pools against the move database, evolutions) and
+derives what the game looks up at runtime, like each species' learnset.
+The result is cached with marshal in data/__pycache__. Like a .pyc file,
+the cache records the mtime and size of the source files: a normal start
+checks those and loads the cache without importing the sources or
+deriving anything. When they differ, the sources are hashed, and only
+a change of content rebuilds the pack.
+
+Check the databases and rebuild the cache: python3 -m data.pack
+"""
+import hashlib
+import marshal
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Any, List, Tuple, Optional
+
+
+DATA_DIR = Path(__file__).parent
+
+# Source files the pack is compiled from
+SOURCES = ("creature_data.py", "move_data.py")
+
+# Bumped when the layout of the compiled pack changes
+PACK_VERSION = 1
+
+CACHE_PATH = DATA_DIR / "__pycache__" / f"datapack.{sys.implementation.cache_tag}.marshal"
+
+# Set to 0 to always compile from the sources (for benchmarks)
+CACHE_ENV = "ASCII_RPG_DATA_CACHE"
+
+# Required fields of each species and move, with their types
+SPECIES_FIELDS = {
+    'type': str, 'base_hp': int, 'base_attack': int, 'base_defense': int,
+    'base_speed': int, 'evolution': dict, 'move_pool': dict, 'exp_yield': int,
+    'catch_rate': int,
+}
+MOVE_FIELDS = {
+    'type': str, 'power': int, 'accuracy': float, 'pp': int, 'category': str,
+    'description': str,
+}
+MOVE_CATEGORIES = ("Physical", "Special")
+
+MAX_LEVEL = 100
+
+
+class DataPackError(ValueError):
+    """The databases failed validation"""
+
+    def __init__(self, problems: List[str]):
+        super().__init__(f"{len(problems)} problem(s) in the game data:\n  " + "\n  ".join(problems))
+        self.problems = problems
+
+
+def source_stats() -> Tuple[int, Tuple[Tuple[int, int], ...]]:
+    """Pack version and the (mtime, size) of each source file a cache was made from"""
+    stats = []
+    for name in SOURCES:
+        stat = (DATA_DIR / name).stat()
+        stats.append((stat.st_mtime_ns, stat.st_size))
+    return PACK_VERSION, tuple(stats)
+
+
+def source_hash() -> str:
+    """Hash of the source files (and pack version) a cache must match"""
+    digest = hashlib.sha256(str(PACK_VERSION).encode())
+    for name in SOURCES:
+        digest.update((DATA_DIR / name).read_bytes())
+    return digest.hexdigest()
+
+
+def _check_fields(kind: str, name: str, entry: Dict[str, Any], fields: Dict[str, type]) -> List[str]:
+    problems = []
+    for field, field_type in fields.items():
+        if field not in entry:
+            problems.append(f"{kind} {name}: missing {field}")
+        elif not isinstance(entry[field], field_type):
+            problems.append(f"{kind} {name}: {field} should be {field_type.__name__}, "
+                            f"not {type(entry[field]).__name__}")
+    return problems
+
+
+def validate(species: Dict[str, Dict], moves: Dict[str, Dict],
+             type_chart: Dict[Tuple[str, str], float]) -> List[str]:
+    """Problems found in the databases (empty if there are none)"""
+    types = {"Normal"} | {name for matchup in type_chart for name in matchup}
+    problems = []
+
+    for name, move in moves.items():
+        problems += _check_fields("Move", name, move, MOVE_FIELDS)
+        if move.get('type') not in types:
+            problems.append(f"Move {name}: unknown type {move.get('type')}")
+        if move.get('category') not in MOVE_CATEGORIES:
+            problems.append(f"Move {name}: unknown category {move.get('category')}")
+        if not 0 < move.get('accuracy', 1.0) <= 1.0:
+            problems.append(f"Move {name}: accuracy must be in (0, 1]")
+        if move.get('pp', 1) <= 0:
+            problems.append(f"Move {name}: pp must be positive")
+
+    for name, entry in species.items():
+        problems += _check_fields("Species", name, entry, SPECIES_FIELDS)
+        if entry.get('type') not in types:
+            problems.append(f"Species {name}: unknown type {entry.get('type')}")
+
+        for level, move_names in entry.get('move_pool', {}).items():
+            if not isinstance(level, int) or not 1 <= level <= MAX_LEVEL:
+                problems.append(f"Species {name}: move pool level {level!r} out of range")
+            for move_name in move_names:
+                if move_name not in moves:
+                    problems.append(f"Species {name}: move pool has unknown move {move_name} (level {level})")
+
+        evolution = entry.get('evolution', {})
+        if evolution.get('evolves_to') is not None:
+            if evolution['evolves_to'] not in species:
+                problems.append(f"Species {name}: evolves into unknown species {evolution['evolves_to']}")
+            if not isinstance(evolution.get('evolve_level'), int):
+                problems.append(f"Species {name}: evolution has no evolve_level")
+
+    return problems
+
+
+def derive_learnsets(species: Dict[str, Dict]) -> Dict[str, List[Tuple[int, str]]]:
+    """Each species' move pool as (level, move name) pairs in learning order"""
+    return {
+        name: [(level, move_name)
+               for level, move_names in sorted(entry.get('move_pool', {}).items())
+               for move_name in move_names]
+        for name, entry in species.items()
+    }
+
+
+def compile_pack() -> Dict[str, Any]:
+    """Import, validate and derive the databases (raises DataPackError)"""
+    from data.creature_data import CREATURE_SPECIES
+    from data.move_data import MOVE_DATABASE, TYPE_EFFECTIVENESS
+
+    problems = validate(CREATURE_SPECIES, MOVE_DATABASE, TYPE_EFFECTIVENESS)
+    if problems:
+        raise DataPackError(problems)
+
+    return {
+        'species': CREATURE_SPECIES,
+        'moves': MOVE_DATABASE,
+        'type_chart': TYPE_EFFECTIVENESS,
+        'learnsets': derive_learnsets(CREATURE_SPECIES),
+    }
+
+
+def _read_cache() -> Optional[Tuple[Any, str, Dict[str, Any]]]:
+    """The cached (source stats, source hash, pack), or None if there is no usable cache"""
+    try:
+        # One read: marshal.load on a file reads it a few bytes at a time
+        with open(CACHE_PATH, 'rb') as f:
+            stats, pack_hash, pack = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return stats, pack_hash, pack
+
+
+def _write_cache(stats: Any, pack_hash: str, pack: Dict[str, Any]):
+    """Cache a compiled pack (skipped where data/ is read-only)"""
+    temp_path = CACHE_PATH.with_name(f"{CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        CACHE_PATH.parent.mkdir(exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            marshal.dump((stats, pack_hash, pack), f)
+        os.replace(temp_path, CACHE_PATH)
+    except OSError:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+
+def load_pack() -> Dict[str, Any]:
+    """Load the compiled pack, compiling and caching it if the sources changed"""
+    if os.environ.get(CACHE_ENV) == "0":
+        return compile_pack()
+
+    stats = source_stats()
+    cached = _read_cache()
+    if cached is not None and cached[0] == stats:
+        return cached[2]
+
+    # The sources were touched (or there is no cache): rebuild only if their content changed
+    pack_hash = source_hash()
+    if cached is not None and cached[1] == pack_hash:
+        pack = cached[2]
+    else:
+        pack = compile_pack()
+    _write_cache(stats, pack_hash, pack)
+    return pack
+
+
+# Tables importable from this module, and their keys in the pack:
+# CREATURE_SPECIES, MOVE_DATABASE, TYPE_EFFECTIVENESS and LEARNSETS
+PACK_TABLES = {
+    'CREATURE_SPECIES': 'species',
+    'MOVE_DATABASE': 'moves',
+    'TYPE_EFFECTIVENESS': 'type_chart',
+    'LEARNSETS': 'learnsets',
+}
+
+
+def __getattr__(name: str):
+    """Load the pack the first time one of its tables is imported"""
+    if name not in PACK_TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    pack = load_pack()
+    globals().update((table, pack[key]) for table, key in PACK_TABLES.items())
+    return globals()[name]
+
+
+if __name__ == "__main__":
+    try:
+        pack = compile_pack()
+    except DataPackError as e:
+        print(e)
+        sys.exit(1)
+
+    _write_cache(source_stats(), source_hash(), pack)
+    print(f"{len(pack['species'])} species and {len(pack['moves'])} moves OK, "
+          f"cached in {CACHE_PATH} ({CACHE_PATH.stat().st_size} bytes)")
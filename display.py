@@ -0,0 +1,350 @@
+"""
+Display module - Output and input backends (terminal and headless)
+"""
+import os
+import re
+import sys
+import select
+import time
+import shutil
+import unicodedata
+from collections import deque
+from typing import Optional, List, Iterable, Tuple
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+
+# ANSI control sequences used by the frame renderer
+CURSOR_HOME = "\x1b[H"
+CLEAR_SCREEN = "\x1b[2J"
+CLEAR_TO_LINE_END = "\x1b[K"
+CLEAR_TO_SCREEN_END = "\x1b[J"
+RESET_ATTRIBUTES = "\x1b[0m"
+
+# Rows kept free below a frame for the prompt line and the Enter that ends it
+PROMPT_ROWS = 2
+
+# Screen size headless runs lay frames out for (columns, lines), whatever
+# terminal they run in, so captured frames are the same on every machine
+HEADLESS_TERMINAL_SIZE = (80, 24)
+
+
+_SGR_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
+_CURSOR_MOVES = re.compile(r"(\n|\r)")
+
+
+def strip_colors(text: str) -> str:
+    """Remove color escape sequences from text"""
+    return _SGR_PATTERN.sub("", text)
+
+
+def split_rows(lines: List[str]) -> List[str]:
+    """
+    Split frame entries into screen rows. Colors set inside a multi-line
+    entry carry over to its following rows, as they would when printed.
+    """
+    rows = []
+    for entry in lines:
+        carry = ""
+        for piece in entry.split("\n"):
+            rows.append(carry + piece)
+            carry += "".join(_SGR_PATTERN.findall(piece))
+            reset = carry.rfind(RESET_ATTRIBUTES)
+            if reset >= 0:
+                carry = carry[reset + len(RESET_ATTRIBUTES):]
+    return rows
+
+
+def _move_cursor(row: int) -> str:
+    """Escape sequence moving the cursor to the start of a 0-based row"""
+    return f"\x1b[{row + 1};1H"
+
+
+def text_width(text: str) -> int:
+    """Columns a piece of text takes on screen (wide characters take two)"""
+    text = strip_colors(text)
+    if text.isascii():
+        return len(text)
+    return sum(2 if unicodedata.east_asian_width(char) in "WF" else 1 for char in text)
+
+
+class FrameRenderer:
+    """
+    Keeps the previous frame and redraws only the rows that changed.
+    Text written below a frame (prompts, battle messages) is followed
+    through note_output, so when it scrolls the screen the next frame is
+    still diffed against the rows where the previous one now sits. Frames
+    taller than the screen keep their bottom rows, the part that stays
+    in view when they are printed line by line.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream
+        self._previous: List[str] = []
+        self._valid = False
+        self._size: Optional[os.terminal_size] = None
+        self._below = 0   # Rows the cursor moved down since the frame was drawn
+        self._column = 0
+
+    def invalidate(self):
+        """Forget the previous frame so the next one is drawn in full"""
+        self._valid = False
+
+    def note_output(self, text: str):
+        """Follow the cursor through text written after the frame"""
+        if not self._valid:
+            return
+        columns = self._size.columns
+        for piece in _CURSOR_MOVES.split(text):
+            if piece == "\n":
+                self._below += 1
+                self._column = 0
+            elif piece == "\r":
+                self._column = 0
+            elif piece:
+                self._column += text_width(piece)
+                if self._column > columns:
+                    self._below += (self._column - 1) // columns
+                    self._column = (self._column - 1) % columns + 1
+
+    def render(self, lines: List[str]):
+        """Draw a frame, given as a list of lines (which may contain newlines)"""
+        lines = split_rows(lines)
+        stream = self.stream or sys.stdout
+
+        size = shutil.get_terminal_size()
+        if size != self._size:
+            self._valid = False
+        height = max(1, size.lines - PROMPT_ROWS)
+        if len(lines) > height:
+            lines = lines[-height:]
+
+        out = []
+        if self._valid:
+            # Whatever was written below the last frame scrolled it up this many rows
+            scrolled = max(0, len(self._previous) + self._below - (size.lines - 1))
+            previous = self._previous[scrolled:]
+        else:
+            previous = []
+            out.append(CURSOR_HOME + CLEAR_SCREEN)
+
+        spilled = False
+        for row, line in enumerate(lines):
+            # A row wider than the screen wraps over the next one, which is then redrawn too
+            if not spilled and row < len(previous) and previous[row] == line:
+                continue
+            out.append(_move_cursor(row) + line + RESET_ATTRIBUTES + CLEAR_TO_LINE_END)
+            spilled = text_width(line) > size.columns
+
+        # Park the cursor below the frame and wipe anything printed after the last one
+        out.append(_move_cursor(len(lines)) + CLEAR_TO_SCREEN_END)
+
+        stream.write("".join(out))
+        stream.flush()
+
+        self._previous = lines
+        self._valid = True
+        self._size = size
+        self._below = 0
+        self._column = 0
+
+
+class DisplayBackend:
+    """Where screen output goes and where player input comes from"""
+
+    headless = False
+
+    def write(self, text: str):
+        """Write text at the cursor"""
+        raise NotImplementedError
+
+    def present(self, lines: List[str]):
+        """Draw a full frame"""
+        raise NotImplementedError
+
+    def clear(self):
+        """Clear the screen"""
+        raise NotImplementedError
+
+    def read_line(self, prompt: str = "") -> str:
+        """Show a prompt and read one line of input"""
+        raise NotImplementedError
+
+    def sleep(self, seconds: float):
+        """Wait between animation frames and messages"""
+        raise NotImplementedError
+
+    def key_pressed(self) -> bool:
+        """Check, without waiting, whether a key was pressed (and consume it)"""
+        return False
+
+    def note_input(self, line: str):
+        """A line of input was read elsewhere, and echoed on screen as it was typed"""
+
+    def terminal_size(self) -> os.terminal_size:
+        """Size of the screen frames are laid out for"""
+        return shutil.get_terminal_size()
+
+
+class TerminalBackend(DisplayBackend):
+    """Draws to stdout and reads from stdin"""
+
+    def __init__(self, stream=None):
+        self.stream = stream
+        self.renderer = FrameRenderer(stream)
+
+    def write(self, text: str):
+        stream = self.stream or sys.stdout
+        stream.write(text)
+        stream.flush()
+        self.renderer.note_output(text)
+
+    def present(self, lines: List[str]):
+        self.renderer.render(lines)
+
+    def clear(self):
+        self.renderer.invalidate()
+        self.write(CURSOR_HOME + CLEAR_SCREEN)
+
+    def read_line(self, prompt: str = "") -> str:
+        line = input(prompt)
+        self.renderer.note_output(prompt)
+        self.note_input(line)
+        return line
+
+    def sleep(self, seconds: float):
+        time.sleep(seconds)
+
+    def key_pressed(self) -> bool:
+        if msvcrt is not None:
+            if msvcrt.kbhit():
+                msvcrt.getwch()
+                return True
+            return False
+
+        # Only poll a real terminal; piped input is saved for prompts. In line
+        # mode the terminal hands input over on Enter, which is then consumed.
+        if not sys.stdin.isatty():
+            return False
+        readable, _, _ = select.select([sys.stdin], [], [], 0)
+        if readable:
+            self.note_input(sys.stdin.readline())
+            return True
+        return False
+
+    def note_input(self, line: str):
+        self.renderer.note_output(line.rstrip("\n") + "\n")
+
+
+class HeadlessBackend(DisplayBackend):
+    """
+    Captures frames in memory and answers prompts from a script, without
+    sleeping. A frame is everything shown from one clear or full redraw to
+    the next; only the last max_frames are kept if max_frames is given.
+    Running out of scripted input raises EOFError, like input() would.
+    """
+
+    headless = True
+
+    def __init__(self, inputs: Iterable[str] = (), max_frames: Optional[int] = None,
+                 size: Tuple[int, int] = HEADLESS_TERMINAL_SIZE):
+        self.size = os.terminal_size(size)
+        self.frames = deque([""], maxlen=max_frames)
+        self.frame_count = 0
+        self.prompts: List[str] = []
+        self.slept = 0.0
+        self._inputs = iter(inputs)
+
+    def write(self, text: str):
+        self.frames[-1] += text
+
+    def present(self, lines: List[str]):
+        self.frame_count += 1
+        self.frames.append("\n".join(split_rows(lines)) + "\n")
+
+    def clear(self):
+        self.frame_count += 1
+        self.frames.append("")
+
+    def read_line(self, prompt: str = "") -> str:
+        self.write(prompt)
+        self.prompts.append(prompt)
+        try:
+            line = next(self._inputs)
+        except StopIteration:
+            raise EOFError("Scripted input exhausted") from None
+        self.write(line + "\n")
+        return line
+
+    def sleep(self, seconds: float):
+        self.slept += seconds
+
+    def terminal_size(self) -> os.terminal_size:
+        return self.size
+
+    @property
+    def last_frame(self) -> str:
+        """The most recent frame, without color codes"""
+        return strip_colors(self.frames[-1])
+
+
+_backend: Optional[DisplayBackend] = None
+
+
+def get_backend() -> DisplayBackend:
+    """Get the active display backend (a terminal one unless set otherwise)"""
+    global _backend
+    if _backend is None:
+        _backend = TerminalBackend()
+    return _backend
+
+
+def set_backend(backend: DisplayBackend) -> Optional[DisplayBackend]:
+    """Switch the active display backend, returning the previous one"""
+    global _backend
+    previous = _backend
+    _backend = backend
+    return previous
+
+
+def write(text: str):
+    """Write text as a single write"""
+    get_backend().write(text)
+
+
+def echo(*values, sep: str = " ", end: str = "\n", flush: bool = True):
+    """print() through the active backend"""
+    get_backend().write(sep.join(str(value) for value in values) + end)
+
+
+def prompt(text: str = "") -> str:
+    """input() through the active backend"""
+    return get_backend().read_line(text)
+
+
+def pause(seconds: float):
+    """time.sleep() through the active backend (skipped when headless)"""
+    get_backend().sleep(seconds)
+
+
+def key_pressed() -> bool:
+    """Check for a keypress through the active backend (never one when headless)"""
+    return get_backend().key_pressed()
+
+
+def terminal_size() -> os.terminal_size:
+    """Screen size of the active backend (a fixed one when headless)"""
+    return get_backend().terminal_size()
+
+
+def present(lines: List[str]):
+    """Draw a full frame through the active backend"""
+    get_backend().present(lines)
+
+
+def clear():
+    """Clear the screen through the active backend"""
+    get_backend().clear()
@@ -0,0 +1,446 @@
+"""
+Events module - Typed game events and the reducer that applies them
+
+Changes to the player's state are events. The game applies them to the
+live Player (Player.apply), which logs each one for the journal, so a save
+is a snapshot plus the events after it. reduce() applies an event to save
+data (the dict built by save_system.snapshot_game) without modifying it;
+replaying a save's events rebuilds the state at any point since it was
+written.
+
+Battle changes to the party's creatures (damage, healing, PP, EXP,
+levels, moves, evolution) are events too. Settings and the world are
+not dispatched one by one: when actions are journaled, diff_events()
+turns what changed into settings and world events. Anything else it
+finds changed is drift (a change made without an event, or an event
+whose apply and reduce disagree) and is journaled as a correction.
+
+Show a save's events: python3 events.py <save name> [--all] [--at N]
+"""
+from typing import NamedTuple, Dict, Any, List, Iterable, Optional
+
+from creatures import Creature, calculate_stat
+from moves import MOVE_DATABASE
+
+
+State = Dict[str, Any]
+
+# Creature lists in a save
+CREATURE_GROUPS = ('party', 'storage')
+
+PARTY_SIZE = 6
+
+
+class Moved(NamedTuple):
+    """The player moved"""
+    player_x: int
+    player_y: int
+
+    OP = 'position'
+
+    def apply(self, player):
+        player.x = self.player_x
+        player.y = self.player_y
+
+    def reduce(self, state: State) -> State:
+        return dict(state, player_x=self.player_x, player_y=self.player_y)
+
+
+class ItemsSet(NamedTuple):
+    """The player's items were set (restocked, or after a defeat)"""
+    pokeballs: int
+    potions: int
+
+    OP = 'items'
+
+    def apply(self, player):
+        player.pokeballs = self.pokeballs
+        player.potions = self.potions
+
+    def reduce(self, state: State) -> State:
+        return dict(state, pokeballs=self.pokeballs, potions=self.potions)
+
+
+class ItemUsed(NamedTuple):
+    """The player used one item ('pokeballs' or 'potions')"""
+    item: str
+
+    OP = 'item_used'
+
+    def apply(self, player):
+        setattr(player, self.item, getattr(player, self.item) - 1)
+
+    def reduce(self, state: State) -> State:
+        return dict(state, **{self.item: state[self.item] - 1})
+
+
+class SettingsChanged(NamedTuple):
+    """Game settings changed"""
+    text_speed: str
+
+    OP = 'settings'
+
+    def apply(self, player):
+        from visuals import set_text_speed
+        set_text_speed(self.text_speed)
+
+    def reduce(self, state: State) -> State:
+        return dict(state, text_speed=self.text_speed)
+
+
+class CreatureAdded(NamedTuple):
+    """
+    The player got a creature (a Creature when dispatched, its saved state
+    once journaled). It joins the party, or storage if the party is full.
+    """
+    creature: Any
+
+    OP = 'creature_added'
+
+    def apply(self, player) -> bool:
+        group = player.party if len(player.party) < PARTY_SIZE else player.storage
+        group.append(self.creature)
+        return group is player.party
+
+    def reduce(self, state: State) -> State:
+        group = 'party' if len(state['party']) < PARTY_SIZE else 'storage'
+        return dict(state, **{group: state[group] + [self.creature]})
+
+    def to_entry(self) -> Dict[str, Any]:
+        creature = self.creature
+        if isinstance(creature, Creature):
+            creature = creature.saved_state()
+        return {'op': self.OP, 'creature': creature}
+
+
+class PartyHealed(NamedTuple):
+    """The party was fully healed, with PP restored"""
+
+    OP = 'healed'
+
+    def apply(self, player):
+        for creature in player.party:
+            creature.heal()
+            creature.restore_pp()
+
+    def reduce(self, state: State) -> State:
+        from data.pack import CREATURE_SPECIES
+
+        party = []
+        for creature in state['party']:
+            base_hp = CREATURE_SPECIES.get(creature['species_name'], {}).get('base_hp', 45)
+            moves = [dict(move, current_pp=MOVE_DATABASE.get(move['name'], {}).get('pp', move['current_pp']))
+                     for move in creature['moves']]
+            party.append(dict(creature, current_hp=calculate_stat(base_hp, creature['level']),
+                              moves=moves))
+        return dict(state, party=party)
+
+
+def _max_hp(creature: Dict[str, Any], species_name: Optional[str] = None) -> int:
+    """Max HP of a saved creature (as another species if given)"""
+    from data.pack import CREATURE_SPECIES
+
+    species = CREATURE_SPECIES.get(species_name or creature['species_name'], {})
+    return calculate_stat(species.get('base_hp', 45), creature['level'])
+
+
+def _change_creature(state: State, index: int, **changes) -> State:
+    """State with a party creature's fields changed"""
+    party = list(state['party'])
+    party[index] = dict(party[index], **changes)
+    return dict(state, party=party)
+
+
+class Damaged(NamedTuple):
+    """A party creature took damage"""
+    index: int
+    amount: int
+
+    OP = 'damaged'
+
+    def apply(self, player):
+        player.party[self.index].take_damage(self.amount)
+
+    def reduce(self, state: State) -> State:
+        creature = state['party'][self.index]
+        return _change_creature(state, self.index, current_hp=max(0, creature['current_hp'] - self.amount))
+
+
+class Healed(NamedTuple):
+    """A party creature recovered HP (a potion)"""
+    index: int
+    amount: int
+
+    OP = 'hp_healed'
+
+    def apply(self, player):
+        player.party[self.index].heal(self.amount)
+
+    def reduce(self, state: State) -> State:
+        creature = state['party'][self.index]
+        return _change_creature(state, self.index,
+                                current_hp=min(_max_hp(creature), creature['current_hp'] + self.amount))
+
+
+class PpUsed(NamedTuple):
+    """A party creature used a move (by its slot)"""
+    index: int
+    move: int
+
+    OP = 'pp_used'
+
+    def apply(self, player) -> bool:
+        return player.party[self.index].moves[self.move].use()
+
+    def reduce(self, state: State) -> State:
+        moves = list(state['party'][self.index]['moves'])
+        move = moves[self.move]
+        moves[self.move] = dict(move, current_pp=max(0, move['current_pp'] - 1))
+        return _change_creature(state, self.index, moves=moves)
+
+
+class ExpGained(NamedTuple):
+    """A party creature gained experience"""
+    index: int
+    amount: int
+
+    OP = 'exp'
+
+    def apply(self, player) -> bool:
+        return player.party[self.index].gain_exp(self.amount)
+
+    def reduce(self, state: State) -> State:
+        creature = state['party'][self.index]
+        return _change_creature(state, self.index, exp=creature['exp'] + self.amount)
+
+
+class LeveledUp(NamedTuple):
+    """A party creature grew a level (EXP resets, HP is refilled)"""
+    index: int
+
+    OP = 'level_up'
+
+    def apply(self, player) -> Dict[str, int]:
+        return player.party[self.index].level_up()
+
+    def reduce(self, state: State) -> State:
+        creature = dict(state['party'][self.index], exp=0)
+        creature['level'] += 1
+        creature['current_hp'] = _max_hp(creature)
+        return _change_creature(state, self.index, **creature)
+
+
+class MoveLearned(NamedTuple):
+    """A party creature learned a move into a slot (one past the last to add it)"""
+    index: int
+    slot: int
+    move: str
+
+    OP = 'move_learned'
+
+    def apply(self, player):
+        from moves import Move
+
+        moves = player.party[self.index].moves
+        if self.slot < len(moves):
+            moves[self.slot] = Move.from_database(self.move)
+        else:
+            moves.append(Move.from_database(self.move))
+
+    def reduce(self, state: State) -> State:
+        moves = list(state['party'][self.index]['moves'])
+        move = {'name': self.move, 'current_pp': MOVE_DATABASE[self.move]['pp']}
+        if self.slot < len(moves):
+            moves[self.slot] = move
+        else:
+            moves.append(move)
+        return _change_creature(state, self.index, moves=moves)
+
+
+class Evolved(NamedTuple):
+    """A party creature evolved (its HP keeps the same share of max HP)"""
+    index: int
+    species_name: str
+
+    OP = 'evolved'
+
+    def apply(self, player):
+        player.party[self.index].evolve(self.species_name)
+
+    def reduce(self, state: State) -> State:
+        creature = state['party'][self.index]
+        old_max_hp = _max_hp(creature)
+        share = creature['current_hp'] / old_max_hp if old_max_hp > 0 else 1.0
+        return _change_creature(state, self.index, species_name=self.species_name,
+                                current_hp=int(_max_hp(creature, self.species_name) * share))
+
+
+class GroupResized(NamedTuple):
+    """The party or storage was cut down to a size"""
+    group: str
+    size: int
+
+    OP = 'size'
+
+    def apply(self, player):
+        del getattr(player, self.group)[self.size:]
+
+    def reduce(self, state: State) -> State:
+        return dict(state, **{self.group: state[self.group][:self.size]})
+
+
+class CreatureChanged(NamedTuple):
+    """
+    A creature in the party or storage changed (or was appended at index)
+    without an event saying how: a drift correction
+    """
+    group: str
+    index: int
+    creature: Dict[str, Any]
+
+    OP = 'creature'
+
+    def apply(self, player):
+        data = self.creature
+        creature = Creature.from_saved_state(
+            data['species_name'], data['level'], data['current_hp'], data['exp'],
+            ((move['name'], move['current_pp']) for move in data['moves']))
+        group = getattr(player, self.group)
+        if self.index < len(group):
+            group[self.index] = creature
+        else:
+            group.append(creature)
+
+    def reduce(self, state: State) -> State:
+        group = list(state[self.group])
+        if self.index < len(group):
+            group[self.index] = self.creature
+        else:
+            group.append(self.creature)
+        return dict(state, **{self.group: group})
+
+
+class WorldChanged(NamedTuple):
+    """
+    Tiles or flags of the world changed (its saved state, see
+    GameWorld.saved_state). The world is changed through GameWorld itself,
+    so this is only recorded.
+    """
+    world: Dict[str, Any]
+
+    OP = 'world'
+
+    def reduce(self, state: State) -> State:
+        return dict(state, world=self.world)
+
+
+EVENT_TYPES = {event_type.OP: event_type for event_type in (
+    Moved, ItemsSet, ItemUsed, SettingsChanged, CreatureAdded, PartyHealed,
+    Damaged, Healed, PpUsed, ExpGained, LeveledUp, MoveLearned, Evolved,
+    GroupResized, CreatureChanged, WorldChanged)}
+
+# Changes journaled by diffing rather than dispatched; a diff finding
+# anything else is drift
+DIFFED_EVENTS = (SettingsChanged, WorldChanged)
+
+
+def to_entry(event) -> Dict[str, Any]:
+    """An event as a journal entry"""
+    if hasattr(event, 'to_entry'):
+        return event.to_entry()
+    return {'op': event.OP, **event._asdict()}
+
+
+def from_entry(entry: Dict[str, Any]):
+    """The event a journal entry records"""
+    event_type = EVENT_TYPES[entry['op']]
+    return event_type(**{field: entry[field] for field in event_type._fields})
+
+
+def reduce(state: State, event) -> State:
+    """The state after an event (the state passed in is left as it was)"""
+    return event.reduce(state)
+
+
+def replay(state: State, entries: Iterable[Dict[str, Any]]) -> State:
+    """Apply journal entries in order (snapshot markers are skipped)"""
+    for entry in entries:
+        if entry['op'] in EVENT_TYPES:
+            state = reduce(state, from_entry(entry))
+    return state
+
+
+def diff_events(old: State, new: State) -> List[Any]:
+    """Events taking state old to new"""
+    events = []
+    for event_type in (Moved, ItemsSet, SettingsChanged, WorldChanged):
+        if any(old.get(field) != new.get(field) for field in event_type._fields):
+            events.append(event_type(**{field: new.get(field) for field in event_type._fields}))
+
+    for group in CREATURE_GROUPS:
+        before, after = old.get(group, []), new.get(group, [])
+        if len(before) > len(after):
+            events.append(GroupResized(group, len(after)))
+        for index, creature in enumerate(after):
+            if index >= len(before) or before[index] != creature:
+                events.append(CreatureChanged(group, index, creature))
+    return events
+
+
+def is_drift(event) -> bool:
+    """Whether a diff event corrects drift rather than recording a diffed change"""
+    return not isinstance(event, DIFFED_EVENTS)
+
+
+def describe(event) -> str:
+    """One line for the event log"""
+    if isinstance(event, (CreatureAdded, CreatureChanged)):
+        creature = event.creature
+        fields = [f"{creature['species_name']} Lv.{creature['level']} HP {creature['current_hp']}"]
+        if isinstance(event, CreatureChanged):
+            fields.insert(0, f"{event.group}[{event.index}]")
+        return f"{event.OP}: {' '.join(fields)}"
+    values = ", ".join(f"{field}={value}" for field, value in event._asdict().items())
+    return f"{event.OP}: {values}" if values else event.OP
+
+
+if __name__ == "__main__":
+    import argparse
+    import save_system
+
+    parser = argparse.ArgumentParser(description="Show the events journaled for a save")
+    parser.add_argument("name", help="save name")
+    parser.add_argument("--all", action="store_true",
+                        help="show the whole history, not just the events since the last save")
+    parser.add_argument("--at", type=int, metavar="N",
+                        help="show the state after the first N entries")
+    args = parser.parse_args()
+
+    history = save_system.read_event_history(args.name) if args.all else None
+    if args.all and history is None:
+        print(f"{args.name} has no history, showing the events since its last save")
+    if history is not None:
+        snapshot, entries = history
+        print(f"{args.name}: history from {snapshot['timestamp']}, {len(entries)} entries since")
+    else:
+        snapshot, entries = save_system.read_event_log(args.name)
+        print(f"{args.name}: saved {snapshot['timestamp']}, {len(entries)} events since")
+
+    for number, entry in enumerate(entries, 1):
+        if entry['op'] == 'snapshot':
+            line = f"saved {entry['timestamp']}"
+        else:
+            line = describe(from_entry(entry)) + ("  (drift)" if entry.get('drift') else "")
+        print(f"  {number:4} {entry.get('t', ''):26} {line}")
+
+    if args.at is not None:
+        if history is not None:
+            state = save_system.history_state(history, args.at)
+        else:
+            state = replay(snapshot, entries[:args.at])
+        print(f"\nAfter {min(args.at, len(entries))} entries: position ({state['player_x']}, "
+              f"{state['player_y']}), {state['pokeballs']} Pokeballs, {state['potions']} Potions")
+        for group in CREATURE_GROUPS:
+            names = ", ".join(f"{c['species_name']} Lv.{c['level']} ({c['current_hp']} HP)"
+                              for c in state[group])
+            print(f"  {group}: {names or '-'}")
@@ -0,0 +1,157 @@
+"""
+Journal module - Append-only log of game events between saves
+
+Each line is one JSON entry: a game event (see events), so replaying them
+in order on top of a save brings it up to date. A snapshot entry marks
+where a save was taken: entries after the marker for a save's timestamp
+are the changes made since that save.
+
+Compaction moves entries older than the last save to the history file
+next to the journal instead of deleting them. Snapshot markers are
+numbered, and every STATE_EVERY-th one (starting with the first) also
+holds that save's state, so the game at any point of the history is
+rebuilt by replaying from the nearest marker with a state before it.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+
+# Snapshot markers keep the save's full state every this many saves
+STATE_EVERY = 10
+
+
+class Journal:
+    """
+    The journal file of one save. Appends are flushed to the OS right away
+    (they survive the game crashing, not the machine); compaction rewrites
+    the file atomically. Safe to use from the game thread and the save worker.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.history_path = self.path.with_suffix(".history")
+        self._file = None
+        self._lock = threading.Lock()
+        self._saves: Optional[int] = None  # Number of the last snapshot marker, once known
+
+    def _open_for_append(self, path: Optional[Path] = None):
+        """Open a file for appending, first cutting off a torn last line left by a crash"""
+        path = path or self.path
+        try:
+            with open(path, 'rb+') as f:
+                data = f.read()
+                if data and not data.endswith(b"\n"):
+                    f.truncate(data.rfind(b"\n") + 1)
+        except FileNotFoundError:
+            pass
+        return open(path, 'a')
+
+    def _write(self, entries: List[Dict[str, Any]]):
+        if self._file is None:
+            self._file = self._open_for_append()
+        self._file.write("".join(json.dumps(entry, separators=(',', ':')) + "\n"
+                                 for entry in entries))
+        self._file.flush()
+
+    def append(self, entries: List[Dict[str, Any]]):
+        """Append entries to the journal"""
+        with self._lock:
+            self._write(entries)
+
+    def mark_snapshot(self, timestamp: str, state: Optional[Dict[str, Any]] = None):
+        """
+        Record that a save with this timestamp was taken here. Its state is
+        kept in the marker every STATE_EVERY saves.
+        """
+        with self._lock:
+            if self._saves is None:
+                # Compaction leaves the last marker in the journal, so the history is not read
+                self._saves = _last_marker_number(self._read())
+            self._saves = 0 if self._saves is None else self._saves + 1
+            entry = {'op': 'snapshot', 'timestamp': timestamp, 'save': self._saves}
+            if state is not None and self._saves % STATE_EVERY == 0:
+                entry['state'] = state
+            self._write([entry])
+
+    def _read(self, path: Optional[Path] = None) -> List[Dict[str, Any]]:
+        try:
+            with open(path or self.path, 'r') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return []
+
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue  # A torn line from a crash mid-append
+        return entries
+
+    def entries_since(self, timestamp: str) -> List[Dict[str, Any]]:
+        """Changes made after the save with this timestamp (none if it is not journaled)"""
+        with self._lock:
+            entries = self._read()
+        start = _marker_index(entries, timestamp)
+        if start is None:
+            return []
+        return [entry for entry in entries[start + 1:] if entry['op'] != 'snapshot']
+
+    def history(self) -> List[Dict[str, Any]]:
+        """Every entry kept for the save: the history file, then the journal"""
+        with self._lock:
+            return self._read(self.history_path) + self._read()
+
+    def compact(self, timestamp: str):
+        """Move everything before the marker of a save that has been written to the history file"""
+        with self._lock:
+            entries = self._read()
+            start = _marker_index(entries, timestamp)
+            if not start:
+                return
+            self.close_file()
+            with self._open_for_append(self.history_path) as f:
+                f.write("".join(json.dumps(entry, separators=(',', ':')) + "\n"
+                                for entry in entries[:start]))
+            temp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(temp_path, 'w') as f:
+                f.write("".join(json.dumps(entry, separators=(',', ':')) + "\n"
+                                for entry in entries[start:]))
+            os.replace(temp_path, self.path)
+
+    def close_file(self):
+        """Close the append handle (it is reopened on the next append)"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def delete(self):
+        """Remove the journal and history files"""
+        with self._lock:
+            self.close_file()
+            self._saves = None
+            for path in (self.path, self.history_path):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
+
+def _last_marker_number(entries: List[Dict[str, Any]]) -> Optional[int]:
+    """Number of the last snapshot marker (None if there is none, or it is not numbered)"""
+    for entry in reversed(entries):
+        if entry['op'] == 'snapshot':
+            return entry.get('save')
+    return None
+
+
+def _marker_index(entries: List[Dict[str, Any]], timestamp: str) -> Optional[int]:
+    """Index of the last snapshot marker for a timestamp"""
+    for index in range(len(entries) - 1, -1, -1):
+        entry = entries[index]
+        if entry['op'] == 'snapshot' and entry['timestamp'] == timestamp:
+            return index
+    return None
@@ -1,26 +1,16 @@
 """
 Menu system - Main menu, save/load interface
 """
-import time
-from typing import Optional, Tuple
-from visuals import clear_screen, print_slow, colored_text
+from typing import Optional, Tuple, List
+from display import echo, prompt, pause
+from visuals import render_frame, print_slow, colored_text, get_text_speed, cycle_text_speed
 from save_system import list_saves, delete_save
+from terminal import Fore, Style
 from datetime import datetime
 
-try:
-    from colorama import Fore, Style
-except ImportError:
-    class Fore:
-        RED = BLUE = GREEN = YELLOW = CYAN = MAGENTA = WHITE = ""
-        LIGHTRED_EX = LIGHTBLUE_EX = LIGHTGREEN_EX = LIGHTYELLOW_EX = ""
-
-    class Style:
-        BRIGHT = RESET_ALL = ""
-
-
-def show_title_screen():
-    """Display the game title screen"""
-    clear_screen()
+def title_screen_lines() -> List[str]:
+    """Build the lines of the game title screen"""
+    lines = []
 
     title = f"""
 {Fore.YELLOW}    ╔═══════════════════════════════════════════════════════════╗
@@ -32,7 +22,7 @@ def show_title_screen():
     ╚═══════════════════════════════════════════════════════════╝{Style.RESET_ALL}
     """
 
-    print(title)
+    lines.append(title)
 
     # Animated creatures
     creatures = [
@@ -41,11 +31,18 @@ def show_title_screen():
         (f"{Fore.GREEN}🌱 Leaflet{Style.RESET_ALL}", "Grass Starter"),
     ]
 
-    print(f"\n{' '*20}{Fore.CYAN}Featured Creatures:{Style.RESET_ALL}")
+    lines.append(f"\n{' '*20}{Fore.CYAN}Featured Creatures:{Style.RESET_ALL}")
     for name, desc in creatures:
-        print(f"{' '*22}{name} - {desc}")
+        lines.append(f"{' '*22}{name} - {desc}")
+
+    lines.append(f"\n{Fore.WHITE}" + "═" * 65 + Style.RESET_ALL)
 
-    print(f"\n{Fore.WHITE}" + "═" * 65 + Style.RESET_ALL)
+    return lines
+
+
+def show_title_screen():
+    """Display the game title screen"""
+    render_frame(title_screen_lines())
 
 
 def show_main_menu() -> str:
@@ -53,18 +50,19 @@ def show_main_menu() -> str:
     Display main menu and get user choice
     Returns: 'new', 'load', or 'quit'
     """
-    show_title_screen()
+    lines = title_screen_lines()
 
-    print(f"\n{' '*22}{Fore.YELLOW}╔═══════════════════════╗")
-    print(f"{' '*22}║{Fore.WHITE}     MAIN MENU       {Fore.YELLOW}║")
-    print(f"{' '*22}╠═══════════════════════╣{Style.RESET_ALL}")
-    print(f"{' '*22}{Fore.YELLOW}║{Style.RESET_ALL}  1. {Fore.GREEN}New Game{Style.RESET_ALL}         {Fore.YELLOW}║")
-    print(f"{' '*22}{Fore.YELLOW}║{Style.RESET_ALL}  2. {Fore.CYAN}Load Game{Style.RESET_ALL}        {Fore.YELLOW}║")
-    print(f"{' '*22}{Fore.YELLOW}║{Style.RESET_ALL}  3. {Fore.RED}Quit{Style.RESET_ALL}             {Fore.YELLOW}║")
-    print(f"{' '*22}╚═══════════════════════╝{Style.RESET_ALL}")
+    lines.append(f"\n{' '*22}{Fore.YELLOW}╔═══════════════════════╗")
+    lines.append(f"{' '*22}║{Fore.WHITE}     MAIN MENU       {Fore.YELLOW}║")
+    lines.append(f"{' '*22}╠═══════════════════════╣{Style.RESET_ALL}")
+    lines.append(f"{' '*22}{Fore.YELLOW}║{Style.RESET_ALL}  1. {Fore.GREEN}New Game{Style.RESET_ALL}         {Fore.YELLOW}║")
+    lines.append(f"{' '*22}{Fore.YELLOW}║{Style.RESET_ALL}  2. {Fore.CYAN}Load Game{Style.RESET_ALL}        {Fore.YELLOW}║")
+    lines.append(f"{' '*22}{Fore.YELLOW}║{Style.RESET_ALL}  3. {Fore.RED}Quit{Style.RESET_ALL}             {Fore.YELLOW}║")
+    lines.append(f"{' '*22}╚═══════════════════════╝{Style.RESET_ALL}")
+    render_frame(lines)
 
     while True:
-        choice = input(f"\n{' '*22}Choose an option (1-3): ").strip()
+        choice = prompt(f"\n{' '*22}Choose an option (1-3): ").strip()
 
         if choice == '1':
             return 'new'
@@ -73,7 +71,7 @@ def show_main_menu() -> str:
         elif choice == '3':
             return 'quit'
         else:
-            print(f"{' '*22}{Fore.RED}Invalid choice! Please enter 1, 2, or 3.{Style.RESET_ALL}")
+            echo(f"{' '*22}{Fore.RED}Invalid choice! Please enter 1, 2, or 3.{Style.RESET_ALL}")
 
 
 def show_load_menu() -> Optional[str]:
@@ -81,21 +79,22 @@ def show_load_menu() -> Optional[str]:
     Display load game menu
     Returns: save_name to load, or None if cancelled
     """
-    clear_screen()
+    lines = []
 
-    print(f"\n{Fore.YELLOW}    ╔═══════════════════════════════════════════════════════════╗")
-    print(f"    ║{Fore.WHITE}                      LOAD GAME                          {Fore.YELLOW}║")
-    print(f"    ╚═══════════════════════════════════════════════════════════╝{Style.RESET_ALL}\n")
+    lines.append(f"\n{Fore.YELLOW}    ╔═══════════════════════════════════════════════════════════╗")
+    lines.append(f"    ║{Fore.WHITE}                      LOAD GAME                          {Fore.YELLOW}║")
+    lines.append(f"    ╚═══════════════════════════════════════════════════════════╝{Style.RESET_ALL}\n")
 
-    saves = list_saves()
+    saves = list_saves(verify=True)
 
     if not saves:
-        print(f"    {Fore.RED}No saved games found!{Style.RESET_ALL}\n")
-        input("    Press Enter to return to main menu...")
+        lines.append(f"    {Fore.RED}No saved games found!{Style.RESET_ALL}\n")
+        render_frame(lines)
+        prompt("    Press Enter to return to main menu...")
         return None
 
     # Display saves
-    print(f"    {Fore.CYAN}Available Saves:{Style.RESET_ALL}\n")
+    lines.append(f"    {Fore.CYAN}Available Saves:{Style.RESET_ALL}\n")
 
     for i, save in enumerate(saves, 1):
         timestamp = save['timestamp']
@@ -105,16 +104,19 @@ def show_load_menu() -> Optional[str]:
         except:
             time_str = "Unknown"
 
-        print(f"    {Fore.YELLOW}{i}.{Style.RESET_ALL} {Fore.WHITE}{save['player_name']}{Style.RESET_ALL}")
-        print(f"       Party: {save['party_size']} creatures | " +
-              f"Highest Level: {save['level']} | " +
-              f"Saved: {time_str}")
-        print(f"       {Fore.LIGHTBLACK_EX}File: {save['name']}{Style.RESET_ALL}\n")
+        lines.append(f"    {Fore.YELLOW}{i}.{Style.RESET_ALL} {Fore.WHITE}{save['player_name']}{Style.RESET_ALL}")
+        if save.get('corrupted'):
+            lines.append(f"       {Fore.RED}⚠ CORRUPTED - its backup will be loaded if it has one{Style.RESET_ALL}")
+        lines.append(f"       Party: {save['party_size']} creatures | " +
+                     f"Highest Level: {save['level']} | " +
+                     f"Saved: {time_str}")
+        lines.append(f"       {Fore.LIGHTBLACK_EX}File: {save['name']}{Style.RESET_ALL}\n")
 
-    print(f"    {Fore.YELLOW}{len(saves) + 1}.{Style.RESET_ALL} {Fore.RED}Cancel (Return to Menu){Style.RESET_ALL}\n")
+    lines.append(f"    {Fore.YELLOW}{len(saves) + 1}.{Style.RESET_ALL} {Fore.RED}Cancel (Return to Menu){Style.RESET_ALL}\n")
+    render_frame(lines)
 
     while True:
-        choice = input(f"    Choose a save to load (1-{len(saves) + 1}): ").strip()
+        choice = prompt(f"    Choose a save to load (1-{len(saves) + 1}): ").strip()
 
         try:
             choice_num = int(choice)
@@ -123,9 +125,9 @@ def show_load_menu() -> Optional[str]:
             elif choice_num == len(saves) + 1:
                 return None
             else:
-                print(f"    {Fore.RED}Invalid choice!{Style.RESET_ALL}")
+                echo(f"    {Fore.RED}Invalid choice!{Style.RESET_ALL}")
         except ValueError:
-            print(f"    {Fore.RED}Please enter a number!{Style.RESET_ALL}")
+            echo(f"    {Fore.RED}Please enter a number!{Style.RESET_ALL}")
 
 
 def show_pause_menu(player, world) -> str:
@@ -133,24 +135,27 @@ def show_pause_menu(player, world) -> str:
     Display in-game pause menu
     Returns: 'resume', 'save', 'save_quit', or 'quit'
     """
-    clear_screen()
-
-    print(f"\n{Fore.YELLOW}    ╔═══════════════════════════════════════╗")
-    print(f"    ║{Fore.WHITE}           GAME PAUSED              {Fore.YELLOW}║")
-    print(f"    ╠═══════════════════════════════════════╣{Style.RESET_ALL}")
-    print(f"    {Fore.YELLOW}║{Style.RESET_ALL}  1. {Fore.GREEN}Resume Game{Style.RESET_ALL}               {Fore.YELLOW}║")
-    print(f"    {Fore.YELLOW}║{Style.RESET_ALL}  2. {Fore.CYAN}Save Game{Style.RESET_ALL}                 {Fore.YELLOW}║")
-    print(f"    {Fore.YELLOW}║{Style.RESET_ALL}  3. {Fore.YELLOW}Save & Quit to Menu{Style.RESET_ALL}       {Fore.YELLOW}║")
-    print(f"    {Fore.YELLOW}║{Style.RESET_ALL}  4. {Fore.RED}Quit Without Saving{Style.RESET_ALL}       {Fore.YELLOW}║")
-    print(f"    ╚═══════════════════════════════════════╝{Style.RESET_ALL}")
-
-    # Show player info
-    print(f"\n    {Fore.WHITE}Trainer: {player.name}")
-    print(f"    Position: ({player.x}, {player.y})")
-    print(f"    Party: {len(player.party)} creatures{Style.RESET_ALL}\n")
-
     while True:
-        choice = input(f"    Choose an option (1-4): ").strip()
+        speed = f"Text Speed: {get_text_speed().title()}"
+        lines = []
+
+        lines.append(f"\n{Fore.YELLOW}    ╔═══════════════════════════════════════╗")
+        lines.append(f"    ║{Fore.WHITE}           GAME PAUSED              {Fore.YELLOW}║")
+        lines.append(f"    ╠═══════════════════════════════════════╣{Style.RESET_ALL}")
+        lines.append(f"    {Fore.YELLOW}║{Style.RESET_ALL}  1. {Fore.GREEN}Resume Game{Style.RESET_ALL}               {Fore.YELLOW}║")
+        lines.append(f"    {Fore.YELLOW}║{Style.RESET_ALL}  2. {Fore.CYAN}Save Game{Style.RESET_ALL}                 {Fore.YELLOW}║")
+        lines.append(f"    {Fore.YELLOW}║{Style.RESET_ALL}  3. {Fore.YELLOW}Save & Quit to Menu{Style.RESET_ALL}       {Fore.YELLOW}║")
+        lines.append(f"    {Fore.YELLOW}║{Style.RESET_ALL}  4. {Fore.RED}Quit Without Saving{Style.RESET_ALL}       {Fore.YELLOW}║")
+        lines.append(f"    {Fore.YELLOW}║{Style.RESET_ALL}  5. {Fore.WHITE}{speed:<26}{Style.RESET_ALL}{Fore.YELLOW}║")
+        lines.append(f"    ╚═══════════════════════════════════════╝{Style.RESET_ALL}")
+
+        # Show player info
+        lines.append(f"\n    {Fore.WHITE}Trainer: {player.name}")
+        lines.append(f"    Position: ({player.x}, {player.y})")
+        lines.append(f"    Party: {len(player.party)} creatures{Style.RESET_ALL}\n")
+        render_frame(lines)
+
+        choice = prompt(f"    Choose an option (1-5): ").strip()
 
         if choice == '1':
             return 'resume'
@@ -160,45 +165,49 @@ def show_pause_menu(player, world) -> str:
             return 'save_quit'
         elif choice == '4':
             # Confirm quit without saving
-            confirm = input(f"\n    {Fore.RED}Quit without saving? (y/n): {Style.RESET_ALL}").lower()
+            confirm = prompt(f"\n    {Fore.RED}Quit without saving? (y/n): {Style.RESET_ALL}").lower()
             if confirm == 'y':
                 return 'quit'
+        elif choice == '5':
+            cycle_text_speed()
         else:
-            print(f"    {Fore.RED}Invalid choice!{Style.RESET_ALL}")
+            echo(f"    {Fore.RED}Invalid choice!{Style.RESET_ALL}")
+            pause(1)
 
 
 def show_save_confirmation(player_name: str, success: bool):
     """Show save confirmation message"""
     if success:
-        print(f"\n    {Fore.GREEN}✓ Game saved successfully!{Style.RESET_ALL}")
+        echo(f"\n    {Fore.GREEN}✓ Game saved successfully!{Style.RESET_ALL}")
     else:
-        print(f"\n    {Fore.RED}✗ Failed to save game!{Style.RESET_ALL}")
+        echo(f"\n    {Fore.RED}✗ Failed to save game!{Style.RESET_ALL}")
 
-    time.sleep(1.5)
+    pause(1.5)
 
 
 def show_game_over_screen(player):
     """Display game over / game complete screen"""
-    clear_screen()
+    lines = []
 
-    print(f"\n{Fore.YELLOW}    ╔═══════════════════════════════════════════════════════════╗")
-    print(f"    ║{Fore.WHITE}                    GAME COMPLETE!                       {Fore.YELLOW}║")
-    print(f"    ╚═══════════════════════════════════════════════════════════╝{Style.RESET_ALL}\n")
+    lines.append(f"\n{Fore.YELLOW}    ╔═══════════════════════════════════════════════════════════╗")
+    lines.append(f"    ║{Fore.WHITE}                    GAME COMPLETE!                       {Fore.YELLOW}║")
+    lines.append(f"    ╚═══════════════════════════════════════════════════════════╝{Style.RESET_ALL}\n")
 
-    print(f"    {Fore.GREEN}Congratulations, {player.name}!{Style.RESET_ALL}")
-    print(f"    You've defeated the MEGA DRAGON and become the champion!\n")
+    lines.append(f"    {Fore.GREEN}Congratulations, {player.name}!{Style.RESET_ALL}")
+    lines.append(f"    You've defeated the MEGA DRAGON and become the champion!\n")
 
-    print(f"    {Fore.CYAN}Your Final Party:{Style.RESET_ALL}")
+    lines.append(f"    {Fore.CYAN}Your Final Party:{Style.RESET_ALL}")
     for creature in player.party:
-        print(f"      • {colored_text(creature.species_name, creature.get_type())} Lv.{creature.level}")
+        lines.append(f"      • {colored_text(creature.species_name, creature.get_type())} Lv.{creature.level}")
 
-    print(f"\n    {Fore.YELLOW}Thank you for playing ASCII Creatures Adventure!{Style.RESET_ALL}\n")
+    lines.append(f"\n    {Fore.YELLOW}Thank you for playing ASCII Creatures Adventure!{Style.RESET_ALL}\n")
+    render_frame(lines)
 
-    input("    Press Enter to return to main menu...")
+    prompt("    Press Enter to return to main menu...")
 
 
 def confirm_new_game() -> bool:
     """Confirm starting a new game (warns about unsaved progress)"""
-    print(f"\n    {Fore.YELLOW}⚠  Starting a new game will create a fresh save.{Style.RESET_ALL}")
-    choice = input(f"    Continue? (y/n): ").lower()
+    echo(f"\n    {Fore.YELLOW}⚠  Starting a new game will create a fresh save.{Style.RESET_ALL}")
+    choice = prompt(f"    Continue? (y/n): ").lower()
     return choice == 'y'
@@ -1,27 +1,41 @@
 """
 Player module - Player character and party management
 """
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
 from creatures import Creature
+from tracking import Tracked, mark_changed
+from events import to_entry, CreatureAdded, PartyHealed
 
 
-class Player:
+class Player(Tracked):
     """Represents the player character"""
 
+    TRACKED = frozenset({'name', 'x', 'y', 'party', 'storage', 'pokeballs', 'potions'})
+
     def __init__(self, name: str):
         self.name = name
         self.x = 5
         self.y = 5
         self.party: List[Creature] = []
+        self.storage: List[Creature] = []  # Creatures caught with a full party
         self.pokeballs = 5
         self.potions = 3
+        self.events: List[Dict[str, Any]] = []  # Applied since last journaled
+
+    def apply(self, event):
+        """Apply a game event (see events) and log it for the journal"""
+        mark_changed()
+        self.events.append(to_entry(event))
+        return event.apply(self)
+
+    def take_events(self) -> List[Dict[str, Any]]:
+        """The events applied since the last call, as journal entries"""
+        events, self.events = self.events, []
+        return events
 
     def add_creature(self, creature: Creature) -> bool:
-        """Add a creature to the party (max 6)"""
-        if len(self.party) < 6:
-            self.party.append(creature)
-            return True
-        return False
+        """Add a creature to the party (max 6), or to storage if the party is full"""
+        return self.apply(CreatureAdded(creature))
 
     def get_active_creature(self) -> Optional[Creature]:
         """Get the first alive creature in the party"""
@@ -36,9 +50,7 @@ class Player:
 
     def heal_all(self):
         """Heal all creatures and restore PP"""
-        for creature in self.party:
-            creature.heal()
-            creature.restore_pp()
+        self.apply(PartyHealed())
 
     def __str__(self):
         return f"Trainer {self.name} (Party: {len(self.party)})"
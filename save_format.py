@@ -0,0 +1,423 @@
+"""
+Save formats - JSON and compact binary encodings of save data, with schema migrations
+
+Both formats hold the same save data (the dict built by
+save_system.snapshot_game). The binary format packs numbers with struct and
+lists each species and move name once, with creatures referring to them
+by ID.
+
+Either can be wrapped in a container: a small header with a checksum
+(CRC32 or BLAKE2b) of the body, which may be compressed (zlib or lzma).
+The checksum can be verified without decoding the save. The header also
+carries the details shown in the load menu (player name, timestamp, lead
+level, party size), readable without touching the body.
+
+Convert existing saves: python3 save_format.py --to binary [save names]
+"""
+import json
+import lzma
+import zlib
+import struct
+import hashlib
+from typing import Dict, Any, List, Tuple, Callable, Optional
+
+
+# Current save schema. Older saves are migrated up to it when loaded.
+SAVE_VERSION = "1.4"
+
+BINARY_MAGIC = b"ASAV"
+
+# Header: magic, schema version (major, minor)
+BINARY_HEADER = struct.Struct("<4sBB")
+# Player: x, y, pokeballs, potions
+BINARY_PLAYER = struct.Struct("<iiHH")
+# Creature: species ID, level, current HP, EXP, move count
+BINARY_CREATURE = struct.Struct("<HBHIB")
+# Move: move ID, current PP
+BINARY_MOVE = struct.Struct("<HB")
+# World: seed, then changed tiles (x, y, tile), then flags and (from 1.3)
+# the map file as JSON. Changed tiles are counted in 32 bits from 1.4.
+BINARY_SEED = struct.Struct("<Q")
+BINARY_TILE = struct.Struct("<iiB")
+BINARY_TILE_COUNT = struct.Struct("<I")
+BINARY_COUNT = struct.Struct("<H")
+
+
+# Container around an encoded save: magic, container version, compression,
+# checksum algorithm, stored body length; from version 2 the metadata
+# length. Then the checksum (of the metadata and body), the metadata and
+# the body.
+CONTAINER_MAGIC = b"ASVC"
+CONTAINER_VERSION = 2
+CONTAINER_HEADER = struct.Struct("<4sBBBI")
+CONTAINER_METADATA_LENGTH = struct.Struct("<H")
+# Metadata: lead level, party size, then player name and timestamp
+CONTAINER_METADATA = struct.Struct("<HH")
+
+# Compression methods: ID, compress, decompress
+COMPRESSIONS = {
+    None: (0, lambda data: data, lambda data: data),
+    "zlib": (1, zlib.compress, zlib.decompress),
+    "lzma": (2, lzma.compress, lzma.decompress),
+}
+
+# Checksum algorithms: ID, digest size, digest function
+CHECKSUMS = {
+    "crc32": (1, 4, lambda data: zlib.crc32(data).to_bytes(4, "little")),
+    "blake2b": (2, 16, lambda data: hashlib.blake2b(data, digest_size=16).digest()),
+}
+
+
+class SaveFormatError(ValueError):
+    """A save file that cannot be decoded or migrated"""
+
+
+def _add_storage(data: Dict[str, Any]) -> Dict[str, Any]:
+    """1.0 -> 1.1: creatures caught with a full party go to storage"""
+    data.setdefault('storage', [])
+    return data
+
+
+def _add_world(data: Dict[str, Any]) -> Dict[str, Any]:
+    """1.1 -> 1.2: the world's seed, changed tiles and flags are saved"""
+    data.setdefault('world', {'seed': 0, 'tiles': [], 'flags': {}})
+    return data
+
+
+def _add_map_source(data: Dict[str, Any]) -> Dict[str, Any]:
+    """1.2 -> 1.3: the map file of a world is saved (earlier saves were all on the built-in map)"""
+    data.setdefault('world', {'seed': 0, 'tiles': [], 'flags': {}}).setdefault('map', None)
+    return data
+
+
+def _widen_tile_count(data: Dict[str, Any]) -> Dict[str, Any]:
+    """1.3 -> 1.4: no change to the data (binary saves count changed tiles in 32 bits)"""
+    return data
+
+
+# Each migration takes save data at one version to the next
+MIGRATIONS: Dict[str, Tuple[str, Callable[[Dict[str, Any]], Dict[str, Any]]]] = {
+    "1.0": ("1.1", _add_storage),
+    "1.1": ("1.2", _add_world),
+    "1.2": ("1.3", _add_map_source),
+    "1.3": ("1.4", _widen_tile_count),
+}
+
+
+def migrate(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Bring save data up to the current schema version"""
+    version = data.get('version', "1.0")
+    while version != SAVE_VERSION:
+        if version not in MIGRATIONS:
+            raise SaveFormatError(f"Unsupported save version: {version}")
+        version, upgrade = MIGRATIONS[version]
+        data = upgrade(data)
+        data['version'] = version
+    return data
+
+
+def _parse_version(version: str) -> Tuple[int, int]:
+    major, minor = version.split(".")
+    return int(major), int(minor)
+
+
+def encode_json(data: Dict[str, Any]) -> bytes:
+    """Encode save data as (readable) JSON"""
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _pack_string(text: str) -> bytes:
+    raw = text.encode("utf-8")
+    return BINARY_COUNT.pack(len(raw)) + raw
+
+
+def encode_binary(data: Dict[str, Any]) -> bytes:
+    """Encode save data in the compact binary format"""
+    creatures = data['party'] + data.get('storage', [])
+
+    # Species and move names, each stored once
+    names: Dict[str, int] = {}
+    for creature in creatures:
+        names.setdefault(creature['species_name'], len(names))
+        for move in creature['moves']:
+            names.setdefault(move['name'], len(names))
+
+    out = [
+        BINARY_HEADER.pack(BINARY_MAGIC, *_parse_version(data['version'])),
+        BINARY_PLAYER.pack(data['player_x'], data['player_y'], data['pokeballs'], data['potions']),
+        _pack_string(data['player_name']),
+        _pack_string(data.get('text_speed', "normal")),
+        _pack_string(data.get('timestamp', "")),
+        BINARY_COUNT.pack(len(names)),
+    ]
+    out.extend(_pack_string(name) for name in names)
+
+    for group in (data['party'], data.get('storage', [])):
+        out.append(BINARY_COUNT.pack(len(group)))
+        for creature in group:
+            out.append(BINARY_CREATURE.pack(
+                names[creature['species_name']], creature['level'],
+                creature['current_hp'], creature['exp'], len(creature['moves'])))
+            for move in creature['moves']:
+                out.append(BINARY_MOVE.pack(names[move['name']], move['current_pp']))
+
+    world = data.get('world', {})
+    out.append(BINARY_SEED.pack(world.get('seed', 0)))
+    out.append(BINARY_TILE_COUNT.pack(len(world.get('tiles', []))))
+    out.extend(BINARY_TILE.pack(x, y, ord(tile)) for x, y, tile in world.get('tiles', []))
+    out.append(_pack_string(json.dumps(world.get('flags', {}))))
+    out.append(_pack_string(json.dumps(world.get('map'))))
+
+    return b"".join(out)
+
+
+class _Reader:
+    """Reads struct-packed values from a buffer in order"""
+
+    def __init__(self, payload: bytes):
+        self.payload = payload
+        self.offset = 0
+
+    def unpack(self, layout: struct.Struct) -> tuple:
+        values = layout.unpack_from(self.payload, self.offset)
+        self.offset += layout.size
+        return values
+
+    def count(self) -> int:
+        return self.unpack(BINARY_COUNT)[0]
+
+    def string(self) -> str:
+        length = self.count()
+        raw = self.payload[self.offset:self.offset + length]
+        if len(raw) != length:
+            raise SaveFormatError("Save file is truncated")
+        self.offset += length
+        return raw.decode("utf-8")
+
+
+def decode_binary(payload: bytes) -> Dict[str, Any]:
+    """Decode a binary save (at the schema version it was written with)"""
+    reader = _Reader(payload)
+    try:
+        magic, major, minor = reader.unpack(BINARY_HEADER)
+        if magic != BINARY_MAGIC:
+            raise SaveFormatError("Not a binary save file")
+        version = f"{major}.{minor}"
+
+        x, y, pokeballs, potions = reader.unpack(BINARY_PLAYER)
+        data = {
+            'player_name': reader.string(),
+            'player_x': x,
+            'player_y': y,
+            'pokeballs': pokeballs,
+            'potions': potions,
+            'text_speed': reader.string(),
+            'timestamp': reader.string(),
+            'version': version,
+        }
+        names = [reader.string() for _ in range(reader.count())]
+
+        groups = ['party', 'storage'] if (major, minor) >= (1, 1) else ['party']
+        for group in groups:
+            creatures: List[Dict[str, Any]] = []
+            for _ in range(reader.count()):
+                species_id, level, hp, exp, move_count = reader.unpack(BINARY_CREATURE)
+                moves = []
+                for _ in range(move_count):
+                    move_id, pp = reader.unpack(BINARY_MOVE)
+                    moves.append({'name': names[move_id], 'current_pp': pp})
+                creatures.append({
+                    'species_name': names[species_id],
+                    'level': level,
+                    'current_hp': hp,
+                    'exp': exp,
+                    'moves': moves,
+                })
+            data[group] = creatures
+
+        if (major, minor) >= (1, 2):
+            seed, = reader.unpack(BINARY_SEED)
+            tiles = []
+            tile_count = BINARY_TILE_COUNT if (major, minor) >= (1, 4) else BINARY_COUNT
+            for _ in range(reader.unpack(tile_count)[0]):
+                x, y, tile = reader.unpack(BINARY_TILE)
+                tiles.append([x, y, chr(tile)])
+            data['world'] = {'seed': seed, 'tiles': tiles, 'flags': json.loads(reader.string())}
+            if (major, minor) >= (1, 3):
+                data['world']['map'] = json.loads(reader.string())
+    except (struct.error, IndexError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise SaveFormatError(f"Damaged save file: {e}") from None
+
+    return data
+
+
+# Save formats: encoder and file extension
+SAVE_FORMATS = {
+    "binary": (encode_binary, ".sav"),
+    "json": (encode_json, ".json"),
+}
+
+
+def encode_save(data: Dict[str, Any], save_format: str) -> bytes:
+    """Encode save data in the given format"""
+    return SAVE_FORMATS[save_format][0](data)
+
+
+def encode_metadata(summary: Dict[str, Any]) -> bytes:
+    """Pack the load menu details of a save for its container header"""
+    return (CONTAINER_METADATA.pack(summary['level'], summary['party_size']) +
+            _pack_string(summary['player_name']) + _pack_string(summary['timestamp']))
+
+
+def decode_metadata(metadata: bytes) -> Dict[str, Any]:
+    """Unpack the load menu details from a container header"""
+    reader = _Reader(metadata)
+    try:
+        level, party_size = reader.unpack(CONTAINER_METADATA)
+        return {
+            'player_name': reader.string(),
+            'timestamp': reader.string(),
+            'level': level,
+            'party_size': party_size,
+        }
+    except (struct.error, UnicodeDecodeError) as e:
+        raise SaveFormatError(f"Damaged save header: {e}") from None
+
+
+def wrap_container(payload: bytes, compression: Optional[str], checksum: str,
+                   summary: Dict[str, Any]) -> bytes:
+    """
+    Compress an encoded save and add a header with its checksum and its
+    summary (player_name, timestamp, level, party_size)
+    """
+    compression_id, compress, _ = COMPRESSIONS[compression]
+    checksum_id, _, digest = CHECKSUMS[checksum]
+    metadata = encode_metadata(summary)
+    body = compress(payload)
+    header = (CONTAINER_HEADER.pack(CONTAINER_MAGIC, CONTAINER_VERSION,
+                                    compression_id, checksum_id, len(body)) +
+              CONTAINER_METADATA_LENGTH.pack(len(metadata)))
+    return header + digest(metadata + body) + metadata + body
+
+
+def _checksum_algorithm(checksum_id: int) -> Tuple[int, Callable[[bytes], bytes]]:
+    for algorithm_id, size, digest in CHECKSUMS.values():
+        if algorithm_id == checksum_id:
+            return size, digest
+    raise SaveFormatError(f"Unknown checksum algorithm: {checksum_id}")
+
+
+def _read_container_header(read: Callable[[int], bytes]) -> Tuple[int, int, int, int, bytes, bytes]:
+    """
+    (compression ID, checksum ID, body length, checksum size, stored
+    checksum, metadata) of a container, reading from its start
+    """
+    try:
+        magic, version, compression_id, checksum_id, length = CONTAINER_HEADER.unpack(
+            read(CONTAINER_HEADER.size))
+        if magic != CONTAINER_MAGIC or version not in (1, CONTAINER_VERSION):
+            raise SaveFormatError("Not a save container")
+        metadata_length = 0
+        if version >= 2:
+            metadata_length, = CONTAINER_METADATA_LENGTH.unpack(read(CONTAINER_METADATA_LENGTH.size))
+    except struct.error:
+        raise SaveFormatError("Save file is truncated") from None
+
+    size, _ = _checksum_algorithm(checksum_id)
+    stored = read(size)
+    metadata = read(metadata_length)
+    if len(stored) != size or len(metadata) != metadata_length:
+        raise SaveFormatError("Save file is truncated")
+    return compression_id, checksum_id, length, size, stored, metadata
+
+
+def read_container_metadata(f) -> Optional[Dict[str, Any]]:
+    """
+    The summary in the header of a save file open for binary reading, or
+    None if it is not a container or predates headers. Only the header is
+    read; the checksum is not verified.
+    """
+    if f.read(len(CONTAINER_MAGIC)) != CONTAINER_MAGIC:
+        return None
+    f.seek(-len(CONTAINER_MAGIC), 1)
+    metadata = _read_container_header(f.read)[-1]
+    return decode_metadata(metadata) if metadata else None
+
+
+def _split_container(data: bytes) -> Tuple[int, bytes, bytes, bytes, Callable[[bytes], bytes]]:
+    """(compression ID, stored checksum, metadata, body, digest function) of a container"""
+    offset = 0
+
+    def read(count: int) -> bytes:
+        nonlocal offset
+        chunk = data[offset:offset + count]
+        offset += count
+        return chunk
+
+    compression_id, checksum_id, length, _, stored, metadata = _read_container_header(read)
+    body = data[offset:]
+    if len(body) != length:
+        raise SaveFormatError("Save file is truncated")
+    return compression_id, stored, metadata, body, _checksum_algorithm(checksum_id)[1]
+
+
+def verify_container(data: bytes) -> bool:
+    """Check a container's checksum, without decompressing or decoding it"""
+    try:
+        _, stored, metadata, body, digest = _split_container(data)
+    except SaveFormatError:
+        return False
+    return digest(metadata + body) == stored
+
+
+def unwrap_container(data: bytes) -> bytes:
+    """Verify a container and return the encoded save inside it"""
+    compression_id, stored, metadata, body, digest = _split_container(data)
+    if digest(metadata + body) != stored:
+        raise SaveFormatError("Save file is corrupted (checksum mismatch)")
+
+    for algorithm_id, _, decompress in COMPRESSIONS.values():
+        if algorithm_id == compression_id:
+            try:
+                return decompress(body)
+            except (zlib.error, lzma.LZMAError) as e:
+                raise SaveFormatError(f"Damaged save file: {e}") from None
+    raise SaveFormatError(f"Unknown compression: {compression_id}")
+
+
+def decode_save(payload: bytes) -> Dict[str, Any]:
+    """
+    Decode a save in either format, in a container or not, and migrate it
+    to the current schema
+    """
+    if payload.startswith(CONTAINER_MAGIC):
+        payload = unwrap_container(payload)
+    if payload.startswith(BINARY_MAGIC):
+        data = decode_binary(payload)
+    else:
+        try:
+            data = json.loads(payload)
+        except ValueError as e:
+            raise SaveFormatError(f"Damaged save file: {e}") from None
+    return migrate(data)
+
+
+if __name__ == "__main__":
+    import argparse
+    import save_system
+
+    parser = argparse.ArgumentParser(description="Convert saves between formats")
+    parser.add_argument("names", nargs="*", help="saves to convert (default: all)")
+    parser.add_argument("--to", choices=sorted(SAVE_FORMATS), default="binary",
+                        help="format to convert to")
+    args = parser.parse_args()
+
+    for name in args.names or save_system.list_save_names():
+        before = save_system.find_save_path(name)
+        if before is None:
+            print(f"{name}: no such save")
+            continue
+        size = before.stat().st_size
+        save_system.write_save_data(name, save_system.read_save_file(name), args.to)
+        after = save_system.get_save_path(name, args.to)
+        print(f"{name}: {before.name} ({size} bytes) -> {after.name} ({after.stat().st_size} bytes)")
@@ -0,0 +1,187 @@
+"""
+SQLite save storage - All saves in one database, for many trainers and slots
+
+Saves live in SAVES_DIR/saves.db in WAL mode. Each save is a row in
+players, its creatures are rows in creatures (party and storage alike) and
+party maps party slots to creatures. Listing reads players through its
+timestamp index, loading reads a save's creatures in one indexed query,
+and each save is written in a single transaction.
+
+Copy existing save files into the database: python3 save_sqlite.py import
+"""
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+
+import save_system
+from save_format import migrate
+
+
+DATABASE_NAME = "saves.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    save_name   TEXT PRIMARY KEY,
+    player_name TEXT NOT NULL,
+    player_x    INTEGER NOT NULL,
+    player_y    INTEGER NOT NULL,
+    pokeballs   INTEGER NOT NULL,
+    potions     INTEGER NOT NULL,
+    text_speed  TEXT NOT NULL,
+    timestamp   TEXT NOT NULL,
+    version     TEXT NOT NULL,
+    level       INTEGER NOT NULL,
+    party_size  INTEGER NOT NULL,
+    world       TEXT
+);
+CREATE INDEX IF NOT EXISTS players_by_timestamp ON players (timestamp);
+
+CREATE TABLE IF NOT EXISTS creatures (
+    id           INTEGER PRIMARY KEY,
+    save_name    TEXT NOT NULL REFERENCES players (save_name) ON DELETE CASCADE,
+    species_name TEXT NOT NULL,
+    level        INTEGER NOT NULL,
+    current_hp   INTEGER NOT NULL,
+    exp          INTEGER NOT NULL,
+    moves        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS creatures_by_save ON creatures (save_name);
+
+CREATE TABLE IF NOT EXISTS party (
+    save_name   TEXT NOT NULL REFERENCES players (save_name) ON DELETE CASCADE,
+    slot        INTEGER NOT NULL,
+    creature_id INTEGER NOT NULL REFERENCES creatures (id) ON DELETE CASCADE,
+    PRIMARY KEY (save_name, slot)
+);
+CREATE INDEX IF NOT EXISTS party_by_creature ON party (creature_id);
+"""
+
+# Party creatures in slot order, then storage in the order it was saved
+LOAD_CREATURES = """
+SELECT c.id, c.species_name, c.level, c.current_hp, c.exp, c.moves, p.slot
+FROM creatures c LEFT JOIN party p ON p.creature_id = c.id
+WHERE c.save_name = ?
+ORDER BY p.slot IS NULL, p.slot, c.id
+"""
+
+
+class SQLiteStorage(save_system.SaveStorage):
+    """Saves in a local SQLite database (WAL mode)"""
+
+    def __init__(self, path: Optional[Path] = None):
+        if path is None:
+            save_system.ensure_saves_directory()
+            path = save_system.SAVES_DIR / DATABASE_NAME
+        self.path = Path(path)
+        # Shared by the game thread and the save worker, one at a time
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("PRAGMA foreign_keys=ON")
+        self._db.executescript(SCHEMA)
+
+        # Databases created before worlds were saved
+        columns = [row[1] for row in self._db.execute("PRAGMA table_info(players)")]
+        if 'world' not in columns:
+            self._db.execute("ALTER TABLE players ADD COLUMN world TEXT")
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._db.close()
+
+    def list_saves(self, verify: bool = False) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT save_name, player_name, timestamp, level, party_size "
+                "FROM players ORDER BY timestamp DESC").fetchall()
+        return [{
+            'name': name,
+            'player_name': player_name,
+            'timestamp': timestamp,
+            'level': level,
+            'party_size': party_size,
+            'file_path': self.path,
+            'corrupted': False  # SQLite checks its own pages
+        } for name, player_name, timestamp, level, party_size in rows]
+
+    def exists(self, save_name: str) -> bool:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT 1 FROM players WHERE save_name = ?", (save_name,)).fetchone()
+        return row is not None
+
+    def read(self, save_name: str) -> Dict[str, Any]:
+        with self._lock:
+            player = self._db.execute(
+                "SELECT player_name, player_x, player_y, pokeballs, potions, "
+                "text_speed, timestamp, version, world FROM players WHERE save_name = ?",
+                (save_name,)).fetchone()
+            creatures = self._db.execute(LOAD_CREATURES, (save_name,)).fetchall()
+
+        if player is None:
+            raise FileNotFoundError(f"Save not found: {save_name}")
+
+        keys = ('player_name', 'player_x', 'player_y', 'pokeballs', 'potions',
+                'text_speed', 'timestamp', 'version')
+        data = dict(zip(keys, player))
+        if player[-1] is not None:
+            data['world'] = json.loads(player[-1])
+        data['party'] = []
+        data['storage'] = []
+        for _, species_name, level, current_hp, exp, moves, slot in creatures:
+            group = data['storage'] if slot is None else data['party']
+            group.append({
+                'species_name': species_name,
+                'level': level,
+                'current_hp': current_hp,
+                'exp': exp,
+                'moves': [{'name': name, 'current_pp': pp} for name, pp in json.loads(moves)]
+            })
+        return migrate(data)
+
+    def write(self, save_name: str, save_data: Dict[str, Any]):
+        summary = save_system.summarize_save(save_data)
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM players WHERE save_name = ?", (save_name,))
+            self._db.execute(
+                "INSERT INTO players (save_name, player_name, player_x, player_y, pokeballs, "
+                "potions, text_speed, timestamp, version, level, party_size, world) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (save_name, save_data['player_name'], save_data['player_x'],
+                 save_data['player_y'], save_data['pokeballs'], save_data['potions'],
+                 save_data.get('text_speed', "normal"), save_data['timestamp'],
+                 save_data['version'], summary['level'], summary['party_size'],
+                 json.dumps(save_data['world']) if save_data.get('world') else None))
+
+            for slot, creature in enumerate(save_data['party'] + save_data['storage']):
+                moves = json.dumps([[move['name'], move['current_pp']] for move in creature['moves']])
+                cursor = self._db.execute(
+                    "INSERT INTO creatures (save_name, species_name, level, current_hp, exp, moves) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (save_name, creature['species_name'], creature['level'],
+                     creature['current_hp'], creature['exp'], moves))
+                if slot < len(save_data['party']):
+                    self._db.execute("INSERT INTO party VALUES (?, ?, ?)",
+                                     (save_name, slot, cursor.lastrowid))
+
+    def delete(self, save_name: str) -> bool:
+        with self._lock, self._db:
+            cursor = self._db.execute("DELETE FROM players WHERE save_name = ?", (save_name,))
+        return cursor.rowcount > 0
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manage the SQLite save database")
+    parser.add_argument("command", choices=["import"], help="import: copy save files into the database")
+    args = parser.parse_args()
+
+    storage = SQLiteStorage()
+    for name in save_system.list_save_names():
+        storage.write(name, save_system.read_save_file(name))
+        print(f"{name}: imported into {storage.path}")
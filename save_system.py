@@ -3,121 +3,689 @@ Save/Load system - Persistent game state management
 """
 import json
 import os
+import atexit
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
+from display import echo
+from visuals import get_text_speed, set_text_speed
+from tracking import current_generation
+from journal import Journal
+from world import WorldError
+from events import replay, diff_events, to_entry, is_drift, describe, SettingsChanged, WorldChanged
+from save_format import (SAVE_FORMATS, SAVE_VERSION, SaveFormatError, encode_save, decode_save,
+                         wrap_container, verify_container, read_container_metadata,
+                         CONTAINER_MAGIC, migrate)
 
 
 SAVES_DIR = Path.home() / ".ascii_rpg_saves"
 
+# Where saves are kept: "files" (one per save in SAVES_DIR) or "sqlite"
+# (a database in SAVES_DIR, see save_sqlite)
+SAVE_STORAGE = "files"
+
+# Format new save files are written in ("binary" or "json"); files in either
+# format can be loaded
+SAVE_FORMAT = "binary"
+
+# Save files are wrapped in a container with a checksum ("crc32" or
+# "blake2b"; None writes bare files) and compressed ("zlib", "lzma" or None)
+SAVE_CHECKSUM = "crc32"
+SAVE_COMPRESSION = "zlib"
+
+# Save counters, for monitoring
+SAVE_STATS = {'requested': 0, 'skipped': 0, 'written': 0, 'failed': 0, 'dropped': 0, 'drift': 0}
+
+# Index of save summaries kept next to the saves, so listing them
+# does not mean parsing every file
+MANIFEST_NAME = ".manifest.json"
+MANIFEST_VERSION = 1
+_manifest_lock = threading.Lock()
+
+# Threads used to re-read saves missing from the manifest
+SCAN_WORKERS = 8
+
+# For each save: the state generation and snapshot it holds (or has queued)
+_persisted: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+
+class JournalCursor:
+    """
+    What has been journaled for a save since it was last saved or loaded:
+    the state then, the entries appended since (and any that could not be
+    written yet), and the settings and world they bring it to
+    """
+
+    def __init__(self, generation: int, state: Dict[str, Any], world=None):
+        self.generation = generation
+        self.state = state
+        self.entries: List[Dict[str, Any]] = []
+        self.unwritten: List[Dict[str, Any]] = []
+        self.text_speed = state.get('text_speed')
+        self.world = _world_key(world)
+
+
+def _world_key(world) -> Optional[Tuple[int, Dict[str, Any]]]:
+    """What tells a world changed: its tile revision and its flags"""
+    return None if world is None else (world.revision, dict(world.flags))
+
+
+# For each save: its journal, and what has been journaled since the save
+_journals: Dict[str, Journal] = {}
+_journaled: Dict[str, JournalCursor] = {}
+
 
 def ensure_saves_directory():
     """Create saves directory if it doesn't exist"""
     SAVES_DIR.mkdir(exist_ok=True)
 
 
-def get_save_path(save_name: str) -> Path:
-    """Get the full path for a save file"""
-    return SAVES_DIR / f"{save_name}.json"
+def get_save_path(save_name: str, save_format: Optional[str] = None) -> Path:
+    """Get the full path for a save file (in the current format unless given)"""
+    extension = SAVE_FORMATS[save_format or SAVE_FORMAT][1]
+    return SAVES_DIR / f"{save_name}{extension}"
 
 
-def list_saves() -> List[Dict[str, Any]]:
-    """List all available save files with metadata"""
-    ensure_saves_directory()
+def get_backup_path(save_path: Path) -> Path:
+    """Get the path of the previous generation of a save file"""
+    return save_path.with_name(save_path.name + ".bak")
 
-    saves = []
-    for save_file in SAVES_DIR.glob("*.json"):
+
+def get_journal(save_name: str) -> Journal:
+    """Get the journal of changes made since a save was last written"""
+    if save_name not in _journals:
+        _journals[save_name] = Journal(SAVES_DIR / f"{save_name}.journal")
+    return _journals[save_name]
+
+
+def _candidate_paths(save_name: str) -> List[Path]:
+    """
+    Files a save may be read from, in order: the save in the current
+    format, then in other formats, then their backups
+    """
+    formats = [SAVE_FORMAT] + [name for name in SAVE_FORMATS if name != SAVE_FORMAT]
+    saves = [get_save_path(save_name, save_format) for save_format in formats]
+    return saves + [get_backup_path(path) for path in saves]
+
+
+def find_save_path(save_name: str) -> Optional[Path]:
+    """Get the file a save will be read from, or None if there is none"""
+    for path in _candidate_paths(save_name):
+        if path.exists():
+            return path
+    return None
+
+
+def _fsync_directory(directory: Path):
+    """Make renames inside a directory durable (no-op where unsupported)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_save_file(save_name: str, payload: bytes, save_format: Optional[str] = None):
+    """
+    Write a save file atomically: the data goes to a temp file in the saves
+    directory, is fsynced, and is renamed over the save. The save it
+    replaces (in whichever format) is kept as a backup, so a crash at any
+    point leaves either the new save or the previous one intact.
+    """
+    save_path = get_save_path(save_name, save_format)
+    fd, temp_path = tempfile.mkstemp(prefix=f".{save_name}.", suffix=".tmp", dir=SAVES_DIR)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+
+        for format_name in SAVE_FORMATS:
+            previous = get_save_path(save_name, format_name)
+            if previous.exists():
+                os.replace(previous, get_backup_path(previous))
+        os.replace(temp_path, save_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+    _fsync_directory(SAVES_DIR)
+
+
+def read_save_file(save_name: str) -> Dict[str, Any]:
+    """
+    Read a save in any format, migrated to the current schema. Falls back
+    to the backup if the save is missing or damaged.
+    """
+    error: Exception = FileNotFoundError(f"Save file not found: {save_name}")
+    for path in _candidate_paths(save_name):
+        try:
+            with open(path, 'rb') as f:
+                return decode_save(f.read())
+        except FileNotFoundError:
+            continue
+        except (OSError, SaveFormatError) as e:
+            error = e
+    raise error
+
+
+def get_manifest_path() -> Path:
+    """Get the path of the save manifest (an index of save summaries)"""
+    return SAVES_DIR / MANIFEST_NAME
+
+
+def verify_save_file(path: Path) -> Optional[bool]:
+    """
+    Check a save file's checksum without decoding it. Returns None for
+    files written without one (or that cannot be read at all).
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    if not data.startswith(CONTAINER_MAGIC):
+        return None
+    return verify_container(data)
+
+
+def read_save_metadata(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    The summary in a save file's header (see summarize_save), read
+    without decoding the save. None for files without one.
+    """
+    try:
+        with open(path, 'rb') as f:
+            return read_container_metadata(f)
+    except (OSError, SaveFormatError):
+        return None
+
+
+def list_save_names() -> List[str]:
+    """Names of all saves, including those whose only intact copy is the backup"""
+    names = set()
+    for _, extension in SAVE_FORMATS.values():
+        for suffix in (extension, extension + ".bak"):
+            names.update(path.name[:-len(suffix)] for path in SAVES_DIR.glob(f"*{suffix}"))
+    return sorted(name for name in names if not name.startswith("."))
+
+
+def _stat_save(save_name: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of the file a save is read from, or None if it is gone"""
+    for path in _candidate_paths(save_name):
         try:
-            with open(save_file, 'r') as f:
-                data = json.load(f)
-                saves.append({
-                    'name': save_file.stem,
-                    'player_name': data.get('player_name', 'Unknown'),
-                    'timestamp': data.get('timestamp', 'Unknown'),
-                    'level': data.get('party', [{}])[0].get('level', 1) if data.get('party') else 1,
-                    'party_size': len(data.get('party', [])),
-                    'file_path': save_file
-                })
-        except Exception as e:
-            print(f"Warning: Could not read save file {save_file}: {e}")
+            stat = path.stat()
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
             continue
+    return None
+
+
+def summarize_save(data: Dict[str, Any]) -> Dict[str, Any]:
+    """The details of a save shown in the load menu"""
+    return {
+        'player_name': data.get('player_name', 'Unknown'),
+        'timestamp': data.get('timestamp', 'Unknown'),
+        'level': data.get('party', [{}])[0].get('level', 1) if data.get('party') else 1,
+        'party_size': len(data.get('party', []))
+    }
+
+
+def _load_manifest() -> Dict[str, Dict[str, Any]]:
+    """Read the manifest, treating a missing or damaged one as empty"""
+    try:
+        with open(get_manifest_path(), 'r') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest['saves']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    return {}
+
+
+def _write_manifest(entries: Dict[str, Dict[str, Any]]):
+    """Replace the manifest (it can always be rebuilt, so no fsync)"""
+    fd, temp_path = tempfile.mkstemp(prefix=f"{MANIFEST_NAME}.", suffix=".tmp", dir=SAVES_DIR)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'version': MANIFEST_VERSION, 'saves': entries}, f)
+        os.replace(temp_path, get_manifest_path())
+    except OSError:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+
+def update_manifest(save_name: str, data: Optional[Dict[str, Any]] = None):
+    """Record a save just written (or drop it from the manifest if data is None)"""
+    with _manifest_lock:
+        entries = _load_manifest()
+        stat = _stat_save(save_name) if data is not None else None
+        if stat is None:
+            entries.pop(save_name, None)
+        else:
+            entries[save_name] = {'mtime_ns': stat[0], 'size': stat[1], 'corrupted': False,
+                                  'verified': True, **summarize_save(data)}
+        _write_manifest(entries)
+
+
+def _scan_save(save_name: str, verify: bool = False) -> Tuple[str, Dict[str, Any]]:
+    """
+    Read one save's summary for the manifest, from its header when it has
+    one. Saves without a header are decoded. A save that can't be read at
+    all (or, with verify, fails its checksum) is flagged as corrupted; its
+    details come from the backup if that is intact. 'verified' records
+    whether the checksum was checked for this version of the file.
+    """
+    stat = _stat_save(save_name)
+    path = find_save_path(save_name)
+    summary = read_save_metadata(path)
+    corrupted = verify and verify_save_file(path) is False
+    if summary is None or corrupted:
+        try:
+            summary = summarize_save(read_save_file(save_name))
+        except Exception:
+            summary, corrupted = summarize_save({}), True
+        verify = True
+    return save_name, {'mtime_ns': stat[0], 'size': stat[1], 'corrupted': corrupted,
+                       'verified': verify, **summary}
+
+
+def list_save_files(verify: bool = False) -> List[Dict[str, Any]]:
+    """
+    List all save files with metadata. Details come from the manifest;
+    saves it has no up-to-date entry for (by mtime and size) have their
+    header read again in a thread pool and the manifest is rewritten. With
+    verify, saves whose checksum has not been checked since they last
+    changed are checked too (still without decoding them), and the result
+    is kept in the manifest.
+    """
+    ensure_saves_directory()
+
+    with _manifest_lock:
+        manifest = _load_manifest()
+        names = list_save_names()
+
+        entries = {}
+        stale = []
+        for name in names:
+            entry = manifest.get(name)
+            stat = _stat_save(name)
+            fresh = entry is not None and stat == (entry.get('mtime_ns'), entry.get('size'))
+            if fresh and (entry.get('verified') or entry.get('corrupted') or not verify):
+                entries[name] = entry
+            elif stat is not None:
+                stale.append(name)
+
+        if stale:
+            with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(stale))) as pool:
+                entries.update(pool.map(_scan_save, stale, [verify] * len(stale)))
+
+        if stale or len(entries) != len(manifest):
+            _write_manifest(entries)
+
+    saves = []
+    for name, entry in entries.items():
+        save = {'name': name}
+        save.update({key: entry.get(key, default) for key, default in summarize_save({}).items()})
+        save['file_path'] = find_save_path(name)
+        save['corrupted'] = bool(entry.get('corrupted'))
+        saves.append(save)
 
     # Sort by timestamp, newest first
     saves.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
     return saves
 
 
-def save_game(player, world, save_name: str) -> bool:
+def snapshot_creature(creature) -> Dict[str, Any]:
+    """Capture a creature as plain data"""
+    return creature.saved_state()
+
+
+def snapshot_game(player, world) -> Dict[str, Any]:
     """
-    Save the current game state to a JSON file
-    Returns True if successful, False otherwise
+    Capture the game state as plain data (cheap, done on the game thread)
     """
+    # Create save data
+    return {
+        'player_name': player.name,
+        'player_x': player.x,
+        'player_y': player.y,
+        'pokeballs': player.pokeballs,
+        'potions': player.potions,
+        'party': [snapshot_creature(creature) for creature in player.party],
+        'storage': [snapshot_creature(creature) for creature in player.storage],
+        'world': world.saved_state() if world is not None else None,
+        'text_speed': get_text_speed(),
+        'timestamp': datetime.now().isoformat(),
+        'version': SAVE_VERSION
+    }
+
+
+def write_save_data(save_name: str, save_data: Dict[str, Any], save_format: Optional[str] = None):
+    """Serialize a snapshot and write it to its save file"""
+    save_format = save_format or SAVE_FORMAT
+    payload = encode_save(save_data, save_format)
+    if SAVE_CHECKSUM:
+        payload = wrap_container(payload, SAVE_COMPRESSION, SAVE_CHECKSUM,
+                                 summarize_save(save_data))
     ensure_saves_directory()
+    write_save_file(save_name, payload, save_format)
+    update_manifest(save_name, save_data)
+
+
+def _same_state(a: Dict[str, Any], b: Dict[str, Any]) -> bool:
+    """Whether two snapshots hold the same game state (ignoring when they were taken)"""
+    return {**a, 'timestamp': None} == {**b, 'timestamp': None}
 
+
+def prepare_save(player, world, save_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Snapshot the game for a save, or return None if the save already holds
+    this state: either nothing tracked has changed since it was written, or
+    the state came back to what was written (like walking there and back)
+    """
+    SAVE_STATS['requested'] += 1
+    generation = current_generation()
+    last = _persisted.get(save_name)
+    if last is not None and last[0] == generation:
+        SAVE_STATS['skipped'] += 1
+        return None
+
+    save_data = snapshot_game(player, world)
+    if last is not None and _same_state(last[1], save_data):
+        _persisted[save_name] = (generation, last[1])
+        SAVE_STATS['skipped'] += 1
+        return None
+
+    # Journal what led up to the snapshot, so the history replays to it exactly
+    entries = player.take_events()
+    journaled = _journaled.get(save_name)
+    _persisted[save_name] = (generation, save_data)
+    _journaled[save_name] = JournalCursor(generation, save_data, world)
     try:
-        # Serialize player data
-        party_data = []
-        for creature in player.party:
-            moves_data = []
-            for move in creature.moves:
-                moves_data.append({
-                    'name': move.name,
-                    'current_pp': move.current_pp
-                })
-
-            party_data.append({
-                'species_name': creature.species_name,
-                'level': creature.level,
-                'current_hp': creature.hp,
-                'exp': creature.exp,
-                'moves': moves_data
-            })
-
-        # Create save data
-        save_data = {
-            'player_name': player.name,
-            'player_x': player.x,
-            'player_y': player.y,
-            'pokeballs': player.pokeballs,
-            'potions': player.potions,
-            'party': party_data,
-            'timestamp': datetime.now().isoformat(),
-            'version': '1.0'
-        }
-
-        # Write to file
-        save_path = get_save_path(save_name)
-        with open(save_path, 'w') as f:
-            json.dump(save_data, f, indent=2)
+        ensure_saves_directory()
+        if journaled is not None:
+            _journal_changes(save_name, journaled, entries, save_data)
+        get_journal(save_name).mark_snapshot(save_data['timestamp'], save_data)
+    except OSError as e:
+        echo(f"Warning: Could not write journal: {e}")
+    return save_data
+
+
+def _compact_journal(save_name: str, save_data: Dict[str, Any]):
+    """Move journal entries that a written save already holds to its history"""
+    get_journal(save_name).compact(save_data['timestamp'])
+
 
+def _append_entries(save_name: str, entries: List[Dict[str, Any]]):
+    """Stamp entries with the time and append them to a save's journal"""
+    recorded_at = datetime.now().isoformat()
+    for entry in entries:
+        entry['t'] = recorded_at
+    if entries:
+        get_journal(save_name).append(entries)
+
+
+def _journal_changes(save_name: str, journaled: JournalCursor, entries: List[Dict[str, Any]],
+                     state: Dict[str, Any]):
+    """
+    Journal the events applied since the last journaled action, then
+    events for whatever else the journal is missing to reach `state`:
+    settings and world changes not journaled yet, and drift, which is
+    reported and journaled as a correction
+    """
+    drift = []
+    entries = journaled.unwritten + entries
+    for event in diff_events(replay(journaled.state, journaled.entries + entries), state):
+        entry = to_entry(event)
+        if is_drift(event):
+            entry['drift'] = True
+            drift.append(describe(event))
+        entries.append(entry)
+    if drift:
+        SAVE_STATS['drift'] += len(drift)
+        echo(f"Warning: game state changed without events: {'; '.join(drift)}")
+    _append_entries(save_name, entries)
+
+
+def record_action(player, world=None):
+    """
+    Journal the events applied since the last save or journaled action,
+    and settings and world changes, so a crash between saves loses
+    nothing. Costs the same whatever the size of the party and storage;
+    checking the whole state for drift is left to the next save.
+    """
+    save_name = get_auto_save_name(player.name)
+    entries = player.take_events()
+    generation = current_generation()
+    journaled = _journaled.get(save_name)
+    if journaled is None or journaled.generation == generation:
+        return  # Nothing saved to journal against yet, or nothing changed
+
+    entries = journaled.unwritten + entries
+    text_speed = get_text_speed()
+    if text_speed != journaled.text_speed:
+        entries.append(to_entry(SettingsChanged(text_speed)))
+        journaled.text_speed = text_speed
+    world_key = _world_key(world)
+    if world is not None and world_key != journaled.world:
+        entries.append(to_entry(WorldChanged(world.saved_state())))
+        journaled.world = world_key
+    journaled.generation = generation
+
+    try:
+        _append_entries(save_name, entries)
+    except OSError as e:
+        journaled.unwritten = entries  # Tried again with the next action
+        echo(f"Warning: Could not write journal: {e}")
+        return
+    journaled.entries += entries
+    journaled.unwritten = []
+
+
+def _save_failed(save_name: str):
+    """Forget what a save holds after a failed write, so the next save retries"""
+    SAVE_STATS['failed'] += 1
+    _persisted.pop(save_name, None)
+
+
+def get_save_stats() -> Dict[str, int]:
+    """Save counters and the current state generation, for monitoring"""
+    return dict(SAVE_STATS, generation=current_generation())
+
+
+def save_game(player, world, save_name: str) -> bool:
+    """
+    Save the current game state (skipped if unchanged)
+    Returns True if successful, False otherwise
+    """
+    try:
+        save_data = prepare_save(player, world, save_name)
+        if save_data is not None:
+            get_storage().write(save_name, save_data)
+            SAVE_STATS['written'] += 1
+            _compact_journal(save_name, save_data)
         return True
 
     except Exception as e:
-        print(f"Error saving game: {e}")
+        _save_failed(save_name)
+        echo(f"Error saving game: {e}")
+        return False
+
+
+class SaveWorker(threading.Thread):
+    """
+    Writes saves on a background thread. Each save has a single slot
+    holding its latest snapshot: a newer snapshot replaces one that has
+    not been written yet, so the worker never falls behind the game.
+    """
+
+    def __init__(self):
+        super().__init__(name="save-worker", daemon=True)
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._writing = False
+        self._condition = threading.Condition()
+        self.last_error: Optional[Exception] = None
+
+    def submit(self, save_name: str, save_data: Dict[str, Any]):
+        """Queue a snapshot, replacing any unwritten one for the same save"""
+        with self._condition:
+            if save_name in self._pending:
+                SAVE_STATS['dropped'] += 1
+            self._pending[save_name] = save_data
+            self._condition.notify_all()
+
+    def run(self):
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                save_name = next(iter(self._pending))
+                save_data = self._pending.pop(save_name)
+                self._writing = True
+
+            try:
+                get_storage().write(save_name, save_data)
+                _compact_journal(save_name, save_data)
+                error = None
+            except Exception as e:
+                error = e
+
+            with self._condition:
+                self._writing = False
+                if error is None:
+                    SAVE_STATS['written'] += 1
+                else:
+                    _save_failed(save_name)
+                self.last_error = error
+                self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued snapshot is written
+        Returns True if they all were written successfully
+        """
+        with self._condition:
+            done = self._condition.wait_for(
+                lambda: not self._pending and not self._writing, timeout)
+            return done and self.last_error is None
+
+
+_save_worker: Optional[SaveWorker] = None
+
+
+def get_save_worker() -> SaveWorker:
+    """Get the background save worker, starting it on first use"""
+    global _save_worker
+    if _save_worker is None:
+        _save_worker = SaveWorker()
+        _save_worker.start()
+        atexit.register(_save_worker.flush)
+    return _save_worker
+
+
+def flush_saves() -> bool:
+    """
+    Wait for background saves to reach the disk
+    Returns False if the last one failed
+    """
+    if _save_worker is None:
+        return True
+    if not _save_worker.flush():
+        echo(f"Error saving game: {_save_worker.last_error}")
         return False
+    return True
+
+
+def read_event_log(save_name: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    A save's snapshot and the events journaled since it. The state after
+    any number of them is events.replay(snapshot, entries[:n]).
+    """
+    flush_saves()
+    snapshot = get_storage().read(save_name)
+    return snapshot, get_journal(save_name).entries_since(snapshot['timestamp'])
+
+
+def read_event_history(save_name: str) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    """
+    The state a save's history starts from and every entry since, with
+    snapshot markers where later saves were taken (None if the save has no
+    history). The state after any number of them is history_state(history, n).
+    """
+    flush_saves()
+    entries = get_journal(save_name).history()
+    for index, entry in enumerate(entries):
+        if entry['op'] == 'snapshot' and 'state' in entry:
+            return migrate(entry['state']), entries[index + 1:]
+    return None
+
+
+def history_state(history: Tuple[Dict[str, Any], List[Dict[str, Any]]], count: int) -> Dict[str, Any]:
+    """
+    The state after the first count entries of a history (see
+    read_event_history), replayed from the nearest full state before them
+    """
+    state, entries = history
+    count = min(count, len(entries))
+    start = 0
+    for index in range(count - 1, -1, -1):
+        entry = entries[index]
+        if entry['op'] == 'snapshot' and 'state' in entry:
+            state, start = migrate(entry['state']), index + 1
+            break
+    return replay(state, entries[start:count])
+
+
+def restore_creature(creature_data: Dict[str, Any]):
+    """Rebuild a creature from its saved data"""
+    from creatures import Creature
+
+    return Creature.from_saved_state(
+        species_name=creature_data['species_name'],
+        level=creature_data['level'],
+        current_hp=creature_data['current_hp'],
+        current_exp=creature_data['exp'],
+        moves=[(move['name'], move['current_pp']) for move in creature_data['moves']]
+    )
 
 
 def load_game(save_name: str):
     """
-    Load a game state from a JSON file
+    Load a game state from the active save storage
     Returns (player, world) tuple if successful, (None, None) otherwise
     """
-    save_path = get_save_path(save_name)
+    flush_saves()
 
-    if not save_path.exists():
-        print(f"Save file not found: {save_name}")
+    storage = get_storage()
+    if not storage.exists(save_name):
+        echo(f"Save file not found: {save_name}")
         return None, None
 
     try:
-        # Read save file
-        with open(save_path, 'r') as f:
-            save_data = json.load(f)
+        # Read save data (from a file's backup if the save file is damaged),
+        # then replay changes journaled since it was written
+        save_data = storage.read(save_name)
+        journaled = get_journal(save_name).entries_since(save_data['timestamp'])
+        save_data = replay(save_data, journaled)
 
         # Import required classes
         from player import Player
         from world import GameWorld
-        from creatures import Creature
-        from moves import Move
 
         # Create player
         player = Player(save_data['player_name'])
@@ -125,50 +693,155 @@ def load_game(save_name: str):
         player.y = save_data['player_y']
         player.pokeballs = save_data['pokeballs']
         player.potions = save_data['potions']
+        set_text_speed(save_data.get('text_speed', 'normal'))
+
+        # Restore party and storage
+        player.party = [restore_creature(data) for data in save_data['party']]
+        player.storage = [restore_creature(data) for data in save_data['storage']]
+
+        # Regenerate the world from its seed or map file, with the changes made to it
+        world = GameWorld.from_saved_state(save_data.get('world') or {})
+        if not (0 <= player.x < world.width and 0 <= player.y < world.height):
+            world.close()
+            raise WorldError(f"Player position ({player.x}, {player.y}) is off the map")
+
+        # The save holds exactly this state (unless the journal added to it),
+        # so saving it again can be skipped until something changes
+        state = (current_generation(), snapshot_game(player, world))
+        _journaled[save_name] = JournalCursor(state[0], state[1], world)
+        if journaled:
+            _persisted.pop(save_name, None)
+        else:
+            _persisted[save_name] = state
 
-        # Restore party
-        for creature_data in save_data['party']:
-            creature = Creature(
-                species_name=creature_data['species_name'],
-                level=creature_data['level'],
-                current_hp=creature_data['current_hp'],
-                current_exp=creature_data['exp']
-            )
-
-            # Restore moves with PP
-            creature.moves = []
-            for move_data in creature_data['moves']:
-                move = Move.from_database(move_data['name'])
-                move.current_pp = move_data['current_pp']
-                creature.moves.append(move)
-
-            player.add_creature(creature)
+        return player, world
 
-        # Create world (always the same)
-        world = GameWorld()
+    except SaveFormatError as e:
+        echo(f"Save {save_name} is corrupted and has no intact backup: {e}")
+        return None, None
 
-        return player, world
+    except WorldError as e:
+        echo(f"Save {save_name} cannot be loaded: {e}")
+        return None, None
 
     except Exception as e:
-        print(f"Error loading game: {e}")
+        echo(f"Error loading game: {e}")
         import traceback
         traceback.print_exc()
         return None, None
 
 
-def delete_save(save_name: str) -> bool:
-    """Delete a save file"""
-    save_path = get_save_path(save_name)
+def delete_save_files(save_name: str) -> bool:
+    """Delete a save file and its backup"""
+    paths = [path for path in _candidate_paths(save_name) if path.exists()]
+
+    try:
+        for path in paths:
+            path.unlink()
+    except Exception as e:
+        echo(f"Error deleting save: {e}")
+        return False
+    finally:
+        if paths:
+            update_manifest(save_name)
+
+    return bool(paths)
+
+
+class SaveStorage:
+    """Where saves are kept, and how they are listed, read and written"""
+
+    def list_saves(self, verify: bool = False) -> List[Dict[str, Any]]:
+        """
+        Summaries of all saves (name, player_name, timestamp, level,
+        party_size, corrupted), checking each save's integrity if verify
+        """
+        raise NotImplementedError
+
+    def exists(self, save_name: str) -> bool:
+        """Check whether a save exists"""
+        raise NotImplementedError
+
+    def read(self, save_name: str) -> Dict[str, Any]:
+        """Read a save's data, migrated to the current schema"""
+        raise NotImplementedError
+
+    def write(self, save_name: str, save_data: Dict[str, Any]):
+        """Write a save, replacing any previous one of that name"""
+        raise NotImplementedError
+
+    def delete(self, save_name: str) -> bool:
+        """Delete a save. Returns True if there was one"""
+        raise NotImplementedError
 
-    if save_path.exists():
-        try:
-            save_path.unlink()
-            return True
-        except Exception as e:
-            print(f"Error deleting save: {e}")
-            return False
 
-    return False
+class FileStorage(SaveStorage):
+    """One file per save in SAVES_DIR, written in SAVE_FORMAT"""
+
+    def list_saves(self, verify: bool = False) -> List[Dict[str, Any]]:
+        return list_save_files(verify)
+
+    def exists(self, save_name: str) -> bool:
+        return find_save_path(save_name) is not None
+
+    def read(self, save_name: str) -> Dict[str, Any]:
+        return read_save_file(save_name)
+
+    def write(self, save_name: str, save_data: Dict[str, Any]):
+        write_save_data(save_name, save_data)
+
+    def delete(self, save_name: str) -> bool:
+        return delete_save_files(save_name)
+
+
+def make_storage(kind: str) -> SaveStorage:
+    """Create a save storage backend by name ("files" or "sqlite")"""
+    if kind == "files":
+        return FileStorage()
+    if kind == "sqlite":
+        from save_sqlite import SQLiteStorage
+        return SQLiteStorage()
+    raise ValueError(f"Unknown save storage: {kind}")
+
+
+_storage: Optional[SaveStorage] = None
+
+
+def get_storage() -> SaveStorage:
+    """Get the active save storage (SAVE_STORAGE unless set otherwise)"""
+    global _storage
+    if _storage is None:
+        _storage = make_storage(SAVE_STORAGE)
+    return _storage
+
+
+def set_storage(storage: SaveStorage) -> Optional[SaveStorage]:
+    """Switch the active save storage, returning the previous one"""
+    global _storage
+    flush_saves()
+    _persisted.clear()
+    previous = _storage
+    _storage = storage
+    return previous
+
+
+def list_saves(verify: bool = False) -> List[Dict[str, Any]]:
+    """
+    List all available saves with metadata, newest first. Saves that fail
+    their integrity check are flagged as corrupted; with verify, saves not
+    checked since they last changed are checked now.
+    """
+    flush_saves()
+    return get_storage().list_saves(verify)
+
+
+def delete_save(save_name: str) -> bool:
+    """Delete a save"""
+    flush_saves()
+    _persisted.pop(save_name, None)
+    _journaled.pop(save_name, None)
+    get_journal(save_name).delete()
+    return get_storage().delete(save_name)
 
 
 def get_auto_save_name(player_name: str) -> str:
@@ -180,6 +853,13 @@ def get_auto_save_name(player_name: str) -> str:
 
 
 def auto_save(player, world) -> bool:
-    """Auto-save the game using player's name"""
+    """
+    Auto-save the game using player's name (skipped if unchanged). The
+    state is captured now and written in the background; call flush_saves()
+    to wait for it.
+    """
     save_name = get_auto_save_name(player.name)
-    return save_game(player, world, save_name)
+    save_data = prepare_save(player, world, save_name)
+    if save_data is not None:
+        get_save_worker().submit(save_name, save_data)
+    return True
@@ -0,0 +1,205 @@
+"""
+Scheduler module - Frame clock and keyboard input events for the asyncio game loop
+"""
+import os
+import sys
+import asyncio
+import functools
+from typing import Optional, Callable, Set, Awaitable
+from display import DisplayBackend, get_backend, set_backend
+
+
+# Animations draw on a shared clock at this many seconds per frame
+FRAME_TIME = 1 / 30
+
+
+class FrameScheduler:
+    """
+    Runs animations as tasks on a shared frame clock. Starting a new
+    animation or drawing a frame directly cancels the ones still running,
+    so whatever the player did last is what ends up on screen.
+    """
+
+    def __init__(self, frame_time: float = FRAME_TIME):
+        self.frame_time = frame_time
+        self._tasks: Set[asyncio.Task] = set()
+
+    def start(self, animation: Awaitable) -> asyncio.Task:
+        """Run an animation coroutine, replacing any running animation"""
+        self.cancel()
+        task = asyncio.ensure_future(animation)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def play(self, animation: Awaitable) -> asyncio.Task:
+        """Start an animation and let it draw its first frame right away"""
+        task = self.start(animation)
+        await asyncio.sleep(0)
+        return task
+
+    def cancel(self):
+        """Stop all running animations"""
+        for task in list(self._tasks):
+            task.cancel()
+        self._tasks.clear()
+
+    @property
+    def busy(self) -> bool:
+        """Whether an animation is running"""
+        return bool(self._tasks)
+
+    async def next_frame(self):
+        """Sleep until the start of the next frame"""
+        now = asyncio.get_running_loop().time()
+        await asyncio.sleep(self.frame_time - now % self.frame_time)
+
+    async def hold(self, seconds: float, interrupt: Optional[Callable[[], bool]] = None):
+        """Sleep for whole frames covering the given time, or until interrupt() is true"""
+        for _ in range(max(1, round(seconds / self.frame_time))):
+            if interrupt is not None and interrupt():
+                return
+            await self.next_frame()
+
+
+class InputEvents:
+    """
+    Lines of keyboard input delivered as events. On a POSIX terminal stdin
+    is watched by the event loop itself, so input is picked up while
+    animations run and nothing polls while the game is idle. Elsewhere each
+    line is read on a worker thread; headless backends answer immediately.
+    """
+
+    def __init__(self, scheduler: Optional[FrameScheduler] = None):
+        self.scheduler = scheduler or FrameScheduler()
+        self._lines: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+        self._partial = b""
+        self._fd: Optional[int] = None
+
+        self._backend = get_backend()
+        self._loop = asyncio.get_running_loop()
+        if not self._backend.headless and os.name == "posix" and sys.stdin.isatty():
+            self._fd = sys.stdin.fileno()
+            self.resume()
+
+    @property
+    def watching(self) -> bool:
+        """Whether stdin is watched by the event loop"""
+        return self._fd is not None
+
+    @property
+    def pending(self) -> bool:
+        """Whether a line of input is waiting to be read"""
+        return not self._lines.empty()
+
+    def _on_readable(self):
+        data = os.read(self._fd, 4096)
+        if not data:
+            self._lines.put_nowait(None)
+            self.close()
+            return
+        *lines, self._partial = (self._partial + data).split(b"\n")
+        for line in lines:
+            self._lines.put_nowait(line.decode(errors="replace").rstrip("\r"))
+
+    def pause(self):
+        """Stop watching stdin (so blocking prompts can read it)"""
+        if self._fd is not None:
+            self._loop.remove_reader(self._fd)
+
+    def resume(self):
+        """Start watching stdin again"""
+        if self._fd is not None:
+            self._loop.add_reader(self._fd, self._on_readable)
+
+    def close(self):
+        """Stop watching stdin for good"""
+        self.pause()
+        self._fd = None
+
+    async def next_line(self, prompt: str = "") -> str:
+        """Wait for the next line of input, raising EOFError at end of input"""
+        backend = self._backend
+        if backend.headless:
+            return backend.read_line(prompt)
+        if not self.watching and self._lines.empty():
+            return await self._loop.run_in_executor(None, backend.read_line, prompt)
+
+        backend.write(prompt)
+        line = await self._lines.get()
+        if line is None:
+            raise EOFError("End of input")
+        backend.note_input(line)
+        return line
+
+    async def take_pending(self) -> bool:
+        """Consume a waiting line of input, if there is one (like a keypress)"""
+        if self._lines.empty():
+            return False
+        line = self._lines.get_nowait()
+        if line is None:
+            self._lines.put_nowait(None)  # End of input stays for the next prompt
+            return False
+        self._backend.note_input(line)
+        return True
+
+    async def run_blocking(self, func: Callable, *args):
+        """
+        Run a blocking screen (a battle or menu that prompts for itself) on
+        a worker thread. Its prompts read these input events and its
+        animation pauses are held on the frame clock, so input is picked up
+        on the next frame even mid-animation.
+        """
+        previous = set_backend(LoopBackend(self._backend, self))
+        try:
+            return await self._loop.run_in_executor(None, functools.partial(func, *args))
+        finally:
+            set_backend(previous)
+
+
+class LoopBackend(DisplayBackend):
+    """
+    The display backend of a blocking screen running on a worker thread
+    beside the event loop. Output goes straight to the real backend;
+    prompts, pauses and keypress checks are run on the loop. A pause ends
+    early once a line of input is waiting, and that line answers the next
+    prompt. Headless backends still sleep and answer without the loop.
+    """
+
+    def __init__(self, backend: DisplayBackend, events: InputEvents):
+        self.backend = backend
+        self.events = events
+        self.headless = backend.headless
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.events._loop).result()
+
+    def write(self, text: str):
+        self.backend.write(text)
+
+    def present(self, lines):
+        self.backend.present(lines)
+
+    def clear(self):
+        self.backend.clear()
+
+    def terminal_size(self) -> os.terminal_size:
+        return self.backend.terminal_size()
+
+    def note_input(self, line: str):
+        self.backend.note_input(line)
+
+    def read_line(self, prompt: str = "") -> str:
+        return self._run(self.events.next_line(prompt))
+
+    def sleep(self, seconds: float):
+        if self.headless:
+            self.backend.sleep(seconds)
+            return
+        events = self.events
+        self._run(events.scheduler.hold(seconds, interrupt=lambda: events.pending))
+
+    def key_pressed(self) -> bool:
+        if self.headless or not self.events.watching:
+            return self.backend.key_pressed()
+        return self._run(self.events.take_pending())
@@ -0,0 +1,194 @@
+"""
+Terminal module - Color support detection and the escape sequences for it
+
+The display context is created the first time anything is colored. It
+detects what the terminal supports once (no color, 16 colors, 256 colors
+or truecolor) and precomputes every escape sequence for that mode. Fore,
+Back and Style look colors up in the active context, so the same code
+draws plain text where there is no color. Headless runs never detect
+anything or touch the terminal: they always get the plain context.
+
+Force a color mode: ASCII_RPG_COLORS=none|16|256|truecolor
+"""
+import os
+import sys
+from types import SimpleNamespace
+from typing import Dict, Tuple, Optional
+from display import get_backend
+
+
+COLOR_MODES = ("none", "16", "256", "truecolor")
+
+COLOR_ENV = "ASCII_RPG_COLORS"
+
+# Named colors: 16-color foreground code and the RGB drawn in 256-color
+# and truecolor modes. Background codes are the foreground ones plus 10.
+COLORS: Dict[str, Tuple[int, Tuple[int, int, int]]] = {
+    'BLACK': (30, (0, 0, 0)),
+    'RED': (31, (205, 49, 49)),
+    'GREEN': (32, (13, 188, 121)),
+    'YELLOW': (33, (229, 229, 16)),
+    'BLUE': (34, (36, 114, 200)),
+    'MAGENTA': (35, (188, 63, 188)),
+    'CYAN': (36, (17, 168, 205)),
+    'WHITE': (37, (229, 229, 229)),
+    'LIGHTBLACK_EX': (90, (102, 102, 102)),
+    'LIGHTRED_EX': (91, (241, 76, 76)),
+    'LIGHTGREEN_EX': (92, (35, 209, 139)),
+    'LIGHTYELLOW_EX': (93, (245, 245, 67)),
+    'LIGHTBLUE_EX': (94, (59, 142, 234)),
+    'LIGHTMAGENTA_EX': (95, (214, 112, 214)),
+    'LIGHTCYAN_EX': (96, (41, 184, 219)),
+    'LIGHTWHITE_EX': (97, (255, 255, 255)),
+}
+
+STYLES = {'BRIGHT': 1, 'DIM': 2, 'NORMAL': 22, 'RESET_ALL': 0}
+
+# Channel levels of the 256-color cube
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
+
+def _sgr(*codes) -> str:
+    return "\x1b[" + ";".join(str(code) for code in codes) + "m"
+
+
+def _nearest_level(value: int) -> int:
+    return min(range(len(CUBE_LEVELS)), key=lambda i: abs(CUBE_LEVELS[i] - value))
+
+
+def rgb_to_256(rgb: Tuple[int, int, int]) -> int:
+    """Closest 256-color index to an RGB color (cube or gray ramp)"""
+    r, g, b = (_nearest_level(value) for value in rgb)
+    cube = 16 + 36 * r + 6 * g + b
+    cube_error = sum((CUBE_LEVELS[level] - value) ** 2 for level, value in zip((r, g, b), rgb))
+
+    gray = min(23, max(0, round((sum(rgb) / 3 - 8) / 10)))
+    gray_error = sum((8 + 10 * gray - value) ** 2 for value in rgb)
+    return 232 + gray if gray_error < cube_error else cube
+
+
+def color_sequence(name: str, mode: str, background: bool = False) -> str:
+    """Escape sequence setting a named color in a color mode"""
+    code, rgb = COLORS[name]
+    if mode == "none":
+        return ""
+    if mode == "16":
+        return _sgr(code + 10 if background else code)
+    layer = 48 if background else 38
+    if mode == "256":
+        return _sgr(layer, 5, rgb_to_256(rgb))
+    return _sgr(layer, 2, *rgb)
+
+
+class DisplayContext:
+    """A color mode and the escape sequences precomputed for it"""
+
+    def __init__(self, mode: str):
+        if mode not in COLOR_MODES:
+            raise ValueError(f"Unknown color mode: {mode}")
+        self.mode = mode
+        self.colors = mode != "none"
+
+        plain = not self.colors
+        self.fore = SimpleNamespace(RESET="" if plain else _sgr(39),
+                                    **{name: color_sequence(name, mode) for name in COLORS})
+        self.back = SimpleNamespace(RESET="" if plain else _sgr(49),
+                                    **{name: color_sequence(name, mode, True) for name in COLORS})
+        self.style = SimpleNamespace(**{name: "" if plain else _sgr(code) for name, code in STYLES.items()})
+
+    def __repr__(self) -> str:
+        return f"DisplayContext({self.mode!r})"
+
+
+def detect_color_mode(stream=None, environ=None) -> str:
+    """Color mode an output stream supports, from the environment"""
+    environ = os.environ if environ is None else environ
+    forced = environ.get(COLOR_ENV)
+    if forced in COLOR_MODES:
+        return forced
+    if environ.get("NO_COLOR"):
+        return "none"
+
+    stream = stream or sys.stdout
+    isatty = getattr(stream, 'isatty', None)
+    if isatty is None or not isatty():
+        return "none"
+
+    term = environ.get("TERM", "")
+    if term == "dumb":
+        return "none"
+    if environ.get("COLORTERM", "").lower() in ("truecolor", "24bit") or "WT_SESSION" in environ:
+        return "truecolor"
+    if "256color" in term:
+        return "256"
+    return "16"
+
+
+def _enable_windows_console(mode: str) -> str:
+    """
+    Make the Windows console understand escape sequences (through colorama)
+    and return the mode it can show
+    """
+    try:
+        import colorama
+    except ImportError:
+        # Windows Terminal handles them itself; the old console prints them raw
+        return mode if "WT_SESSION" in os.environ else "none"
+
+    fix_console = getattr(colorama, "just_fix_windows_console", None)
+    if fix_console is not None:
+        fix_console()
+        return mode
+    # Older colorama translates escape sequences itself, 16 colors only
+    colorama.init()
+    return "16"
+
+
+def init_terminal(stream=None) -> str:
+    """Detect the color mode of the terminal and prepare it for that mode"""
+    mode = detect_color_mode(stream)
+    if mode != "none" and os.name == "nt":
+        mode = _enable_windows_console(mode)
+    return mode
+
+
+PLAIN = DisplayContext("none")
+
+_terminal_context: Optional[DisplayContext] = None
+
+
+def get_context() -> DisplayContext:
+    """
+    Get the display context of the active backend: the terminal's is
+    created on first use, headless backends always get the plain one
+    """
+    global _terminal_context
+    backend = get_backend()
+    if backend.headless:
+        return PLAIN
+    if _terminal_context is None:
+        _terminal_context = DisplayContext(init_terminal(getattr(backend, 'stream', None)))
+    return _terminal_context
+
+
+def set_context(context: Optional[DisplayContext]) -> Optional[DisplayContext]:
+    """Replace the terminal's display context (None detects it again), returning the previous one"""
+    global _terminal_context
+    previous = _terminal_context
+    _terminal_context = context
+    return previous
+
+
+class _Palette:
+    """Colors of one kind (fore, back or style) in the active display context"""
+
+    def __init__(self, kind: str):
+        self._kind = kind
+
+    def __getattr__(self, name: str) -> str:
+        return getattr(getattr(get_context(), self._kind), name)
+
+
+Fore = _Palette('fore')
+Back = _Palette('back')
+Style = _Palette('style')
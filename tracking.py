@@ -0,0 +1,36 @@
+"""
+Tracking module - Change tracking for saved game state
+"""
+from typing import FrozenSet
+
+
+# Bumped whenever saved state changes anywhere in the game
+_generation = 0
+
+_MISSING = object()
+
+
+def current_generation() -> int:
+    """Get the current state generation"""
+    return _generation
+
+
+def mark_changed():
+    """Record a change to saved state"""
+    global _generation
+    _generation += 1
+
+
+class Tracked:
+    """
+    Mixin that bumps the state generation when one of the TRACKED
+    attributes is assigned a different value. In-place changes (such as
+    appending to a list) must call mark_changed() themselves.
+    """
+
+    TRACKED: FrozenSet[str] = frozenset()
+
+    def __setattr__(self, name, value):
+        if name in self.TRACKED and self.__dict__.get(name, _MISSING) != value:
+            mark_changed()
+        object.__setattr__(self, name, value)
@@ -1,63 +1,144 @@
 """
 Visual module - Colors, UI elements, and animations
 """
-import time
-import os
-from typing import Optional
-
-try:
-    from colorama import Fore, Back, Style, init
-    init(autoreset=True)
-    COLORAMA_AVAILABLE = True
-except ImportError:
-    COLORAMA_AVAILABLE = False
-    # Fallback - no colors
-    class Fore:
-        RED = BLUE = GREEN = YELLOW = CYAN = MAGENTA = WHITE = BLACK = ""
-        LIGHTRED_EX = LIGHTBLUE_EX = LIGHTGREEN_EX = LIGHTYELLOW_EX = ""
-        LIGHTCYAN_EX = LIGHTMAGENTA_EX = LIGHTWHITE_EX = ""
-
-    class Back:
-        RED = BLUE = GREEN = YELLOW = CYAN = MAGENTA = WHITE = BLACK = ""
-
-    class Style:
-        BRIGHT = DIM = NORMAL = RESET_ALL = ""
-
-
-# Type colors
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, List, Dict, NamedTuple
+from display import (
+    echo, write, pause, present, clear, prompt, key_pressed, split_rows, terminal_size
+)
+from tracking import mark_changed
+
+from terminal import Fore, Style, get_context
+
+
+# Type colors (color names, see terminal.COLORS)
 TYPE_COLORS = {
-    "Fire": Fore.RED,
-    "Water": Fore.BLUE,
-    "Grass": Fore.GREEN,
-    "Electric": Fore.YELLOW,
-    "Rock": Fore.LIGHTBLACK_EX if hasattr(Fore, 'LIGHTBLACK_EX') else Fore.WHITE,
-    "Flying": Fore.CYAN,
-    "Poison": Fore.MAGENTA,
-    "Ice": Fore.LIGHTCYAN_EX if hasattr(Fore, 'LIGHTCYAN_EX') else Fore.CYAN,
-    "Normal": Fore.WHITE,
-    "Dragon": Fore.LIGHTMAGENTA_EX if hasattr(Fore, 'LIGHTMAGENTA_EX') else Fore.MAGENTA,
+    "Fire": "RED",
+    "Water": "BLUE",
+    "Grass": "GREEN",
+    "Electric": "YELLOW",
+    "Rock": "LIGHTBLACK_EX",
+    "Flying": "CYAN",
+    "Poison": "MAGENTA",
+    "Ice": "LIGHTCYAN_EX",
+    "Normal": "WHITE",
+    "Dragon": "LIGHTMAGENTA_EX",
 }
 
 
+def type_color(color_type: Optional[str]) -> str:
+    """Escape sequence of a type's color (empty without colors)"""
+    return getattr(get_context().fore, TYPE_COLORS.get(color_type, "WHITE"))
+
+
+def render_frame(lines: List[str]):
+    """Draw a frame through the active display backend"""
+    present(lines)
+
+
+def emit(text: str):
+    """Write text to the screen as a single write"""
+    write(text)
+
+
+class ScreenBuffer:
+    """Collects screen output in memory so it can be written out in one go"""
+
+    def __init__(self):
+        self._parts: List[str] = []
+
+    def add(self, *values, sep: str = " ", end: str = "\n"):
+        """Append values the way echo() would lay them out"""
+        self._parts.append(sep.join(str(value) for value in values) + end)
+
+    def getvalue(self) -> str:
+        """Get everything buffered so far"""
+        return "".join(self._parts)
+
+    def flush(self):
+        """Write the buffered output with a single write"""
+        if self._parts:
+            emit(self.getvalue())
+            self._parts = []
+
+
 def clear_screen():
     """Clear the terminal screen"""
-    os.system('clear' if os.name != 'nt' else 'cls')
+    clear()
 
 
-def print_slow(text: str, delay: float = 0.03):
-    """Print text with a typewriter effect"""
-    for char in text:
-        print(char, end='', flush=True)
-        time.sleep(delay)
-    print()
+# Text speeds in characters per second (0 prints the whole message at once)
+TEXT_SPEEDS = {
+    "instant": 0,
+    "fast": 120,
+    "normal": 35,
+}
+DEFAULT_TEXT_SPEED = "normal"
+
+# Typewriter text is written in chunks of about this many seconds of text,
+# and never fewer characters than this at once
+TEXT_FRAME_TIME = 0.05
+MIN_TEXT_CHUNK = 3
+
+# One character of typewriter text with the color codes around it, so a
+# chunk never ends inside an escape sequence
+_TEXT_CHARACTER = re.compile(r"(?:\x1b\[[0-9;]*m)*(?:.(?:\x1b\[[0-9;]*m)*|$)", re.S)
+
+_text_speed = DEFAULT_TEXT_SPEED
+
+
+def get_text_speed() -> str:
+    """Get the current text speed setting"""
+    return _text_speed
+
+
+def set_text_speed(speed: str):
+    """Set the text speed (unknown names fall back to the default)"""
+    global _text_speed
+    speed = speed if speed in TEXT_SPEEDS else DEFAULT_TEXT_SPEED
+    if speed != _text_speed:
+        _text_speed = speed
+        mark_changed()  # The setting is saved with the game
+
+
+def cycle_text_speed() -> str:
+    """Switch to the next text speed and return it"""
+    speeds = list(TEXT_SPEEDS)
+    set_text_speed(speeds[(speeds.index(_text_speed) + 1) % len(speeds)])
+    return _text_speed
+
+
+def print_slow(text: str, delay: Optional[float] = None):
+    """
+    Print text with a typewriter effect at the current text speed
+    (or one character per delay seconds). A keypress shows the rest at once.
+    """
+    rate = 1 / delay if delay else TEXT_SPEEDS[_text_speed]
+    if not rate:
+        echo(text)
+        return
+
+    characters = [character for character in _TEXT_CHARACTER.findall(text) if character]
+    chunk = max(MIN_TEXT_CHUNK, round(rate * TEXT_FRAME_TIME))
+    for start in range(0, len(characters), chunk):
+        if key_pressed():
+            echo("".join(characters[start:]))
+            return
+        piece = characters[start:start + chunk]
+        write("".join(piece))
+        pause(len(piece) / rate)
+    echo()
 
 
 def colored_text(text: str, color_type: Optional[str] = None) -> str:
     """Apply color to text based on type"""
-    if not COLORAMA_AVAILABLE or color_type is None:
+    context = get_context()
+    if not context.colors or color_type is None:
         return text
-    color = TYPE_COLORS.get(color_type, Fore.WHITE)
-    return f"{color}{text}{Style.RESET_ALL}"
+    color = getattr(context.fore, TYPE_COLORS.get(color_type, "WHITE"))
+    return f"{color}{text}{context.style.RESET_ALL}"
 
 
 def draw_box(width: int, title: str = "") -> str:
@@ -87,6 +168,38 @@ def draw_box_bottom(width: int) -> str:
     return "╚" + "═" * (width - 2) + "╝"
 
 
+# Bar colors by band: health above 50%, above 20%, and the rest; EXP bars
+BAR_COLORS = {
+    "high": "GREEN",
+    "mid": "YELLOW",
+    "low": "RED",
+    "exp": "CYAN",
+}
+
+
+@lru_cache(maxsize=512)
+def _colored_bar(filled: int, width: int, band: Optional[str], context) -> str:
+    """Build a bar once per (filled cells, width, color band, display context)"""
+    bar = "█" * filled + "░" * (width - filled)
+    if band is None or not context.colors:
+        return bar
+    return f"{getattr(context.fore, BAR_COLORS[band])}{bar}{context.style.RESET_ALL}"
+
+
+def _cached_bar(filled: int, width: int, band: Optional[str]) -> str:
+    """Get a bar from the cache, in the colors of the active display context"""
+    return _colored_bar(filled, width, band, get_context())
+
+
+def _health_band(percentage: float) -> str:
+    """Color band for a health percentage"""
+    if percentage > 0.5:
+        return "high"
+    elif percentage > 0.2:
+        return "mid"
+    return "low"
+
+
 def draw_health_bar(current: int, maximum: int, width: int = 20, show_color: bool = True) -> str:
     """Draw a health bar"""
     if maximum == 0:
@@ -95,20 +208,40 @@ def draw_health_bar(current: int, maximum: int, width: int = 20, show_color: boo
         percentage = current / maximum
 
     filled = int(width * percentage)
-    empty = width - filled
-
-    bar = "█" * filled + "░" * empty
 
     # Color based on health percentage
-    if show_color and COLORAMA_AVAILABLE:
-        if percentage > 0.5:
-            bar = f"{Fore.GREEN}{bar}{Style.RESET_ALL}"
-        elif percentage > 0.2:
-            bar = f"{Fore.YELLOW}{bar}{Style.RESET_ALL}"
-        else:
-            bar = f"{Fore.RED}{bar}{Style.RESET_ALL}"
+    band = _health_band(percentage) if show_color else None
+    return _cached_bar(filled, width, band)
 
-    return bar
+
+def health_bar_frames(start: int, end: int, maximum: int, width: int = 20) -> List[str]:
+    """
+    Bars stepping one cell at a time from start HP to end HP, for drain
+    (or refill) animations. Every frame comes from the bar cache.
+    """
+    if maximum <= 0:
+        return [draw_health_bar(end, maximum, width)]
+
+    first = int(width * start / maximum)
+    last = int(width * end / maximum)
+    step = -1 if last < first else 1
+
+    frames = [draw_health_bar(start, maximum, width)]
+    for filled in range(first + step, last, step):
+        frames.append(_cached_bar(filled, width, _health_band(filled / width)))
+    frames.append(draw_health_bar(end, maximum, width))
+    return frames
+
+
+def animate_health_bar(start: int, end: int, maximum: int, width: int = 20,
+                       label: str = "  HP: ", delay: float = 0.04):
+    """Drain (or refill) a health bar in place, one cell per frame"""
+    frames = health_bar_frames(start, end, maximum, width)
+    for i, bar in enumerate(frames):
+        hp = end if i == len(frames) - 1 else start + (end - start) * i // len(frames)
+        emit(f"\r{label}{bar} {hp}/{maximum}   ")
+        pause(delay)
+    emit("\n")
 
 
 def draw_exp_bar(current: int, needed: int, width: int = 20) -> str:
@@ -119,14 +252,7 @@ def draw_exp_bar(current: int, needed: int, width: int = 20) -> str:
         percentage = min(1.0, current / needed)
 
     filled = int(width * percentage)
-    empty = width - filled
-
-    bar = "█" * filled + "░" * empty
-
-    if COLORAMA_AVAILABLE:
-        bar = f"{Fore.CYAN}{bar}{Style.RESET_ALL}"
-
-    return bar
+    return _cached_bar(filled, width, "exp")
 
 
 def attack_animation(move_name: str, move_type: str):
@@ -142,160 +268,273 @@ def attack_animation(move_name: str, move_type: str):
     ]
 
     for frame in frames:
-        print(colored_text(frame, move_type), end='\r', flush=True)
-        time.sleep(0.08)
-    print(" " * 10)  # Clear the line
+        emit(colored_text(frame, move_type) + "\r")
+        pause(0.08)
+    emit(" " * 10 + "\n")  # Clear the line
+
+
+# Tile mappings for better visuals
+TILE_CHARS = {
+    '#': '▓▓',   # Mountain/wall - solid block
+    '"': '♣♣',   # Grass - clover symbols
+    '~': '≈≈',   # Water - wave symbols
+    '.': '··',   # Path - dots
+    'H': '⌂ ',   # House - house symbol
+    'B': '★ ',   # Boss - star
+    '@': '☺ '    # Player - smiley face
+}
 
+ZONE_DISPLAY_NAMES = {
+    "north_grass": "Northern Meadows",
+    "mid_grass": "Central Plains",
+    "south_grass": "Southern Wilds"
+}
 
-def render_map(world, player_x: int, player_y: int):
-    """Render the enhanced colorized map with beautiful tiles"""
 
-    # Tile mappings for better visuals
-    TILE_CHARS = {
-        '#': '▓▓',   # Mountain/wall - solid block
-        '"': '♣♣',   # Grass - clover symbols
-        '~': '≈≈',   # Water - wave symbols
-        '.': '··',   # Path - dots
-        'H': '⌂ ',   # House - house symbol
-        'B': '★ ',   # Boss - star
-        '@': '☺ '    # Player - smiley face
+@lru_cache(maxsize=None)
+def _tile_glyphs(context):
+    """
+    Precompute the colored glyph for every (tile, parity) pair in a display
+    context. Parity is (x + y) % 2, used for the grass texture and water shimmer.
+    """
+    if not context.colors:
+        glyphs = {(tile, parity): tile + ' ' for tile in '#"~HB' for parity in (0, 1)}
+        return glyphs, '. ', '@ '
+
+    Fore, Style = context.fore, context.style
+    styles = {
+        '#': (Fore.WHITE + Style.BRIGHT, Fore.WHITE + Style.BRIGHT),   # Mountains - white/gray
+        '"': (Fore.GREEN, Fore.LIGHTGREEN_EX),                         # Grass - green texture
+        '~': (Fore.BLUE, Fore.LIGHTBLUE_EX),                           # Water - blue shimmer
+        'H': (Fore.LIGHTRED_EX + Style.BRIGHT,) * 2,                   # Healing House - red
+        'B': (Fore.LIGHTMAGENTA_EX + Style.BRIGHT,) * 2,               # Boss - magenta star
     }
+    glyphs = {}
+    for tile, colors in styles.items():
+        for parity in (0, 1):
+            glyphs[(tile, parity)] = colors[parity] + TILE_CHARS[tile] + Style.RESET_ALL
+
+    # Anything else is drawn as a path - light gray dots
+    path = Fore.WHITE + TILE_CHARS['.'] + Style.RESET_ALL
+    player = Fore.LIGHTYELLOW_EX + Style.BRIGHT + TILE_CHARS['@'] + Style.RESET_ALL
+    return glyphs, path, player
+
+
+def render_map_row(world, y: int, player_x: Optional[int] = None,
+                   start: int = 0, end: Optional[int] = None, context=None) -> str:
+    """Render one bordered map row (columns start..end), with the player at player_x if given"""
+    context = context or get_context()
+    tile_glyphs, path_glyph, player_glyph = _tile_glyphs(context)
+    chrome = _map_chrome(context)
+    tiles = world.get_row(y, start, end)
+    glyphs = [tile_glyphs.get((tile, (x + y) % 2), path_glyph) for x, tile in enumerate(tiles, start)]
+    if player_x is not None:
+        glyphs[player_x - start] = player_glyph
+    return chrome.row_left + "".join(glyphs) + chrome.row_right
+
+
+# Smallest map window drawn, however small the terminal. The rows cover
+# the built-in map's 9, so it is always drawn whole.
+MIN_VIEW_COLUMNS = 8
+MIN_VIEW_ROWS = 9
+
+
+class Camera:
+    """
+    Window of the world drawn around the player, sized to the terminal.
+    The window only scrolls once the player comes within `margin` tiles
+    of its edge, so most steps leave it (and its rows) unchanged.
+    """
+
+    def __init__(self, columns: Optional[int] = None, rows: Optional[int] = None, margin: int = 2):
+        self.columns = columns
+        self.rows = rows
+        self.margin = margin
+        self.left = 0
+        self.top = 0
+
+    def _follow(self, origin: int, size: int, world_size: int, player: int) -> int:
+        """Scroll one axis so the player stays inside the margins"""
+        margin = min(self.margin, (size - 1) // 2)
+        if player < origin + margin:
+            origin = player - margin
+        elif player > origin + size - 1 - margin:
+            origin = player - size + 1 + margin
+        return max(0, min(origin, world_size - size))
+
+    def get_viewport(self, world, player_x: int, player_y: int, chrome_rows: int = 0):
+        """
+        Get (left, top, width, height) of the window to draw.
+        chrome_rows is the number of screen rows used around the map. A map
+        that fits the screen with its chrome is drawn whole; larger ones are
+        cut to what is left of the screen after the chrome.
+        """
+        terminal = terminal_size()
+        columns = self.columns or max(MIN_VIEW_COLUMNS, (terminal.columns - 8) // 2)
+        rows = self.rows
+        if rows is None:
+            rows = max(MIN_VIEW_ROWS, terminal.lines - chrome_rows)
+
+        width = min(world.width, columns)
+        height = min(world.height, rows)
+        self.left = self._follow(self.left, width, world.width, player_x)
+        self.top = self._follow(self.top, height, world.height, player_y)
+        return self.left, self.top, width, height
+
+
+class MapRowCache:
+    """
+    Rendered map rows, re-rendered only when the player or the window moves
+    over them, or when tiles or the display context change
+    """
+
+    def __init__(self, max_rows: int = 256):
+        self.max_rows = max_rows
+        self._world = None
+        self._revision = None
+        self._context = None
+        self._rows = OrderedDict()  # y -> ((start, end, player column or None), rendered row)
+
+    def invalidate(self):
+        """Drop every cached row"""
+        self._world = None
+        self._revision = None
+        self._context = None
+        self._rows = OrderedDict()
+
+    def get_rows(self, world, player_x: int, player_y: int,
+                 left: int = 0, top: int = 0,
+                 width: Optional[int] = None, height: Optional[int] = None) -> List[str]:
+        """Get the rendered rows of a window of the world with the player drawn in"""
+        revision = world.revision
+        context = get_context()
+        if world is not self._world or revision != self._revision or context is not self._context:
+            self.invalidate()
+            self._world = world
+            self._revision = revision
+            self._context = context
+
+        width = world.width if width is None else width
+        height = world.height if height is None else height
+
+        rows = []
+        for y in range(top, top + height):
+            key = (left, left + width, player_x if y == player_y else None)
+            cached = self._rows.get(y)
+            if cached is None or cached[0] != key:
+                cached = (key, render_map_row(world, y, key[2], key[0], key[1], context))
+                self._rows[y] = cached
+            self._rows.move_to_end(y)
+            rows.append(cached[1])
+
+        # Keep rows scrolled out of view around for a while, up to max_rows
+        while len(self._rows) > self.max_rows:
+            self._rows.popitem(last=False)
+        return rows
+
+
+_map_rows = MapRowCache()
+_camera = Camera()
+
+class MapChrome(NamedTuple):
+    """Static parts of the map screen in one display context"""
+    row_left: str
+    row_right: str
+    header_top: List[str]
+    header_bottom: List[str]
+    bottom_border: str
+    tile_descriptions: Dict[str, str]  # Environmental description based on current tile
+    legend: List[str]
+
+
+@lru_cache(maxsize=None)
+def _map_chrome(context) -> MapChrome:
+    """Build the static parts of the map screen once per display context"""
+    Fore, Style = context.fore, context.style
 
+    # Enhanced legend with colors and symbols
+    if context.colors:
+        legend = [
+            "\n    " + Fore.YELLOW + "╔═══════════════════════════════════════════════════╗",
+            "    ║" + Fore.WHITE + Style.BRIGHT + "                    LEGEND                         " + Fore.YELLOW + "║",
+            "    ╠═══════════════════════════════════════════════════╣" + Style.RESET_ALL,
+            f"    {Fore.YELLOW}║{Style.RESET_ALL} {Fore.LIGHTYELLOW_EX}☺{Style.RESET_ALL} = You (Trainer)      " +
+            f"{Fore.WHITE}{Style.BRIGHT}▓▓{Style.RESET_ALL} = Mountains      " +
+            f"{Fore.GREEN}♣♣{Style.RESET_ALL} = Wild Grass {Fore.YELLOW}║",
+            f"    {Fore.YELLOW}║{Style.RESET_ALL} {Fore.WHITE}··{Style.RESET_ALL} = Safe Path       " +
+            f"{Fore.BLUE}≈≈{Style.RESET_ALL} = Water Lake     " +
+            f"{Fore.LIGHTRED_EX}⌂{Style.RESET_ALL}  = Healing House {Fore.YELLOW}║",
+            f"    {Fore.YELLOW}║{Style.RESET_ALL} {Fore.LIGHTMAGENTA_EX}★{Style.RESET_ALL}  = Boss Arena (!)                                {Fore.YELLOW}║",
+            "    ╚═══════════════════════════════════════════════════╝" + Style.RESET_ALL,
+            # Helpful hint
+            f"\n    {Fore.CYAN}» TIP: {Fore.WHITE}Walk into {Fore.GREEN}grass ♣♣{Fore.WHITE} to encounter wild creatures!{Style.RESET_ALL}",
+        ]
+    else:
+        legend = [
+            "\n    Legend:",
+            "    @ = You  # = Wall  \" = Grass  . = Path  ~ = Water  H = House  B = Boss",
+        ]
+
+    return MapChrome(
+        row_left=Fore.YELLOW + "    ║ " + Style.RESET_ALL,
+        row_right=Fore.YELLOW + " ║" + Style.RESET_ALL,
+        header_top=[
+            "\n" + Fore.YELLOW + "    ╔═══════════════════════════════════════════════════╗",
+            "    ║" + Fore.WHITE + Style.BRIGHT + "              ⚔  CREATURE WORLD MAP  ⚔             " + Fore.YELLOW + "║",
+            f"    ║  {Fore.CYAN}☀ N{Style.RESET_ALL}                                              " + Fore.YELLOW + "║",
+        ],
+        header_bottom=[
+            f"    ║  {Fore.CYAN}☽ S{Style.RESET_ALL}                                              " + Fore.YELLOW + "║",
+            "    ╠═══════════════════════════════════════════════════╣" + Style.RESET_ALL,
+        ],
+        bottom_border=Fore.YELLOW + "    ╚═══════════════════════════════════════════════════╝" + Style.RESET_ALL,
+        tile_descriptions={
+            '"': f"\n    {Fore.GREEN}♣ You're in tall grass - Wild creatures lurk here!{Style.RESET_ALL}",
+            '.': f"\n    {Fore.WHITE}· You're on a safe path.{Style.RESET_ALL}",
+            'H': f"\n    {Fore.LIGHTRED_EX}⌂ You're at the Healing House - Your creatures feel refreshed!{Style.RESET_ALL}",
+            'B': f"\n    {Fore.LIGHTMAGENTA_EX}★ The Boss Chamber! A powerful presence awaits...{Style.RESET_ALL}",
+            '~': f"\n    {Fore.BLUE}≈ You can't swim here!{Style.RESET_ALL}",
+            '#': f"\n    {Fore.WHITE}▓ Mountains block your path.{Style.RESET_ALL}"
+        },
+        legend=legend,
+    )
+
+
+def render_map(world, player_x: int, player_y: int, footer: Optional[List[str]] = None):
+    """Render the enhanced colorized map with beautiful tiles"""
     # Get current zone and tile info
-    zone = world.get_zone(player_x, player_y)
+    zone_display = ZONE_DISPLAY_NAMES.get(world.get_zone(player_x, player_y), "Unknown Region")
     current_tile = world.get_tile(player_x, player_y)
+    context = get_context()
+    chrome = _map_chrome(context)
+    Fore, Style = context.fore, context.style
 
-    zone_names = {
-        "north_grass": "Northern Meadows",
-        "mid_grass": "Central Plains",
-        "south_grass": "Southern Wilds"
-    }
-    zone_display = zone_names.get(zone, "Unknown Region")
-
-    # Decorative border with compass
-    print("\n" + Fore.YELLOW + "    ╔═══════════════════════════════════════════════════╗")
-    print("    ║" + Fore.WHITE + Style.BRIGHT + "              ⚔  CREATURE WORLD MAP  ⚔             " + Fore.YELLOW + "║")
-
-    # Add mini compass and coordinates
-    compass = f"    ║  {Fore.CYAN}☀ N{Style.RESET_ALL}                                              " + Fore.YELLOW + "║"
+    # Coordinates line between the mini compass rows
     coords = f"    ║ {Fore.CYAN}W ╬ E{Style.RESET_ALL}  {Fore.WHITE}Position: ({player_x}, {player_y})  " + \
              f"Zone: {Fore.GREEN}{zone_display}{Style.RESET_ALL}".ljust(50) + Fore.YELLOW + "║"
-    compass2 = f"    ║  {Fore.CYAN}☽ S{Style.RESET_ALL}                                              " + Fore.YELLOW + "║"
-
-    print(compass)
-    print(coords)
-    print(compass2)
-    print("    ╠═══════════════════════════════════════════════════╣" + Style.RESET_ALL)
-
-    # Render map with enhanced tiles
-    for y in range(world.height):
-        row = Fore.YELLOW + "    ║ " + Style.RESET_ALL
-
-        for x in range(world.width):
-            tile = world.map[y][x]
-
-            if x == player_x and y == player_y:
-                # Player character - bright yellow with animation effect
-                if COLORAMA_AVAILABLE:
-                    char = Fore.LIGHTYELLOW_EX + Style.BRIGHT + TILE_CHARS.get('@', '@ ') + Style.RESET_ALL
-                else:
-                    char = '@ '
-            else:
-                # Regular tiles with colors
-                if tile == '#':
-                    # Mountains - white/gray
-                    if COLORAMA_AVAILABLE:
-                        char = Fore.WHITE + Style.BRIGHT + TILE_CHARS['#'] + Style.RESET_ALL
-                    else:
-                        char = '# '
-                elif tile == '"':
-                    # Grass - green with variations
-                    if COLORAMA_AVAILABLE:
-                        # Alternate between darker and lighter green for texture
-                        if (x + y) % 2 == 0:
-                            char = Fore.GREEN + TILE_CHARS['"'] + Style.RESET_ALL
-                        else:
-                            char = Fore.LIGHTGREEN_EX + TILE_CHARS['"'] + Style.RESET_ALL
-                    else:
-                        char = '" '
-                elif tile == '~':
-                    # Water - blue with wave effect
-                    if COLORAMA_AVAILABLE:
-                        # Alternate between colors for water shimmer
-                        if (x + y) % 2 == 0:
-                            char = Fore.BLUE + TILE_CHARS['~'] + Style.RESET_ALL
-                        else:
-                            char = Fore.LIGHTBLUE_EX + TILE_CHARS['~'] + Style.RESET_ALL
-                    else:
-                        char = '~ '
-                elif tile == 'H':
-                    # Healing House - red
-                    if COLORAMA_AVAILABLE:
-                        char = Fore.LIGHTRED_EX + Style.BRIGHT + TILE_CHARS['H'] + Style.RESET_ALL
-                    else:
-                        char = 'H '
-                elif tile == 'B':
-                    # Boss - magenta/purple with star
-                    if COLORAMA_AVAILABLE:
-                        char = Fore.LIGHTMAGENTA_EX + Style.BRIGHT + TILE_CHARS['B'] + Style.RESET_ALL
-                    else:
-                        char = 'B '
-                else:
-                    # Path - light gray dots
-                    if COLORAMA_AVAILABLE:
-                        char = Fore.WHITE + TILE_CHARS['.'] + Style.RESET_ALL
-                    else:
-                        char = '. '
-
-            row += char
-
-        row += Fore.YELLOW + " ║" + Style.RESET_ALL
-        print(row)
-
-    # Bottom border
-    print(Fore.YELLOW + "    ╚═══════════════════════════════════════════════════╝" + Style.RESET_ALL)
-
-    # Environmental description based on current tile
-    tile_descriptions = {
-        '"': f"{Fore.GREEN}♣ You're in tall grass - Wild creatures lurk here!{Style.RESET_ALL}",
-        '.': f"{Fore.WHITE}· You're on a safe path.{Style.RESET_ALL}",
-        'H': f"{Fore.LIGHTRED_EX}⌂ You're at the Healing House - Your creatures feel refreshed!{Style.RESET_ALL}",
-        'B': f"{Fore.LIGHTMAGENTA_EX}★ The Boss Chamber! A powerful presence awaits...{Style.RESET_ALL}",
-        '~': f"{Fore.BLUE}≈ You can't swim here!{Style.RESET_ALL}",
-        '#': f"{Fore.WHITE}▓ Mountains block your path.{Style.RESET_ALL}"
-    }
 
-    environment_msg = tile_descriptions.get(current_tile, "")
+    below = [chrome.bottom_border]
+    environment_msg = chrome.tile_descriptions.get(current_tile)
     if environment_msg:
-        print(f"\n    {environment_msg}")
+        below.append(environment_msg)
+    below += chrome.legend
+    if footer:
+        below += footer
 
-    # Enhanced legend with colors and symbols
-    if COLORAMA_AVAILABLE:
-        print("\n    " + Fore.YELLOW + "╔═══════════════════════════════════════════════════╗")
-        print("    ║" + Fore.WHITE + Style.BRIGHT + "                    LEGEND                         " + Fore.YELLOW + "║")
-        print("    ╠═══════════════════════════════════════════════════╣" + Style.RESET_ALL)
-        print(f"    {Fore.YELLOW}║{Style.RESET_ALL} {Fore.LIGHTYELLOW_EX}☺{Style.RESET_ALL} = You (Trainer)      " +
-              f"{Fore.WHITE}{Style.BRIGHT}▓▓{Style.RESET_ALL} = Mountains      " +
-              f"{Fore.GREEN}♣♣{Style.RESET_ALL} = Wild Grass {Fore.YELLOW}║")
-        print(f"    {Fore.YELLOW}║{Style.RESET_ALL} {Fore.WHITE}··{Style.RESET_ALL} = Safe Path       " +
-              f"{Fore.BLUE}≈≈{Style.RESET_ALL} = Water Lake     " +
-              f"{Fore.LIGHTRED_EX}⌂{Style.RESET_ALL}  = Healing House {Fore.YELLOW}║")
-        print(f"    {Fore.YELLOW}║{Style.RESET_ALL} {Fore.LIGHTMAGENTA_EX}★{Style.RESET_ALL}  = Boss Arena (!)                                {Fore.YELLOW}║")
-        print("    ╚═══════════════════════════════════════════════════╝" + Style.RESET_ALL)
-
-        # Helpful hint
-        print(f"\n    {Fore.CYAN}» TIP: {Fore.WHITE}Walk into {Fore.GREEN}grass ♣♣{Fore.WHITE} to encounter wild creatures!{Style.RESET_ALL}")
-    else:
-        print("\n    Legend:")
-        print("    @ = You  # = Wall  \" = Grass  . = Path  ~ = Water  H = House  B = Boss")
+    # Only the window around the player is drawn; size it to what is left of the terminal
+    above = chrome.header_top + [coords] + chrome.header_bottom
+    chrome_rows = len(split_rows(above)) + len(split_rows(below))
+    left, top, width, height = _camera.get_viewport(world, player_x, player_y, chrome_rows)
+
+    render_frame(above + _map_rows.get_rows(world, player_x, player_y, left, top, width, height) + below)
 
 
 def print_type_effectiveness(multiplier: float):
     """Print type effectiveness message"""
     if multiplier > 1.0:
-        print(colored_text("It's super effective!", "Fire"))
+        echo(colored_text("It's super effective!", "Fire"))
     elif multiplier < 1.0:
-        print(colored_text("It's not very effective...", "Water"))
+        echo(colored_text("It's not very effective...", "Water"))
 
 
 def evolution_animation(old_name: str, new_name: str):
@@ -310,12 +549,9 @@ def evolution_animation(old_name: str, new_name: str):
     ]
 
     clear_screen()
-    print("\n" * 5)
+    emit("\n" * 6)
     for frame in frames:
-        if COLORAMA_AVAILABLE:
-            print(Fore.LIGHTYELLOW_EX + frame.center(50) + Style.RESET_ALL)
-        else:
-            print(frame.center(50))
-        time.sleep(0.8)
-    print("\n" * 5)
-    input("Press Enter to continue...")
+        emit(Fore.LIGHTYELLOW_EX + frame.center(50) + Style.RESET_ALL + "\n")
+        pause(0.8)
+    emit("\n" * 6)
+    prompt("Press Enter to continue...")
@@ -1,14 +1,155 @@
 """
 Game world module - Map and encounter system
+
+A world is its base map, regenerated from the world seed (the built-in map
+is seed 0) or read from a map file, plus a sparse overlay of tiles changed
+during play and a set of flags. Saves hold only the seed or the map file's
+path, size and hash, the overlay and the flags, so they stay the same size
+however large the world is.
 """
+import hashlib
+import mmap
+import os
 import random
-from typing import Tuple, Optional, List
+import struct
+from typing import Tuple, Optional, List, Dict, Any
+from display import echo
+from tracking import mark_changed
+
+
+# Map file layout: header, then one byte per tile, then one byte per zone cell.
+# The header holds a hash of the layers, so a map is identified without
+# reading it all; files written before it (AMAP) are hashed whole.
+MAP_FILE_MAGIC = b'AMP2'
+MAP_FILE_HEADER = struct.Struct('<4sII16s')  # magic, width, height, BLAKE2b of the layers
+LEGACY_MAP_FILE_MAGIC = b'AMAP'
+LEGACY_MAP_FILE_HEADER = struct.Struct('<4sII')
+
+# Zone layer codes (0 = no encounter zone)
+ZONE_NAMES = ["", "north_grass", "mid_grass", "south_grass"]
+ZONE_CODES = {name: code for code, name in enumerate(ZONE_NAMES)}
+
+# Seed of the built-in map, the only map generated from a seed so far
+BUILTIN_SEED = 0
+
+
+class WorldError(ValueError):
+    """A saved world whose base map cannot be rebuilt"""
+
+
+class MappedMapLayers:
+    """Read-only tile and zone layers backed by a memory-mapped map file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            # Read-only shared mapping: pages are loaded on first touch and
+            # shared through the page cache by every process using the file
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        self._digest: Optional[str] = None
+        magic = self._mmap[:4]
+        if magic == MAP_FILE_MAGIC and len(self._mmap) >= MAP_FILE_HEADER.size:
+            _, self.width, self.height, layers_hash = MAP_FILE_HEADER.unpack_from(self._mmap, 0)
+            self._digest = layers_hash.hex()
+            header = MAP_FILE_HEADER
+        elif magic == LEGACY_MAP_FILE_MAGIC and len(self._mmap) >= LEGACY_MAP_FILE_HEADER.size:
+            _, self.width, self.height = LEGACY_MAP_FILE_HEADER.unpack_from(self._mmap, 0)
+            header = LEGACY_MAP_FILE_HEADER
+        else:
+            header = None
+        cells = self.width * self.height if header else 0
+        if header is None or len(self._mmap) < header.size + 2 * cells:
+            self.close()
+            raise ValueError(f"Not a valid map file: {path}")
+
+        self._tiles_offset = header.size
+        self._zones_offset = self._tiles_offset + cells
+
+    def digest(self) -> str:
+        """Hash identifying the map (from the header; legacy files are hashed whole on the first call)"""
+        if self._digest is None:
+            self._digest = hashlib.blake2b(self._mmap, digest_size=16).hexdigest()
+        return self._digest
+
+    def tile(self, x: int, y: int) -> str:
+        """Get the tile character at a position (no bounds check)"""
+        return chr(self._mmap[self._tiles_offset + y * self.width + x])
+
+    def zone(self, x: int, y: int) -> str:
+        """Get the zone name at a position (no bounds check)"""
+        code = self._mmap[self._zones_offset + y * self.width + x]
+        return ZONE_NAMES[code] if code < len(ZONE_NAMES) else ""
+
+    def row(self, y: int, start: int = 0, end: Optional[int] = None) -> str:
+        """Get a row of tiles (columns start..end) as a string"""
+        end = self.width if end is None else min(end, self.width)
+        offset = self._tiles_offset + y * self.width
+        return self._mmap[offset + start:offset + end].decode('ascii')
+
+    def close(self):
+        """Release the mapping and the underlying file"""
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
+
+
+def write_map_file(path: str, tile_rows: List[str], zone_rows: List[List[str]]):
+    """
+    Write tile and zone layers to a map file usable by GameWorld(map_file=...)
+    tile_rows: one string per row, one character per tile
+    zone_rows: one list of zone names per row
+    """
+    height = len(tile_rows)
+    width = len(tile_rows[0]) if height else 0
+    layers_hash = hashlib.blake2b(digest_size=16)
+
+    with open(path, 'wb') as f:
+        f.write(MAP_FILE_HEADER.pack(MAP_FILE_MAGIC, width, height, bytes(16)))
+        for row in tile_rows:
+            if len(row) != width:
+                raise ValueError("All map rows must have the same width")
+            layer = row.encode('ascii')
+            layers_hash.update(layer)
+            f.write(layer)
+        for zones in zone_rows:
+            layer = bytes(ZONE_CODES.get(zone, 0) for zone in zones)
+            layers_hash.update(layer)
+            f.write(layer)
+
+        # The hash is only known once the layers are written
+        f.seek(0)
+        f.write(MAP_FILE_HEADER.pack(MAP_FILE_MAGIC, width, height, layers_hash.digest()))
 
 
 class GameWorld:
     """Represents the game world map"""
 
-    def __init__(self):
+    def __init__(self, map_file: Optional[str] = None, seed: int = BUILTIN_SEED):
+        if map_file is None and seed != BUILTIN_SEED:
+            raise WorldError(f"No base map for world seed {seed}")
+        self.seed = seed
+
+        # Tiles changed during play (row -> column -> tile) and world flags
+        self._overlay: Dict[int, Dict[int, str]] = {}
+        self.flags: Dict[str, Any] = {}
+
+        # Bumped on every tile change, so rendered rows can be dropped
+        self.revision = 0
+
+        # Tile and zone layers live in a memory-mapped file for large worlds
+        self._layers: Optional[MappedMapLayers] = None
+        if map_file is not None:
+            self._layers = MappedMapLayers(map_file)
+            self.map = None
+            self.width = self._layers.width
+            self.height = self._layers.height
+            return
+
         # Map legend:
         # @ = Player
         # # = Wall/Mountain
@@ -35,17 +176,116 @@ class GameWorld:
         """Check if a position is walkable"""
         if x < 0 or x >= self.width or y < 0 or y >= self.height:
             return False
-        tile = self.map[y][x]
+        tile = self.get_tile(x, y)
         return tile not in ['#', '~']
 
+    def get_base_tile(self, x: int, y: int) -> str:
+        """Get the tile at a position as the base map has it (no bounds check)"""
+        if self._layers is not None:
+            return self._layers.tile(x, y)
+        return self.map[y][x]
+
     def get_tile(self, x: int, y: int) -> str:
         """Get the tile at a position"""
         if x < 0 or x >= self.width or y < 0 or y >= self.height:
             return '#'
-        return self.map[y][x]
+        changed = self._overlay.get(y)
+        if changed and x in changed:
+            return changed[x]
+        return self.get_base_tile(x, y)
+
+    def get_row(self, y: int, start: int = 0, end: Optional[int] = None) -> str:
+        """Get a row of tiles (columns start..end, whole row by default) as a string"""
+        if self._layers is not None:
+            row = self._layers.row(y, start, end)
+        else:
+            row = "".join(self.map[y][start:end])
+
+        changed = self._overlay.get(y)
+        if changed:
+            tiles = list(row)
+            stop = start + len(tiles)
+            for x, tile in changed.items():
+                if start <= x < stop:
+                    tiles[x - start] = tile
+            row = "".join(tiles)
+        return row
+
+    def set_tile(self, x: int, y: int, tile: str):
+        """Change a tile (setting it back to the base tile drops the change)"""
+        if x < 0 or x >= self.width or y < 0 or y >= self.height:
+            raise ValueError(f"Position is off the map: ({x}, {y})")
+        if self.get_tile(x, y) == tile:
+            return
+        changed = self._overlay.setdefault(y, {})
+        if tile == self.get_base_tile(x, y):
+            del changed[x]
+            if not changed:
+                del self._overlay[y]
+        else:
+            changed[x] = tile
+        self.revision += 1
+        mark_changed()
+
+    def set_flag(self, name: str, value: Any = True):
+        """Set a world flag (like a defeated boss)"""
+        if self.flags.get(name) != value:
+            self.flags[name] = value
+            mark_changed()
+
+    def get_flag(self, name: str, default: Any = None) -> Any:
+        """Get a world flag"""
+        return self.flags.get(name, default)
+
+    def map_source(self) -> Optional[Dict[str, Any]]:
+        """The map file the base map is read from (path, size and hash), or None for a seeded map"""
+        if self._layers is None:
+            return None
+        return {'file': os.path.abspath(self._layers.path), 'width': self.width,
+                'height': self.height, 'hash': self._layers.digest()}
+
+    def saved_state(self) -> Dict[str, Any]:
+        """The world as plain data: seed, map file, changed tiles [x, y, tile] and flags"""
+        tiles = [[x, y, tile] for y, changed in sorted(self._overlay.items())
+                 for x, tile in sorted(changed.items())]
+        return {'seed': self.seed, 'map': self.map_source(), 'tiles': tiles, 'flags': dict(self.flags)}
+
+    @classmethod
+    def from_saved_state(cls, state: Dict[str, Any], map_file: Optional[str] = None) -> 'GameWorld':
+        """
+        Rebuild a saved world from its seed or map file (or the map_file
+        given instead) and replay its changes. Raises WorldError if that
+        base map is not the one the world was saved on.
+        """
+        source = state.get('map')
+        if map_file is None and source is not None:
+            map_file = source['file']
+        try:
+            world = cls(map_file, seed=state.get('seed', BUILTIN_SEED))
+        except (OSError, ValueError) as e:
+            raise WorldError(f"Cannot rebuild the saved world's map: {e}") from None
+
+        try:
+            if not _same_map(world.map_source(), source):
+                raise WorldError("The saved world was made on a different map")
+            for x, y, tile in state.get('tiles', []):
+                if not (0 <= x < world.width and 0 <= y < world.height):
+                    raise WorldError(f"Changed tile is off the map: ({x}, {y})")
+                if tile != world.get_base_tile(x, y):
+                    world._overlay.setdefault(y, {})[x] = tile
+        except WorldError:
+            world.close()
+            raise
+        world.flags = dict(state.get('flags', {}))
+        return world
 
     def get_zone(self, x: int, y: int) -> str:
         """Get the encounter zone for a position"""
+        if self._layers is not None:
+            if x < 0 or x >= self.width or y < 0 or y >= self.height:
+                return ""
+            return self._layers.zone(x, y)
+
         # Determine zone based on position
         if y <= 3:
             return "north_grass"
@@ -81,22 +321,44 @@ class GameWorld:
 
         return random.choice(creatures), level
 
-    def render(self, player_x: int, player_y: int, use_color: bool = False):
-        """Render the map with the player"""
+    def render(self, player_x: int, player_y: int, use_color: bool = False,
+               footer: Optional[List[str]] = None):
+        """Render the map with the player (footer lines are drawn below it)"""
         if use_color:
             from visuals import render_map
-            render_map(self, player_x, player_y)
+            render_map(self, player_x, player_y, footer)
         else:
-            print("\n" + "="*40)
+            echo("\n" + "="*40)
             for y in range(self.height):
+                tiles = self.get_row(y)
                 row = ""
                 for x in range(self.width):
                     if x == player_x and y == player_y:
                         row += "@ "
                     else:
-                        tile = self.map[y][x]
-                        row += tile + " "
-                print(row)
-            print("="*40)
-            print("\nLegend: @ = You  # = Wall  \" = Grass")
-            print("        . = Path  H = House  B = Boss")
+                        row += tiles[x] + " "
+                echo(row)
+            echo("="*40)
+            echo("\nLegend: @ = You  # = Wall  \" = Grass")
+            echo("        . = Path  H = House  B = Boss")
+            for line in footer or []:
+                echo(line)
+
+    def export_map_file(self, path: str):
+        """Write this world's tile and zone layers to a map file"""
+        tile_rows = [self.get_row(y) for y in range(self.height)]
+        zone_rows = [[self.get_zone(x, y) for x in range(self.width)]
+                     for y in range(self.height)]
+        write_map_file(path, tile_rows, zone_rows)
+
+    def close(self):
+        """Release the memory-mapped layers, if any"""
+        if self._layers is not None:
+            self._layers.close()
+
+
+def _same_map(source: Optional[Dict[str, Any]], saved: Optional[Dict[str, Any]]) -> bool:
+    """Whether two map sources are the same base map (wherever the file now is)"""
+    if source is None or saved is None:
+        return source is saved
+    return all(source[key] == saved.get(key) for key in ('width', 'height', 'hash'))